@@ -8,10 +8,10 @@ from starlette.routing import Mount, Route
 from starlette.staticfiles import StaticFiles
 from tortoise.contrib.starlette import register_tortoise
 
-from bnstats.config import DB_URL, DEBUG, SECRET, SENTRY_URL
+from bnstats.config import DB_URL, DEBUG, SECRET, SENTRY_URL, USE_SCHEDULER
 from bnstats.middlewares.calculator import CalculatorMiddleware
 from bnstats.middlewares.maintenance import MaintenanceMiddleware
-from bnstats.routes import home, qat, score, users
+from bnstats.routes import api, home, qat, score, users
 
 logger = logging.getLogger("bnstats")
 
@@ -23,6 +23,7 @@ routes = [
     Mount("/users", users.router, name="users"),
     Mount("/qat", qat.router, name="qat"),
     Mount("/score", score.router, name="score"),
+    Mount("/api/v1", api.router, name="api"),
     Mount("/static", StaticFiles(directory="bnstats/static")),
 ]
 
@@ -69,8 +70,19 @@ tortoise_config = {
     "timezone": "UTC",
 }
 
+# Shutdown handlers run in order, so stop the jobs before database is closed.
+if USE_SCHEDULER:
+    from bnstats.jobs import create_scheduler
+
+    scheduler = create_scheduler()
+    app.add_event_handler("shutdown", scheduler.stop)
+
 register_tortoise(
     app,
     tortoise_config,
     generate_schemas=True,
 )
+
+if USE_SCHEDULER:
+    logger.info("Setting up scheduler.")
+    app.add_event_handler("startup", scheduler.start)
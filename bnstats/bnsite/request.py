@@ -1,33 +1,288 @@
+import asyncio
 import json
-import os
-from typing import Union
+import logging
+import random
+from collections import Counter
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
 
-import aiofiles
 import httpx
 
+from bnstats.bnsite.response_cache import ResponseCache
 from bnstats.config import INTEROP_PASSWORD, INTEROP_USERNAME, SITE_SESSION
+from bnstats.singleflight import SingleFlight
+
+logger = logging.getLogger("bnstats.bnsite")
 
 INTEROP_HEADERS = {"username": INTEROP_USERNAME, "secret": INTEROP_PASSWORD}
-s: httpx.AsyncClient = httpx.AsyncClient(timeout=60.0, headers=INTEROP_HEADERS, follow_redirects=True)
-s.cookies.set(domain="bn.mappersguild.com", name="connect.sid", value=SITE_SESSION)
+BNSITE_HOST = "bn.mappersguild.com"
+OSU_HOST = "osu.ppy.sh"
 
+# Statuses worth retrying, anything else is reraised immediately.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
-async def get(url, is_json=True, attempts=5) -> Union[dict, str]:
-    current_attempt = 1
-    while current_attempt <= attempts:
-        try:
-            r = await s.get(url)
-        except BaseException as e:
-            current_attempt += 1
+RESPONSE_CACHE_PATH = "cache/responses.sqlite3"
+RESPONSE_CACHE_SIZE = 256 * 1024 * 1024
+# Seconds until cached responses of each kind have to be revalidated. Only
+# beatmapsets that aren't ranked yet are fetched, so check them hourly.
+CACHE_TTLS: Dict[str, Optional[float]] = {
+    "beatmaps": 60 * 60,
+}
+
+
+class TokenBucket:
+    """Rate limiter allowing short bursts.
+
+    Tokens are refilled at a constant rate up to the bucket's capacity, and every
+    request takes one token.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initializes TokenBucket, starting full.
+
+        Args:
+            rate (float): Tokens refilled per second.
+            capacity (int): Maximum tokens, which is the largest burst allowed.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take a token, waiting until one is available."""
+        loop = asyncio.get_event_loop()
+        async with self._lock:
+            self._refill(loop.time())
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill(loop.time())
+            self.tokens -= 1
+
+
+class HostMetrics:
+    """Request statistics of a host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.statuses: Counter = Counter()
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    def to_json(self):
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "average_time": self.average_time,
+            "statuses": dict(self.statuses),
+        }
+
+
+class HostPolicy:
+    """Connection and rate limits of a host."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_connections: int,
+        headers: Optional[Dict[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+    ):
+        """Initializes HostPolicy.
+
+        Args:
+            rate (float): Requests per second.
+            burst (int): Maximum requests sent at once after being idle.
+            max_connections (int): Size of the host's connection pool.
+            headers (Dict[str, str], optional): Headers sent to the host.
+            cookies (Dict[str, str], optional): Cookies sent to the host.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_connections = max_connections
+        self.headers = headers or {}
+        self.cookies = cookies or {}
+
+
+DEFAULT_POLICY = HostPolicy(rate=2, burst=2, max_connections=2)
+POLICIES: Dict[str, HostPolicy] = {
+    BNSITE_HOST: HostPolicy(
+        rate=2,
+        burst=4,
+        max_connections=4,
+        headers=INTEROP_HEADERS,
+        cookies={"connect.sid": SITE_SESSION},
+    ),
+    OSU_HOST: HostPolicy(rate=10, burst=10, max_connections=8),
+}
+
+
+class UpstreamClient:
+    """HTTP client for upstream services.
+
+    Every host gets its own connection pool and token bucket. Rate limited
+    responses, server errors and connection errors are retried with exponential
+    backoff and jitter, and other errors are raised immediately.
+    """
 
-            # Reraise if we already give too many attempts
-            if current_attempt > attempts:
-                raise e
-            continue
+    def __init__(
+        self,
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        timeout: float = 60.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        """Initializes UpstreamClient.
 
-        r.raise_for_status()
-        break
+        Args:
+            policies (Dict[str, HostPolicy], optional): Policies keyed by hostname.
+                Defaults to `POLICIES`, hosts without one use `DEFAULT_POLICY`.
+            timeout (float, optional): Request timeout in seconds. Defaults to 60.
+            backoff_base (float, optional): Seconds to wait before the first retry.
+                Defaults to 1.
+            backoff_max (float, optional): Maximum seconds to wait before a retry.
+                Defaults to 60.
+        """
+        self.policies = POLICIES if policies is None else policies
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
 
+        self.metrics: Dict[str, HostMetrics] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _get_client(self, host: str) -> httpx.AsyncClient:
+        client = self._clients.get(host)
+        if client is None:
+            policy = self.policies.get(host, DEFAULT_POLICY)
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=policy.headers,
+                limits=httpx.Limits(
+                    max_connections=policy.max_connections,
+                    max_keepalive_connections=policy.max_connections,
+                ),
+                follow_redirects=True,
+            )
+            for name, value in policy.cookies.items():
+                client.cookies.set(name, value, domain=host)
+
+            self._clients[host] = client
+            self._buckets[host] = TokenBucket(policy.rate, policy.burst)
+            self.metrics[host] = HostMetrics()
+        return client
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None and "Retry-After" in response.headers:
+            try:
+                return min(self.backoff_max, float(response.headers["Retry-After"]))
+            except ValueError:
+                pass
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        attempts: int = 5,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send a request, retrying on rate limits, server and connection errors.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL to be requested.
+            attempts (int, optional): Maximum number of tries. Defaults to 5.
+            headers (Dict[str, str], optional): Extra headers of the request.
+
+        Returns:
+            httpx.Response: The successful response.
+
+        Raises:
+            httpx.HTTPStatusError: If the response is an error, or still an error
+                after every attempt.
+            httpx.TransportError: If the connection still fails after every attempt.
+        """
+        host = urlsplit(url).hostname or ""
+        client = self._get_client(host)
+        bucket = self._buckets[host]
+        metrics = self.metrics[host]
+        loop = asyncio.get_event_loop()
+
+        attempt = 1
+        while True:
+            await bucket.acquire()
+
+            response: Optional[httpx.Response] = None
+            error: Exception
+            start = loop.time()
+            metrics.requests += 1
+            try:
+                response = await client.request(method, url, headers=headers)
+            except httpx.TransportError as e:
+                logger.warning(f"Request to {host} failed: {e!r}")
+                error = e
+            finally:
+                metrics.total_time += loop.time() - start
+
+            if response is not None:
+                metrics.statuses[response.status_code] += 1
+                if response.status_code not in RETRY_STATUSES:
+                    if response.is_error:
+                        metrics.failures += 1
+                        response.raise_for_status()
+                    return response
+
+                error = httpx.HTTPStatusError(
+                    f"Server responded with {response.status_code}.",
+                    request=response.request,
+                    response=response,
+                )
+
+            if attempt >= attempts:
+                metrics.failures += 1
+                raise error
+
+            metrics.retries += 1
+            attempt += 1
+            # Back off on connection errors too, so an outage isn't hammered.
+            delay = self._backoff(attempt - 1, response)
+            logger.info(f"Retrying request to {host} in {delay:.1f}s.")
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """Close every connection pool."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+
+client = UpstreamClient()
+response_cache = ResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_SIZE)
+# Responses are shared rather than the parsed results, so that every caller gets
+# its own objects to modify.
+_get_flights = SingleFlight()
+
+
+async def get(url, is_json=True, attempts=5) -> Union[dict, str]:
+    r = await _get_flights.do(url, lambda: client.request("GET", url, attempts))
     if is_json:
         _result = r.json()
     else:
@@ -35,21 +290,48 @@ async def get(url, is_json=True, attempts=5) -> Union[dict, str]:
     return _result
 
 
-async def cached_request(url, t, filename, is_json=True) -> Union[dict, str]:
-    filepath = f"cache/{t}/{filename}"
+async def cached_get(
+    url: str, kind: str, key: Optional[str] = None, is_json: bool = True
+) -> Union[dict, str]:
+    """Fetch a URL through the on-disk response cache.
+
+    Fresh responses are returned without any request. Expired ones are revalidated
+    with their ETag or Last-Modified when available, and refetched otherwise.
+
+    Args:
+        url (str): URL to be fetched.
+        kind (str): Kind of the response, which decides its TTL in `CACHE_TTLS`.
+        key (str, optional): Key to store the response under. Defaults to the URL.
+        is_json (bool, optional): Whether to parse the body as JSON. Defaults to True.
 
-    os.makedirs(f"cache/{t}/", exist_ok=True)
-    if os.path.exists(filepath):
-        async with aiofiles.open(filepath) as f:
-            js_text = await f.read()
-            return json.loads(js_text) if is_json else js_text
+    Returns:
+        Union[dict, str]: Body of the response.
+    """
+    key = key or url
+    ttl = CACHE_TTLS[kind]
+    cached = await response_cache.get(key)
 
-    result = await get(url, is_json)
-    if isinstance(result, dict):
-        result_str = json.dumps(result)
+    if cached and not cached.expired:
+        body = cached.body
     else:
-        result_str = result
+        headers = cached.validators if cached else {}
+        r = await _get_flights.do(
+            (url, tuple(headers.items())),
+            lambda: client.request("GET", url, headers=headers),
+        )
+        if cached and r.status_code == 304:
+            logger.debug(f"Revalidated cached response: {key}")
+            await response_cache.refresh(key, ttl)
+            body = cached.body
+        else:
+            body = r.content
+            await response_cache.set(
+                key,
+                body,
+                ttl,
+                r.headers.get("ETag"),
+                r.headers.get("Last-Modified"),
+            )
 
-    async with aiofiles.open(filepath, "w") as f:
-        await f.write(result_str)
-    return result
+    text = body.decode()
+    return json.loads(text) if is_json else text
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, NamedTuple, Optional, TypeVar
+
+logger = logging.getLogger("bnstats.bnsite")
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS response (
+    key TEXT NOT NULL PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    size INT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_response_accessed_at ON response (accessed_at);
+"""
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: Optional[float]
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Headers to revalidate the response with."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk cache of upstream responses, stored in SQLite.
+
+    Database access runs in a dedicated thread so the event loop never blocks on
+    disk. When the stored bodies grow over `max_size`, the least recently used
+    responses are evicted.
+    """
+
+    def __init__(self, path: str, max_size: int):
+        """Initializes ResponseCache. The database is opened on first use.
+
+        Args:
+            path (str): Path of the SQLite database.
+            max_size (int): Maximum total size of stored bodies, in bytes.
+        """
+        self.path = path
+        self.max_size = max_size
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="response-cache")
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def _run(self, func: Callable[[sqlite3.Connection], T]) -> "asyncio.Future[T]":
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor, lambda: func(self._connect()))
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a stored response, expired or not.
+
+        Args:
+            key (str): Key of the response.
+
+        Returns:
+            Optional[CachedResponse]: The response, if stored.
+        """
+
+        def select(db: sqlite3.Connection) -> Optional[CachedResponse]:
+            row = db.execute(
+                "SELECT body, etag, last_modified, expires_at FROM response"
+                " WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row:
+                with db:
+                    db.execute(
+                        "UPDATE response SET accessed_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                return CachedResponse(*row)
+            return None
+
+        return await self._run(select)
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store a response, evicting old responses if needed.
+
+        Args:
+            key (str): Key of the response.
+            body (bytes): Body of the response.
+            ttl (Optional[float]): Seconds until the response has to be revalidated,
+                None to never revalidate.
+            etag (str, optional): ETag of the response.
+            last_modified (str, optional): Last-Modified of the response.
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+
+        def insert(db: sqlite3.Connection):
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, body, etag, last_modified, expires_at, now, len(body)),
+                )
+                self._evict(db)
+
+        await self._run(insert)
+
+    async def refresh(self, key: str, ttl: Optional[float]):
+        """Extend a stored response's expiry after it was revalidated.
+
+        Args:
+            key (str): Key of the response.
+            ttl (Optional[float]): Seconds until the response has to be revalidated
+                again, None to never revalidate.
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+
+        def update(db: sqlite3.Connection):
+            with db:
+                db.execute(
+                    "UPDATE response SET expires_at = ?, accessed_at = ?"
+                    " WHERE key = ?",
+                    (expires_at, now, key),
+                )
+
+        await self._run(update)
+
+    def _evict(self, db: sqlite3.Connection):
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM response").fetchone()
+        if total <= self.max_size:
+            return
+
+        rows = db.execute("SELECT key, size FROM response ORDER BY accessed_at")
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+
+        logger.info(f"Evicting {len(evicted)} cached responses.")
+        db.executemany("DELETE FROM response WHERE key = ?", evicted)
+
+    async def close(self):
+        """Close the database."""
+        if self._db is not None:
+            await self._run(lambda db: db.close())
+            self._db = None
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Set
+
+from aiocache import Cache
+from aiocache.base import BaseCache
+from aiocache.serializers import PickleSerializer
+from starlette.config import Config
+
+from bnstats.singleflight import SingleFlight
+
+logger = logging.getLogger("bnstats.cache")
+
+conf = Config(".env")
+REDIS_URI: str = conf("REDIS_URI", default="") or "memory://"
+
+# How long an entry is served without being rebuilt.
+FRESH_TTL = 5 * 60
+# How long an entry is kept to be served while it is being rebuilt.
+STALE_TTL = 7 * 24 * 60 * 60
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+def user_entity(user_id: int) -> str:
+    """Entity name of everything shown about a user."""
+    return f"user:{user_id}"
+
+
+def leaderboard_entity(calculator: str) -> str:
+    """Entity name of a calculator's leaderboard, for every mode."""
+    return f"leaderboard:{calculator}"
+
+
+# Entity name of the user list.
+USERS_ENTITY = "users"
+# Entity name of every nomination's score.
+SCORES_ENTITY = "scores"
+
+
+class VersionedCache:
+    """Cache whose entries are invalidated by bumping versions of entities.
+
+    Every entry depends on one or more entities, such as a user or a calculator's
+    leaderboard. Writers bump the version of the entities they change, instead of
+    deleting every key that may contain them.
+
+    Outdated entries, either because an entity was bumped or because they are
+    older than `fresh_ttl`, are still served while they are rebuilt in the
+    background. Only requests without any entry at all wait for the loader. Entries
+    are evicted by the backend after `stale_ttl`.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCache,
+        fresh_ttl: int = FRESH_TTL,
+        stale_ttl: int = STALE_TTL,
+    ):
+        """Initializes VersionedCache.
+
+        Args:
+            backend (BaseCache): aiocache backend to store entries and versions in.
+            fresh_ttl (int, optional): Seconds an entry is served without being
+                rebuilt. Defaults to 5 minutes.
+            stale_ttl (int, optional): Seconds an entry is kept before it is evicted.
+                Defaults to 7 days.
+        """
+        self.backend = backend
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+
+        self._flights = SingleFlight()
+        self._background: Set["asyncio.Future[Any]"] = set()
+
+    async def get_versions(self, entities: Sequence[str]) -> List[int]:
+        """Get current versions of the entities.
+
+        Args:
+            entities (Sequence[str]): Names of the entities.
+
+        Returns:
+            List[int]: Versions of each entity, 0 if it has never been bumped.
+        """
+        if not entities:
+            return []
+        # Versions are written with `increment`, which skips the serializer.
+        versions = await self.backend.multi_get(
+            [f"version:{e}" for e in entities],
+            loads_fn=lambda v: v if v is None else int(v),
+        )
+        return [v or 0 for v in versions]
+
+    async def bump(self, *entities: str):
+        """Invalidate every entry depending on the entities.
+
+        Args:
+            *entities (str): Names of the changed entities.
+        """
+        for entity in entities:
+            await self.backend.increment(f"version:{entity}")
+
+    async def get_or_load(
+        self,
+        key: str,
+        entities: Sequence[str],
+        loader: Loader,
+        fresh_ttl: Optional[int] = None,
+    ) -> Any:
+        """Get an entry, loading it if it is missing or outdated.
+
+        Args:
+            key (str): Key of the entry, which must identify every parameter used
+                by the loader.
+            entities (Sequence[str]): Entities the entry depends on.
+            loader (Loader): Coroutine function building the entry.
+            fresh_ttl (int, optional): Overrides the cache's `fresh_ttl`.
+
+        Returns:
+            Any: The entry, which may be outdated.
+        """
+        versions = await self.get_versions(entities)
+        record = await self.backend.get(f"entry:{key}")
+        if record is None:
+            logger.debug(f"Cache miss: {key}")
+            return await self._load(key, versions, loader, fresh_ttl)
+
+        if record["versions"] != versions or time.time() >= record["fresh_until"]:
+            logger.debug(f"Serving stale entry: {key}")
+            if key not in self._flights:
+                task = asyncio.ensure_future(
+                    self._load(key, versions, loader, fresh_ttl)
+                )
+                self._background.add(task)
+                task.add_done_callback(self._background_done)
+        return record["value"]
+
+    def _background_done(self, task: "asyncio.Future[Any]"):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(
+                "Failed to refresh cache entry.",
+                exc_info=task.exception(),
+            )
+
+    async def _load(
+        self,
+        key: str,
+        versions: List[int],
+        loader: Loader,
+        fresh_ttl: Optional[int],
+    ) -> Any:
+        async def load_and_store() -> Any:
+            value = await loader()
+            ttl = self.fresh_ttl if fresh_ttl is None else fresh_ttl
+            record = {
+                "versions": versions,
+                "value": value,
+                "fresh_until": time.time() + ttl,
+            }
+            await self.backend.set(f"entry:{key}", record, ttl=self.stale_ttl)
+            return value
+
+        # Concurrent loads of the same entry wait for the first one.
+        return await self._flights.do(key, load_and_store)
+
+    async def wait_background(self):
+        """Wait until every background refresh is done."""
+        while self._background:
+            await asyncio.wait(list(self._background))
+
+
+backend: BaseCache = Cache.from_url(REDIS_URI)
+# Pickle keeps types such as `Score` intact, and keeps entries of the memory
+# backend from being modified through references.
+backend.serializer = PickleSerializer()
+
+cache = VersionedCache(backend)
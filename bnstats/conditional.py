@@ -0,0 +1,105 @@
+import functools
+import hashlib
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Sequence
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from bnstats.cache import FRESH_TTL, cache
+
+logger = logging.getLogger("bnstats.conditional")
+
+Endpoint = Callable[[Request], Awaitable[Response]]
+Entities = Callable[[Request], Sequence[str]]
+
+# Proxies may store pages, but must revalidate them before every use. Pages
+# depend on the session's calculator, so they're stored per cookie.
+CACHE_CONTROL = "public, no-cache"
+VARY = "Cookie"
+
+
+async def get_etag(request: Request, entities: Sequence[str]) -> str:
+    """Build a validator of the page, without loading any of its data.
+
+    The validator changes whenever the entities are bumped, the calculator or
+    the query (mode, window) is changed, and at least every `FRESH_TTL` seconds,
+    as pages built from outdated cache entries, or from a window relative to now,
+    may change without any bump.
+
+    Args:
+        request (Request): The request.
+        entities (Sequence[str]): Entities the page depends on, see
+            `VersionedCache`.
+
+    Returns:
+        str: Weak ETag of the page.
+    """
+    versions = await cache.get_versions(entities)
+    parts = [
+        request.url.path,
+        str(sorted(request.query_params.multi_items())),
+        request.scope["calculator"].name,
+        str(dict(zip(entities, versions))),
+        str(int(time.time() // FRESH_TTL)),
+    ]
+    digest = hashlib.sha1("\n".join(parts).encode()).hexdigest()
+    # Weak, as the body may be compressed differently.
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check if an `If-None-Match` header matches the ETag, by weak comparison.
+
+    Args:
+        if_none_match (str, optional): Value of the header.
+        etag (str): ETag of the current page.
+
+    Returns:
+        bool: Whether the client's copy is still valid.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in if_none_match.split(",")}
+
+
+def conditional(entities: Entities) -> Callable[[Endpoint], Endpoint]:
+    """Answer conditional GETs of an endpoint from data versions.
+
+    Successful responses get an ETag. Requests whose `If-None-Match` matches it
+    get `304 Not Modified` before the endpoint is called, so neither the database
+    nor the templates are touched.
+
+    Args:
+        entities (Entities): Function returning the entities the page of a
+            request depends on.
+
+    Returns:
+        Callable[[Endpoint], Endpoint]: Decorator of the endpoint.
+    """
+
+    def decorator(func: Endpoint) -> Endpoint:
+        @functools.wraps(func)
+        async def endpoint(request: Request) -> Response:
+            etag = await get_etag(request, entities(request))
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": VARY}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                logger.debug(f"Not modified: {request.url.path}")
+                return Response(status_code=304, headers=headers)
+
+            response = await func(request)
+            if response.status_code == 200:
+                response.headers.update(headers)
+            return response
+
+        return endpoint
+
+    return decorator
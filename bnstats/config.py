@@ -12,12 +12,11 @@ SITE_SESSION: str = config("BNSITE_SESSION")
 API_KEY: str = config("API_KEY")
 SENTRY_URL: str = config("SENTRY_URL", default="")
 
-REDIS_URI = config("REDIS_URI", default="")
-
 INTEROP_USERNAME: str = config("INTEROP_USERNAME", default="")
 INTEROP_PASSWORD: str = config("INTEROP_PASSWORD", default="")
 USE_INTEROP: bool = bool(INTEROP_USERNAME and INTEROP_PASSWORD)
 USE_AIESS: bool = config("USE_AIESS", cast=bool, default=False)
+USE_SCHEDULER: bool = config("USE_SCHEDULER", cast=bool, default=False)
 
 selected_system = get_system(config("DEFAULT_CALC_SYSTEM"))
 if not selected_system:
@@ -0,0 +1,162 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence
+
+from anyio import from_thread
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from bnstats.cache import FRESH_TTL, VersionedCache
+
+logger = logging.getLogger("bnstats.fragments")
+
+# Total size of fragments a process keeps in the backend, in characters.
+MAX_SIZE = 32 * 1024 * 1024
+
+
+class FragmentCache:
+    """Cache of rendered template fragments, keyed on data versions.
+
+    Fragments are stored in the backend of a `VersionedCache`, under a key built
+    from the fragment's key and the versions of the entities it depends on, so
+    bumping an entity makes every fragment showing it miss. Fragments also expire
+    after `ttl`, bounding how long data changing without a bump is shown.
+
+    Every process evicts the least recently used fragments it stored once their
+    total size exceeds `max_size`.
+    """
+
+    def __init__(
+        self,
+        cache: VersionedCache,
+        max_size: int = MAX_SIZE,
+        ttl: int = FRESH_TTL,
+    ):
+        """Initializes FragmentCache.
+
+        Args:
+            cache (VersionedCache): Cache holding entity versions and its backend.
+            max_size (int, optional): Total size of the stored fragments, in
+                characters. Defaults to 32M.
+            ttl (int, optional): Seconds a fragment is kept. Defaults to 5 minutes.
+        """
+        self.cache = cache
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # Size of every fragment stored by this process, least recently used first.
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+
+    async def make_key(self, key: Any, entities: Sequence[str]) -> str:
+        """Build the backend key of a fragment.
+
+        Args:
+            key (Any): Key of the fragment, which must identify everything it shows
+                besides the entities.
+            entities (Sequence[str]): Entities the fragment depends on.
+
+        Returns:
+            str: Key of the fragment's current version.
+        """
+        versions = await self.cache.get_versions(entities)
+        raw = repr((key, dict(zip(entities, versions))))
+        return f"fragment:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a fragment.
+
+        Args:
+            key (str): Key made by `make_key`.
+
+        Returns:
+            Optional[str]: The rendered fragment, if it is cached.
+        """
+        html = await self.cache.backend.get(key)
+        if html is not None and key in self._sizes:
+            self._sizes.move_to_end(key)
+        return html
+
+    async def set(self, key: str, html: str):
+        """Store a fragment, evicting the least recently used ones if needed.
+
+        Args:
+            key (str): Key made by `make_key`.
+            html (str): The rendered fragment.
+        """
+        if len(html) > self.max_size:
+            return
+
+        await self.cache.backend.set(key, html, ttl=self.ttl)
+        self._size += len(html) - self._sizes.pop(key, 0)
+        self._sizes[key] = len(html)
+
+        while self._size > self.max_size:
+            old_key, size = self._sizes.popitem(last=False)
+            self._size -= size
+            await self.cache.backend.delete(old_key)
+            logger.debug(f"Evicted fragment: {old_key}")
+
+    def render(
+        self, key: Any, entities: Sequence[str], caller: Callable[[], str]
+    ) -> Markup:
+        """Get a fragment, rendering and storing it if it isn't cached.
+
+        The backend is asynchronous, while templates are rendered synchronously,
+        so this only caches templates rendered in a worker thread by
+        `plugins.render`. Elsewhere, fragments are always rendered.
+
+        Args:
+            key (Any): Key of the fragment, see `make_key`.
+            entities (Sequence[str]): Entities the fragment depends on.
+            caller (Callable[[], str]): Renders the fragment.
+
+        Returns:
+            Markup: The rendered fragment.
+        """
+        try:
+            backend_key = from_thread.run(self.make_key, key, entities)
+        except RuntimeError:
+            return Markup(caller())
+
+        html = from_thread.run(self.get, backend_key)
+        if html is None:
+            logger.debug(f"Fragment miss: {key}")
+            html = caller()
+            from_thread.run(self.set, backend_key, html)
+        return Markup(html)
+
+
+class FragmentCacheExtension(Extension):
+    """Caches the rendered body of `{% cache key, entities %}` blocks.
+
+    `key` is any value identifying what the block shows, usually a tuple, and
+    `entities` lists the entities it depends on, see `FragmentCache`::
+
+        {% cache ("nominations", user.osuId), [user_entity(user.osuId)] %}
+        ...
+        {% endcache %}
+
+    The environment's `fragment_cache` attribute must be set to a `FragmentCache`.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        parser.stream.expect("comma")
+        entities = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        call = self.call_method("_render", [key, entities])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(
+        self, key: Any, entities: Sequence[str], caller: Callable[[], str]
+    ) -> Markup:
+        fragment_cache: FragmentCache = self.environment.fragment_cache  # type: ignore
+        return fragment_cache.render(key, entities, caller)
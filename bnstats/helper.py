@@ -1,7 +1,7 @@
 import binascii
 import os
 import time
-from typing import Union, Optional
+from typing import Iterable, List, Optional, Union
 
 MODES = {"osu": 0, "taiko": 1, "catch": 2, "mania": 3}
 
@@ -46,6 +46,36 @@ def mode_to_db(mode_str: str) -> int:
     return MODES[mode_str]
 
 
+def mode_mask(modes: Iterable[int]) -> int:
+    """Convert game modes into a bitmask, as stored in database.
+
+    Args:
+        modes (Iterable[int]): Integer enums of the game modes.
+
+    Returns:
+        int: Bitmask with the bit of every game mode set.
+    """
+    mask = 0
+    for mode in modes:
+        mask |= 1 << mode
+    return mask
+
+
+def masks_with_mode(mode: int) -> List[int]:
+    """Get every bitmask containing the game mode.
+
+    Filtering with these values, rather than a bitwise operation, lets the
+    database use an index on the bitmask.
+
+    Args:
+        mode (int): Integer enum of the game mode.
+
+    Returns:
+        List[int]: Bitmasks containing the game mode.
+    """
+    return [mask for mask in range(1 << len(MODES)) if mask & (1 << mode)]
+
+
 def ensure_int(string: Union[str, int]) -> Optional[int]:
     day_limit = None
 
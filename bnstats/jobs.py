@@ -0,0 +1,57 @@
+import logging
+
+from bnstats.cache import cache
+from bnstats.routes.score import warm_leaderboard_cache
+from bnstats.routes.users import warm_listing_cache
+from bnstats.routine import SCORE_DAYS, populate_users, refresh_due_mapsets
+from bnstats.scheduler import Scheduler
+from bnstats.score.invalidation import recalculate_dirty
+
+logger = logging.getLogger("bnstats.jobs")
+
+HOUR = 60 * 60
+
+# Jobs writing to the database share this lock, so they never overlap.
+DATABASE_LOCK = "database"
+
+
+async def populate_job():
+    await populate_users(SCORE_DAYS, incremental=True)
+
+
+async def full_populate_job():
+    # Scores depend on time windows, so do a full pass once in a while.
+    await populate_users(SCORE_DAYS)
+
+
+async def refresh_maps_job():
+    count = await refresh_due_mapsets()
+    if count:
+        logger.info(f"Refreshed {count} beatmapsets.")
+
+
+async def rescore_job():
+    users = await recalculate_dirty()
+    if users:
+        logger.info(f"Rescored {len(users)} users.")
+
+
+async def warm_cache_job():
+    await warm_listing_cache()
+    await warm_leaderboard_cache()
+    await cache.wait_background()
+
+
+def create_scheduler() -> Scheduler:
+    """Create the scheduler with every background job of the application.
+
+    Returns:
+        Scheduler: The scheduler, not started yet.
+    """
+    scheduler = Scheduler()
+    scheduler.add_job("populate", populate_job, HOUR, lock=DATABASE_LOCK)
+    scheduler.add_job("full_populate", full_populate_job, 24 * HOUR, lock=DATABASE_LOCK)
+    scheduler.add_job("refresh_maps", refresh_maps_job, HOUR, lock=DATABASE_LOCK)
+    scheduler.add_job("rescore", rescore_job, 5 * 60, lock=DATABASE_LOCK)
+    scheduler.add_job("warm_cache", warm_cache_job, 60, initial_delay=0)
+    return scheduler
@@ -1,3 +1,13 @@
 # flake8: noqa
 
-from bnstats.models.tables import Beatmap, BeatmapSet, Nomination, Reset, User
+from bnstats.models.tables import (
+    Beatmap,
+    BeatmapSet,
+    ChartBucket,
+    LeaderboardEntry,
+    MapsetInfo,
+    MapsetSummary,
+    Nomination,
+    Reset,
+    User,
+)
@@ -0,0 +1,157 @@
+import logging
+from functools import reduce
+from operator import or_
+from typing import Dict, List, Sequence, Tuple, Type
+
+from tortoise.models import Model
+from tortoise.query_utils import Q
+from tortoise.transactions import in_transaction
+
+logger = logging.getLogger("bnstats.models")
+
+BATCH_SIZE = 500
+# Databases supporting `INSERT ... ON CONFLICT DO UPDATE`.
+UPSERT_DIALECTS = {"postgres", "sqlite"}
+
+
+async def bulk_update(
+    model: Type[Model],
+    instances: Sequence[Model],
+    fields: Sequence[str],
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """Save specified fields of many instances with batched statements.
+
+    Unlike `Model.bulk_update`, values are converted with the fields' own
+    `to_db_value`, so JSON fields are stored properly. Every batch is sent as a
+    single prepared statement inside a transaction.
+
+    Args:
+        model (Type[Model]): Model of the instances.
+        instances (Sequence[Model]): Instances to be saved.
+        fields (Sequence[str]): Fields that will be saved.
+        batch_size (int, optional): Maximum rows per batch. Defaults to 500.
+    """
+    if not instances:
+        return
+
+    db = model._choose_db(True)
+    executor = db.executor_class(model=model, db=db)
+    sql = executor.get_update_sql(fields, None)
+    pk_field = model._meta.pk
+
+    logger.info(f"Saving {len(instances)} {model.__name__} rows.")
+    for i in range(0, len(instances), batch_size):
+        values: List[list] = []
+        for instance in instances[i : i + batch_size]:
+            row = [
+                executor.column_map[f](getattr(instance, f), instance) for f in fields
+            ]
+            row.append(pk_field.to_db_value(instance.pk, instance))
+            values.append(row)
+        await db.execute_many(sql, values)
+
+
+async def bulk_upsert(
+    model: Type[Model],
+    instances: Sequence[Model],
+    conflict: Sequence[str],
+    update: Sequence[str],
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """Insert many instances, updating rows that already exist instead.
+
+    Existing rows are matched by the `conflict` fields, which must be covered by
+    a unique constraint. Only the `update` fields of existing rows are changed.
+
+    On PostgreSQL and SQLite, every batch is sent as a single prepared
+    `INSERT ... ON CONFLICT DO UPDATE` statement. Other databases look up the
+    existing rows first, then update and create them separately. Either way,
+    everything is done inside one transaction.
+
+    Args:
+        model (Type[Model]): Model of the instances.
+        instances (Sequence[Model]): Unsaved instances to be upserted.
+        conflict (Sequence[str]): Fields identifying a row.
+        update (Sequence[str]): Fields that will be saved to existing rows.
+        batch_size (int, optional): Maximum rows per batch. Defaults to 500.
+    """
+    if not instances:
+        return
+
+    logger.info(f"Upserting {len(instances)} {model.__name__} rows.")
+    async with in_transaction(model._meta.default_connection) as db:
+        if db.capabilities.dialect in UPSERT_DIALECTS:
+            await _upsert_on_conflict(
+                db, model, instances, conflict, update, batch_size
+            )
+        else:
+            await _upsert_fallback(model, instances, conflict, update, batch_size)
+
+
+async def _upsert_on_conflict(
+    db,
+    model: Type[Model],
+    instances: Sequence[Model],
+    conflict: Sequence[str],
+    update: Sequence[str],
+    batch_size: int,
+):
+    executor = db.executor_class(model=model, db=db)
+    projection = model._meta.fields_db_projection
+    fields = executor.regular_columns
+    columns = [projection[f] for f in fields]
+
+    sql = str(
+        db.query_class.into(model._meta.basetable)
+        .columns(*columns)
+        .insert(*[executor.parameter(i) for i in range(len(columns))])
+    )
+    targets = ", ".join(f'"{projection[f]}"' for f in conflict)
+    sql += f" ON CONFLICT ({targets})"
+    if update:
+        sets = (f'"{projection[f]}"=EXCLUDED."{projection[f]}"' for f in update)
+        sql += " DO UPDATE SET " + ", ".join(sets)
+    else:
+        sql += " DO NOTHING"
+
+    for i in range(0, len(instances), batch_size):
+        values = [
+            [executor.column_map[f](getattr(instance, f), instance) for f in fields]
+            for instance in instances[i : i + batch_size]
+        ]
+        await db.execute_many(sql, values)
+
+
+async def _upsert_fallback(
+    model: Type[Model],
+    instances: Sequence[Model],
+    conflict: Sequence[str],
+    update: Sequence[str],
+    batch_size: int,
+):
+    def key(instance: Model) -> Tuple:
+        return tuple(getattr(instance, f) for f in conflict)
+
+    existing: Dict[Tuple, Model] = {}
+    for i in range(0, len(instances), batch_size):
+        batch = instances[i : i + batch_size]
+        query = reduce(or_, (Q(**dict(zip(conflict, key(x)))) for x in batch))
+        for row in await model.filter(query):
+            existing[key(row)] = row
+
+    updated: List[Model] = []
+    created: List[Model] = []
+    for instance in instances:
+        row = existing.get(key(instance))
+        if row is None:
+            created.append(instance)
+            continue
+        for f in update:
+            setattr(row, f, getattr(instance, f))
+        updated.append(row)
+
+    if update:
+        await bulk_update(model, updated, update, batch_size)
+    if created:
+        await model.bulk_create(created, batch_size)
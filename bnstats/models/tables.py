@@ -1,12 +1,29 @@
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Union
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from tortoise import fields, models, timezone
+from tortoise.functions import Count
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 
 from bnstats.bnsite.enums import Difficulty, Genre, Language, MapStatus, Mode
-from bnstats.helper import format_time
+from bnstats.helper import format_time, masks_with_mode, mode_mask
+from bnstats.models.bulk import bulk_upsert
 from bnstats.models.fields import ScoreField
 from tortoise.query_utils import Q
 
@@ -22,6 +39,20 @@ MODE_CONVERTER = {
 }
 logger = logging.getLogger("bnstats.models")
 
+# How often beatmapsets are refetched from osu! API, by their status.
+# Beatmapsets with None will never be refetched.
+REFRESH_INTERVALS: Dict[MapStatus, Optional[timedelta]] = {
+    MapStatus.Qualified: timedelta(hours=1),
+    MapStatus.Pending: timedelta(days=1),
+    MapStatus.WIP: timedelta(days=1),
+    MapStatus.Graveyard: timedelta(days=30),
+    MapStatus.Ranked: None,
+    MapStatus.Approved: None,
+    MapStatus.Loved: None,
+}
+# Beatmapsets that are deleted, or not found in osu! API.
+MISSING_REFRESH_INTERVAL = timedelta(days=30)
+
 
 class Beatmap(models.Model):
     """osu!beatmap representation.
@@ -30,7 +61,7 @@ class Beatmap(models.Model):
     """
 
     beatmapset_id = fields.IntField(index=True)
-    beatmap_id = fields.IntField()
+    beatmap_id = fields.IntField(unique=True)
     approved = fields.IntField()
     total_length = fields.IntField()
     hit_length = fields.IntField()
@@ -82,6 +113,30 @@ class BeatmapSet:
         """
         self.beatmaps = beatmaps
 
+    @classmethod
+    async def load_many(cls, beatmapset_ids: Iterable[int]) -> Dict[int, "BeatmapSet"]:
+        """Load multiple beatmapsets from database in a single query.
+
+        Args:
+            beatmapset_ids (Iterable[int]): IDs of the beatmapsets to be loaded.
+
+        Returns:
+            Dict[int, BeatmapSet]: Loaded beatmapsets, keyed by their ID. Beatmapsets
+                that don't exist in database will have no beatmaps.
+        """
+        grouped: Dict[int, List[Beatmap]] = {i: [] for i in beatmapset_ids}
+        if not grouped:
+            return {}
+
+        diffs = (
+            await Beatmap.filter(beatmapset_id__in=list(grouped.keys()))
+            .order_by("id")
+            .all()
+        )
+        for diff in diffs:
+            grouped[diff.beatmapset_id].append(diff)
+        return {k: cls(v) for k, v in grouped.items()}
+
     @property
     def total_diffs(self) -> int:
         return len(self.beatmaps)
@@ -127,7 +182,7 @@ class BeatmapSet:
 
 class Nomination(models.Model):
     beatmapsetId = fields.IntField()
-    userId = fields.IntField(index=True)
+    userId = fields.IntField()
     artistTitle = fields.TextField()
     creatorId = fields.IntField(null=True)
     creatorName = fields.TextField(null=True)
@@ -139,16 +194,160 @@ class Nomination(models.Model):
         on_delete="SET NULL",
     )
     as_modes = fields.JSONField(null=True, default=[])
+    # Bitmask of `as_modes`, kept in sync by `update_mode_mask`.
+    mode_mask = fields.IntField(default=0)
     ambiguous_mode = fields.BooleanField(default=False)
 
     # Scoring
     score = ScoreField(null=True)
+    score_dirty = fields.BooleanField(default=False, index=True)
     map: BeatmapSet
+    summary: Optional["MapsetSummary"]
+
+    class Meta:
+        unique_together = (("beatmapsetId", "userId"),)
+        indexes = (
+            ("creatorId", "timestamp"),
+            ("userId", "timestamp"),
+            ("userId", "mode_mask", "timestamp"),
+        )
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.update_mode_mask()
+
+    def update_mode_mask(self):
+        """Sync `mode_mask` with `as_modes`.
+
+        Done automatically on creation and `save`, but has to be called after
+        changing `as_modes` of nominations saved in bulk.
+        """
+        self.mode_mask = mode_mask(self.as_modes or [])
+
+    async def save(self, *args: Any, **kwargs: Any) -> None:
+        self.update_mode_mask()
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "as_modes" in update_fields:
+            kwargs["update_fields"] = [*update_fields, "mode_mask"]
+        await super().save(*args, **kwargs)
+
+    @staticmethod
+    def activity_query(
+        user_id: Optional[int] = None,
+        date_min: datetime = None,
+        date_max: datetime = None,
+        mode: Union[Mode, str, int] = None,
+    ) -> "QuerySet[Nomination]":
+        """Filter nominations by nominator, date, and game mode.
+
+        Args:
+            user_id (int, optional): osu! ID of the nominator. Defaults to everyone.
+            date_min (datetime, optional): Minimum date to fetch from. Defaults to None.
+            date_max (datetime, optional): Maximum date to fetch from. Defaults to None.
+            mode (Union[Mode, str, int], optional): The game mode to fetch from.
+                Defaults to all game mode.
+
+        Returns:
+            QuerySet[Nomination]: The filtered nominations.
+        """
+        filters: Dict[str, Any] = {}
+        if user_id is not None:
+            filters["userId"] = user_id
+
+        if date_min:
+            filters["timestamp__gte"] = date_min
+
+        if date_max:
+            filters["timestamp__lte"] = date_max
+
+        if mode is not None:
+            if isinstance(mode, str):
+                mode = MODE_CONVERTER[mode]
+            filters["mode_mask__in"] = masks_with_mode(int(mode))
+        return Nomination.filter(**filters)
+
+    @staticmethod
+    def paginate(
+        query: "QuerySet[Nomination]",
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+    ) -> "QuerySet[Nomination]":
+        """Sort nominations by time, and continue after a previous page if given.
+
+        Pages are taken by keyset on `(timestamp, id)` rather than an offset, so
+        later pages are as cheap as the first and stay stable while new
+        nominations come in.
+
+        Args:
+            query (QuerySet[Nomination]): Nominations to be paginated.
+            after (Tuple[datetime, int], optional): Timestamp and ID of the last
+                nomination of the previous page. Defaults to starting from the first.
+            limit (int, optional): Maximum nominations of the page. Defaults to
+                every nomination.
+
+        Returns:
+            QuerySet[Nomination]: The page's query.
+        """
+        if after:
+            timestamp, nom_id = after
+            query = query.filter(
+                Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, id__gt=nom_id)
+            )
+        query = query.order_by("timestamp", "id")
+        if limit:
+            query = query.limit(limit)
+        return query
 
     async def get_map(self) -> BeatmapSet:
-        diffs = await Beatmap.filter(beatmapset_id=self.beatmapsetId).all()
+        """Get the nominated beatmapset.
+
+        If the beatmapset has been attached with `attach_maps`, then it will be
+        returned without querying the database.
+
+        Returns:
+            BeatmapSet: The nominated beatmapset.
+        """
+        if "map" in self.__dict__:
+            return self.map
+
+        diffs = (
+            await Beatmap.filter(beatmapset_id=self.beatmapsetId).order_by("id").all()
+        )
         return BeatmapSet(diffs)
 
+    @classmethod
+    async def attach_maps(cls, nominations: List["Nomination"]) -> List["Nomination"]:
+        """Fetch beatmapsets of all nominations at once and attach them to `map`.
+
+        Args:
+            nominations (List[Nomination]): Nominations to attach the beatmapsets to.
+
+        Returns:
+            List[Nomination]: The same nominations, with `map` set.
+        """
+        mapsets = await BeatmapSet.load_many(nom.beatmapsetId for nom in nominations)
+        for nom in nominations:
+            nom.map = mapsets[nom.beatmapsetId]
+        return nominations
+
+    @classmethod
+    async def attach_summaries(
+        cls, nominations: List["Nomination"]
+    ) -> List["Nomination"]:
+        """Fetch summaries of all nominated beatmapsets at once and attach them.
+
+        Args:
+            nominations (List[Nomination]): Nominations to attach the summaries to.
+
+        Returns:
+            List[Nomination]: The same nominations, with `summary` set, or None if
+                the beatmapset no longer exists.
+        """
+        summaries = await MapsetSummary.load_many(n.beatmapsetId for n in nominations)
+        for nom in nominations:
+            nom.summary = summaries.get(nom.beatmapsetId)
+        return nominations
+
 
 class Reset(models.Model):
     id = fields.TextField(pk=True)
@@ -167,6 +366,9 @@ class Reset(models.Model):
         "models.User", related_name="resets", through="user_reset"
     )
 
+    class Meta:
+        unique_together = (("beatmapsetId", "userId", "timestamp"),)
+
 
 class User(models.Model):
     _id = fields.TextField()
@@ -184,13 +386,37 @@ class User(models.Model):
     length_favor = fields.CharField(20, null=True)
     avg_length = fields.IntField(null=True)
     avg_diffs = fields.IntField(null=True)
+
+    # Population watermarks
+    last_event_at = fields.DatetimeField(null=True)
+    maps_checked_at = fields.DatetimeField(null=True)
+
     nominations: fields.ManyToManyRelation[Nomination]
     resets: fields.ReverseRelation[Reset]
+    leaderboard_entries: fields.ReverseRelation["LeaderboardEntry"]
 
     # Runtime variables
     score: "Score"
     score_modes: Dict[str, "Score"]
 
+    # Fields exposed by `to_json`, to listings and the API.
+    JSON_FIELDS = (
+        "_id",
+        "osuId",
+        "username",
+        "modesInfo",
+        "isNat",
+        "isBn",
+        "modes",
+        "genre_favor",
+        "lang_favor",
+        "topdiff_favor",
+        "size_favor",
+        "length_favor",
+        "avg_length",
+        "avg_diffs",
+    )
+
     def __repr__(self):
         return f"User(osuId={self.osuId}, username={self.username})"
 
@@ -243,6 +469,8 @@ class User(models.Model):
         date_min: datetime = None,
         date_max: datetime = None,
         mode: Union[Mode, str, int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
     ) -> List[Nomination]:
         """Fetch user's nomination activities.
 
@@ -250,27 +478,16 @@ class User(models.Model):
             date_min (datetime, optional): Minimum date to fetch from. Defaults to None.
             date_max (datetime, optional): Maximum date to fetch from. Defaults to None.
             mode (Union[Mode, str, int], optional): The game mode to fetch from. Defaults to all game mode.
+            after (Tuple[datetime, int], optional): Only fetch nominations after this
+                timestamp and ID, see `Nomination.paginate`. Defaults to None.
+            limit (int, optional): Maximum nominations to fetch. Defaults to None.
 
         Returns:
             List[Nomination]: Nominations from user from minimum date to current for specified game mode.
         """
-        filters: Dict[str, Any] = {"userId": self.osuId}
-        if date_min:
-            filters["timestamp__gte"] = date_min
-
-        if date_max:
-            filters["timestamp__lte"] = date_max
-
-        if mode:
-            if isinstance(mode, Mode):
-                filters["as_modes__contains"] = mode.value
-            elif isinstance(mode, str):
-                filters["as_modes__contains"] = MODE_CONVERTER[mode]
-            else:
-                filters["as_modes__contains"] = mode
-
         logger.info("Fetching events.")
-        events = await Nomination.filter(**filters).all().order_by("timestamp")
+        query = Nomination.activity_query(self.osuId, date_min, date_max, mode)
+        events = await Nomination.paginate(query, after, limit)
         return events
 
     def get_score(
@@ -306,26 +523,430 @@ class User(models.Model):
             return Nomination.filter(userId=self.osuId, timestamp__gte=d).count()
         return Nomination.filter(userId=self.osuId).count()  # type: ignore
 
-    def to_json(self):
-        fields = (
-            "_id",
-            "osuId",
-            "username",
-            "modesInfo",
-            "isNat",
-            "isBn",
-            "modes",
-            "genre_favor",
-            "lang_favor",
-            "topdiff_favor",
-            "size_favor",
-            "length_favor",
-            "avg_length",
-            "avg_diffs",
+    @classmethod
+    async def get_nomination_counts(
+        cls,
+        days: Sequence[int] = (0, 90, 360),
+        user_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, List[int]]:
+        """Count nominations of every user for multiple time windows at once.
+
+        All windows are counted in a single grouped query.
+
+        Args:
+            days (Sequence[int], optional): Number of days of each window, 0 means all
+                time. Defaults to (0, 90, 360).
+            user_ids (Iterable[int], optional): Only count for these users. Defaults
+                to every user.
+
+        Returns:
+            Dict[int, List[int]]: Counts of each window in the order of `days`, keyed
+                by the user's osu! ID. Users without nominations are not included.
+        """
+        now = timezone.now()
+        annotations = {}
+        for i, day in enumerate(days):
+            if day:
+                since = now - timedelta(day)
+                annotations[f"count_{i}"] = Count("id", _filter=Q(timestamp__gte=since))
+            else:
+                annotations[f"count_{i}"] = Count("id")
+
+        query = Nomination.all()
+        if user_ids is not None:
+            query = query.filter(userId__in=list(user_ids))
+
+        rows = (
+            await query.annotate(**annotations)
+            .group_by("userId")
+            .values("userId", *annotations.keys())
         )
+        return {row["userId"]: [row[k] for k in annotations] for row in rows}
 
+    def to_json(self):
         result = {}
-        for field in fields:
+        for field in self.JSON_FIELDS:
             result[field] = getattr(self, field)
 
         return result
+
+
+class LeaderboardEntry(models.Model):
+    """A user's precomputed score for the leaderboard.
+
+    Every user has an entry for each calculator, both for all game modes (with an
+    empty `mode`) and for each of the user's modes. Entries are refreshed whenever
+    the user's nominations are rescored.
+    """
+
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField(
+        "models.User", related_name="leaderboard_entries", on_delete="CASCADE"
+    )
+    calculator = fields.CharField(20)
+    mode = fields.CharField(10, default="")
+    total_score = fields.FloatField()
+    attribs = fields.JSONField(default={})
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        unique_together = (("user", "calculator", "mode"),)
+        indexes = (("calculator", "mode", "total_score"),)
+
+    @property
+    def score(self) -> "Score":
+        from bnstats.score.object import Score
+
+        return Score(total_score=self.total_score, attribs=self.attribs)
+
+
+class MapsetInfo(models.Model):
+    """Freshness of a beatmapset fetched from osu! API.
+
+    Beatmapsets are refetched depending on their last known status, see
+    `REFRESH_INTERVALS`.
+    """
+
+    beatmapset_id = fields.IntField(pk=True)
+    approved = fields.IntField(null=True)
+    last_fetched = fields.DatetimeField(index=True)
+
+    @staticmethod
+    def refresh_interval(status: Optional[int]) -> Optional[timedelta]:
+        """Get how often beatmapsets of a status should be refetched.
+
+        Args:
+            status (Optional[int]): The beatmapset's status, None if it doesn't exist.
+
+        Returns:
+            Optional[timedelta]: The interval, None if they never need refetching.
+        """
+        if status is None:
+            return MISSING_REFRESH_INTERVAL
+        return REFRESH_INTERVALS.get(MapStatus(status))
+
+    def is_due(self, now: datetime = None) -> bool:
+        """Check whether the beatmapset should be refetched.
+
+        Args:
+            now (datetime, optional): Current time. Defaults to now.
+
+        Returns:
+            bool: Whether it should be refetched.
+        """
+        interval = self.refresh_interval(self.approved)
+        if interval is None:
+            return False
+        return self.last_fetched + interval <= (now or timezone.now())
+
+    @classmethod
+    def due_filter(cls, now: datetime = None) -> Q:
+        """Build a filter of every beatmapset that should be refetched.
+
+        Args:
+            now (datetime, optional): Current time. Defaults to now.
+
+        Returns:
+            Q: The filter.
+        """
+        now = now or timezone.now()
+        query = Q(approved=None, last_fetched__lte=now - MISSING_REFRESH_INTERVAL)
+        for status, interval in REFRESH_INTERVALS.items():
+            if interval is not None:
+                query |= Q(approved=status.value, last_fetched__lte=now - interval)
+        return query
+
+
+class MapsetSummary(models.Model):
+    """Precomputed summary of a beatmapset's difficulties.
+
+    Refreshed whenever the beatmapset is fetched, so that pages listing many
+    beatmapsets don't need to load every difficulty.
+    """
+
+    beatmapset_id = fields.IntField(pk=True, generated=False)
+    artist = fields.CharField(255)
+    title = fields.CharField(255)
+    creator = fields.CharField(255)
+    creator_id = fields.IntField(default=0)
+    approved = fields.IntField()
+    genre_id = fields.IntField()
+    language_id = fields.IntField()
+    total_diffs = fields.IntField()
+    total_length = fields.IntField()
+    longest_length = fields.IntField()
+    hit_length = fields.IntField()
+    top_difficultyrating = fields.FloatField()
+    # Number of difficulties, keyed by `Difficulty` value.
+    difficulty_counts = fields.JSONField(default={})
+    # Per game mode summary, keyed by mode: difficulties, total and longest drain
+    # time, and top star rating.
+    modes = fields.JSONField(default={})
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    @property
+    def status(self) -> MapStatus:
+        return MapStatus(self.approved)
+
+    @property
+    def genre(self) -> Genre:
+        return Genre(self.genre_id)
+
+    @property
+    def language(self) -> Language:
+        return Language(self.language_id)
+
+    @property
+    def difficulty(self) -> Difficulty:
+        """Difficulty of the hardest difficulty."""
+        return Difficulty.from_sr(self.top_difficultyrating)
+
+    @property
+    def map_length(self) -> str:
+        return format_time(self.longest_length)
+
+    @classmethod
+    def from_mapset(cls, mapset: BeatmapSet) -> "MapsetSummary":
+        """Summarize a beatmapset, without saving it.
+
+        Args:
+            mapset (BeatmapSet): The beatmapset, which must have difficulties.
+
+        Returns:
+            MapsetSummary: Summary of the beatmapset.
+        """
+        difficulty_counts: Dict[str, int] = {}
+        modes: Dict[str, Dict[str, Any]] = {}
+        for b in mapset.beatmaps:
+            key = str(b.difficulty.value)
+            difficulty_counts[key] = difficulty_counts.get(key, 0) + 1
+
+            mode = modes.setdefault(
+                str(b.mode),
+                {
+                    "diffs": 0,
+                    "hit_length": 0,
+                    "longest_hit_length": 0,
+                    "top_difficultyrating": 0.0,
+                },
+            )
+            mode["diffs"] += 1
+            mode["hit_length"] += b.hit_length
+            mode["longest_hit_length"] = max(mode["longest_hit_length"], b.hit_length)
+            mode["top_difficultyrating"] = max(
+                mode["top_difficultyrating"], b.difficultyrating
+            )
+
+        return cls(
+            beatmapset_id=mapset.beatmapset_id,
+            artist=mapset.artist,
+            title=mapset.title,
+            creator=mapset.creator,
+            creator_id=mapset.creator_id,
+            approved=mapset.approved,
+            genre_id=mapset.genre_id,
+            language_id=mapset.language_id,
+            total_diffs=mapset.total_diffs,
+            total_length=mapset.total_length,
+            longest_length=mapset.longest_length,
+            hit_length=sum(b.hit_length for b in mapset.beatmaps),
+            top_difficultyrating=mapset.top_difficulty.difficultyrating,
+            difficulty_counts=difficulty_counts,
+            modes=modes,
+        )
+
+    @classmethod
+    async def refresh(cls, mapsets: Dict[int, BeatmapSet]) -> List["MapsetSummary"]:
+        """Rebuild summaries of beatmapsets.
+
+        Summaries of beatmapsets without difficulties are removed.
+
+        Args:
+            mapsets (Dict[int, BeatmapSet]): Beatmapsets keyed by their ID.
+
+        Returns:
+            List[MapsetSummary]: The new summaries.
+        """
+        summaries = [cls.from_mapset(m) for m in mapsets.values() if m.beatmaps]
+        update = [f for f in cls._meta.fields_db_projection if f != "beatmapset_id"]
+        await bulk_upsert(cls, summaries, ("beatmapset_id",), update)
+
+        missing = [k for k, m in mapsets.items() if not m.beatmaps]
+        if missing:
+            await cls.filter(beatmapset_id__in=missing).delete()
+        return summaries
+
+    @classmethod
+    async def load_many(
+        cls, beatmapset_ids: Iterable[int]
+    ) -> Dict[int, "MapsetSummary"]:
+        """Load summaries of multiple beatmapsets.
+
+        Beatmapsets that haven't been summarized yet are summarized from their
+        difficulties in database.
+
+        Args:
+            beatmapset_ids (Iterable[int]): IDs of the beatmapsets to be loaded.
+
+        Returns:
+            Dict[int, MapsetSummary]: Summaries keyed by beatmapset ID. Beatmapsets
+                without difficulties are not included.
+        """
+        ids = set(beatmapset_ids)
+        if not ids:
+            return {}
+
+        summaries = {s.pk: s for s in await cls.filter(beatmapset_id__in=ids)}
+        missing = ids - summaries.keys()
+        if missing:
+            logger.info(f"Summarizing {len(missing)} beatmapsets.")
+            for s in await cls.refresh(await BeatmapSet.load_many(missing)):
+                summaries[s.beatmapset_id] = s
+        return summaries
+
+
+class ChartBucket(models.Model):
+    """Profile chart data of a user's nominations on a single day (UTC).
+
+    Any window of days is charted by summing its buckets, instead of going
+    through every nomination and its beatmapset.
+    """
+
+    userId = fields.IntField()
+    day = fields.DateField()
+    nominations = fields.IntField(default=0)
+    # Nominations by `Genre`, `Language`, and `Difficulty` of the top difficulty,
+    # keyed by their value.
+    genres = fields.JSONField(default={})
+    languages = fields.JSONField(default={})
+    top_difficulties = fields.JSONField(default={})
+    # Difficulties of every nominated beatmapset, keyed by `Difficulty` value.
+    difficulties = fields.JSONField(default={})
+    # Nominations by their longest length, see `length_bucket`.
+    lengths = fields.JSONField(default=[0] * 6)
+
+    class Meta:
+        unique_together = (("userId", "day"),)
+
+    @staticmethod
+    def length_bucket(length: int) -> int:
+        """Get the length histogram bucket of a beatmapset.
+
+        Args:
+            length (int): Longest length of the beatmapset, in seconds.
+
+        Returns:
+            int: Index of the bucket, one per minute up to 5 minutes and over.
+        """
+        for i in range(1, 6):
+            if length <= i * 60:
+                return i - 1
+        return 5
+
+    def add(self, summary: MapsetSummary):
+        """Count a nomination of the beatmapset into the bucket.
+
+        Args:
+            summary (MapsetSummary): Summary of the nominated beatmapset.
+        """
+
+        def increment(counts: Dict[str, int], key: int, value: int = 1):
+            counts[str(key)] = counts.get(str(key), 0) + value
+
+        self.nominations += 1
+        increment(self.genres, summary.genre_id)
+        increment(self.languages, summary.language_id)
+        increment(self.top_difficulties, summary.difficulty.value)
+        for diff, count in summary.difficulty_counts.items():
+            increment(self.difficulties, int(diff), count)
+        self.lengths[self.length_bucket(summary.longest_length)] += 1
+
+    @classmethod
+    async def rebuild(cls, user_id: int, days: Optional[Iterable[date]] = None):
+        """Rebuild buckets of a user from their nominations.
+
+        Args:
+            user_id (int): osu! ID of the user.
+            days (Iterable[date], optional): Days to be rebuilt. Defaults to every
+                day.
+        """
+        query = Nomination.filter(userId=user_id)
+        day_set = None
+        if days is not None:
+            day_set = set(days)
+            if not day_set:
+                return
+            query = query.filter(
+                timestamp__gte=_start_of_day(min(day_set)),
+                timestamp__lt=_start_of_day(max(day_set) + timedelta(1)),
+            )
+
+        nominations = await Nomination.attach_summaries(await query)
+        buckets: Dict[date, ChartBucket] = {}
+        for nom in nominations:
+            day = nom.timestamp.astimezone(dt_timezone.utc).date()
+            if not nom.summary or (day_set is not None and day not in day_set):
+                continue
+            if day not in buckets:
+                buckets[day] = cls(
+                    userId=user_id,
+                    day=day,
+                    genres={},
+                    languages={},
+                    top_difficulties={},
+                    difficulties={},
+                    lengths=[0] * 6,
+                )
+            buckets[day].add(nom.summary)
+
+        keys = ("id", "userId", "day")
+        update = [f for f in cls._meta.fields_db_projection if f not in keys]
+        async with in_transaction(cls._meta.default_connection):
+            stale = cls.filter(userId=user_id)
+            if day_set is not None:
+                stale = stale.filter(day__in=list(day_set))
+            await stale.delete()
+            await bulk_upsert(cls, list(buckets.values()), ("userId", "day"), update)
+
+    @classmethod
+    async def refresh(cls, nominations: Iterable[Nomination]):
+        """Rebuild buckets containing the nominations.
+
+        Should be called when nominations are created, or their beatmapsets change.
+
+        Args:
+            nominations (Iterable[Nomination]): Created or changed nominations.
+        """
+        days: Dict[int, Set[date]] = {}
+        for nom in nominations:
+            day = nom.timestamp.astimezone(dt_timezone.utc).date()
+            days.setdefault(nom.userId, set()).add(day)
+
+        for user_id, user_days in days.items():
+            await cls.rebuild(user_id, user_days)
+
+    @classmethod
+    async def load(
+        cls, user_id: int, date_min: datetime = None, date_max: datetime = None
+    ) -> List["ChartBucket"]:
+        """Fetch buckets of a user, sorted by day.
+
+        Args:
+            user_id (int): osu! ID of the user.
+            date_min (datetime, optional): Minimum date to fetch from, rounded down
+                to its day. Defaults to None.
+            date_max (datetime, optional): Maximum date to fetch until, exclusive,
+                rounded down to its day. Defaults to None.
+
+        Returns:
+            List[ChartBucket]: Buckets within the dates.
+        """
+        filters: Dict[str, Any] = {"userId": user_id}
+        if date_min:
+            filters["day__gte"] = date_min.astimezone(dt_timezone.utc).date()
+        if date_max:
+            filters["day__lt"] = date_max.astimezone(dt_timezone.utc).date()
+        return await cls.filter(**filters).order_by("day")
+
+
+def _start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
@@ -1,10 +1,15 @@
-from aiocache import Cache
+from typing import Any, Dict
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import HTMLResponse
 from starlette.templating import Jinja2Templates
 from webassets import Bundle
 from webassets import Environment as AssetsEnvironment
 from webassets.ext.jinja2 import AssetsExtension
 
 from bnstats import config
+from bnstats.cache import USERS_ENTITY, cache, leaderboard_entity, user_entity
+from bnstats.fragments import FragmentCache, FragmentCacheExtension
 
 assets_env = AssetsEnvironment("./bnstats/static", "/static")
 templates = Jinja2Templates(directory="bnstats/templates")
@@ -12,6 +17,12 @@ templates.env.add_extension(AssetsExtension)
 templates.env.assets_environment = assets_env  # type: ignore
 templates.env.globals["config"] = config
 
+templates.env.add_extension(FragmentCacheExtension)
+templates.env.fragment_cache = FragmentCache(cache)  # type: ignore
+templates.env.globals["user_entity"] = user_entity
+templates.env.globals["leaderboard_entity"] = leaderboard_entity
+templates.env.globals["USERS_ENTITY"] = USERS_ENTITY
+
 js_bundle = Bundle(
     Bundle(
         "js/vendor/jquery.js",
@@ -34,4 +45,20 @@ css_bundle = Bundle("css/*.css", filters="rcssmin", output="bundle.%(version)s.c
 assets_env.register("js_all", js_bundle)
 assets_env.register("css_all", css_bundle)
 
-cache = Cache.from_url(config.REDIS_URI)
+
+async def render(name: str, context: Dict[str, Any]) -> HTMLResponse:
+    """Render a template in a worker thread.
+
+    Unlike `templates.TemplateResponse`, this doesn't block the event loop, and
+    lets `{% cache %}` blocks reach the cache backend.
+
+    Args:
+        name (str): Name of the template.
+        context (Dict[str, Any]): Context of the template, including the request.
+
+    Returns:
+        HTMLResponse: The rendered page.
+    """
+    template = templates.get_template(name)
+    content = await run_in_threadpool(template.render, context)
+    return HTMLResponse(content)
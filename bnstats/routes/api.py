@@ -0,0 +1,330 @@
+import functools
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from typing import Sequence, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Router
+from tortoise import timezone
+from tortoise.queryset import QuerySet
+
+from bnstats.cache import (
+    SCORES_ENTITY,
+    USERS_ENTITY,
+    leaderboard_entity,
+    user_entity,
+)
+from bnstats.conditional import conditional
+from bnstats.models import Nomination, User
+from bnstats.routes.score import LEADERBOARD_MODES, _get_leaderboard
+from bnstats.routes.users import _get_listing, get_activity_window
+from bnstats.score import _AVAILABLE
+from bnstats.score.base import CalculatorABC
+
+router = Router()
+
+MODES = ["osu", "taiko", "catch", "mania"]
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Nominations fetched at once while streaming.
+STREAM_BATCH_SIZE = 500
+
+USER_FIELDS = User.JSON_FIELDS
+NOMINATION_FIELDS = (
+    "id",
+    "beatmapsetId",
+    "userId",
+    "artistTitle",
+    "creatorId",
+    "creatorName",
+    "timestamp",
+    "as_modes",
+    "score",
+)
+
+Endpoint = Callable[[Request], Awaitable[Response]]
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse({"status": status, "message": message}, status)
+
+
+def json_errors(func: Endpoint) -> Endpoint:
+    """Respond with JSON instead of plain text when the endpoint raises an error."""
+
+    @functools.wraps(func)
+    async def endpoint(request: Request) -> Response:
+        try:
+            return await func(request)
+        except HTTPException as e:
+            return _error(e.status_code, e.detail)
+
+    return endpoint
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _get_fields(request: Request, available: Sequence[str]) -> Sequence[str]:
+    fields_str = request.query_params.get("fields")
+    if not fields_str:
+        return available
+
+    fields = fields_str.split(",")
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise HTTPException(400, f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def _get_mode(request: Request, modes: Sequence[str]) -> Optional[str]:
+    mode = request.query_params.get("mode")
+    if mode and mode not in modes:
+        raise HTTPException(400, f"Unknown mode: {mode}")
+    return mode or None
+
+
+def _get_calculator_name(request: Request) -> str:
+    return request.query_params.get("calculator") or request.scope["calculator"].name
+
+
+def _get_calculator(request: Request) -> CalculatorABC:
+    name = _get_calculator_name(request)
+    if name not in _AVAILABLE:
+        raise HTTPException(400, f"Unknown calculator: {name}")
+    return _AVAILABLE[name]()
+
+
+def _get_limit(request: Request) -> int:
+    try:
+        limit = int(request.query_params.get("limit", PAGE_SIZE))
+    except ValueError:
+        raise HTTPException(400, "Limit must be a number.")
+    if not 0 < limit <= MAX_PAGE_SIZE:
+        raise HTTPException(400, f"Limit must be between 1 and {MAX_PAGE_SIZE}.")
+    return limit
+
+
+def encode_cursor(nom: Nomination) -> str:
+    """Encode the position after a nomination, see `Nomination.paginate`.
+
+    Args:
+        nom (Nomination): The last nomination of a page.
+
+    Returns:
+        str: Opaque cursor of the next page.
+    """
+    raw = f"{nom.timestamp.isoformat()}|{nom.id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor made by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+
+    Returns:
+        Tuple[datetime, int]: Timestamp and ID of the nomination.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    try:
+        timestamp, nom_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(nom_id)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor.")
+
+
+async def _get_user_or_404(user_id: int) -> User:
+    user = await User.get_or_none(osuId=user_id)
+    if not user:
+        raise HTTPException(404, "User not found.")
+    return user
+
+
+def _user_entities(request: Request) -> List[str]:
+    return [user_entity(request.path_params["user_id"])]
+
+
+def _export_entities(request: Request) -> List[str]:
+    user_id = request.query_params.get("user")
+    if user_id and user_id.isnumeric():
+        return [user_entity(int(user_id))]
+    return [USERS_ENTITY, SCORES_ENTITY]
+
+
+def _nomination_json(nom: Nomination, fields: Sequence[str]) -> Dict[str, Any]:
+    return {f: _to_json(getattr(nom, f)) for f in fields}
+
+
+@router.route("/users", name="users")
+@conditional(lambda request: [USERS_ENTITY])
+@json_errors
+async def list_users(request: Request):
+    fields = _get_fields(request, USER_FIELDS + ("counts",))
+    listing = await _get_listing()
+
+    users = []
+    for u in listing["users"]:
+        u = dict(u, counts=listing["counts"][u["username"]])
+        users.append({f: u[f] for f in fields})
+    return JSONResponse(
+        {"users": users, "last_update": _to_json(listing["last_update"])}
+    )
+
+
+@router.route("/users/{user_id:int}", name="user")
+@conditional(_user_entities)
+@json_errors
+async def show_user(request: Request):
+    fields = _get_fields(request, USER_FIELDS)
+    user = await _get_user_or_404(request.path_params["user_id"])
+    return JSONResponse({f: _to_json(getattr(user, f)) for f in fields})
+
+
+@router.route("/users/{user_id:int}/nominations", name="user_nominations")
+@conditional(_user_entities)
+@json_errors
+async def list_user_nominations(request: Request):
+    fields = _get_fields(request, NOMINATION_FIELDS)
+    mode = _get_mode(request, MODES)
+    limit = _get_limit(request)
+    cursor = request.query_params.get("after")
+    after = decode_cursor(cursor) if cursor else None
+
+    user = await _get_user_or_404(request.path_params["user_id"])
+    date_min, date_max = get_activity_window(request)
+    # Fetch an extra nomination to know whether there is a next page.
+    nominations = await user.get_nomination_activity(
+        date_min, date_max, mode, after=after, limit=limit + 1
+    )
+
+    next_cursor = None
+    if len(nominations) > limit:
+        nominations = nominations[:limit]
+        next_cursor = encode_cursor(nominations[-1])
+    return JSONResponse(
+        {
+            "nominations": [_nomination_json(nom, fields) for nom in nominations],
+            "next": next_cursor,
+        }
+    )
+
+
+async def _stream_nominations(
+    query: "QuerySet[Nomination]", fields: Sequence[str]
+) -> AsyncIterator[str]:
+    yield '{"nominations": ['
+    after: Optional[Tuple[datetime, int]] = None
+    separator = ""
+    while True:
+        page = await Nomination.paginate(query, after, STREAM_BATCH_SIZE)
+        for nom in page:
+            yield separator + json.dumps(_nomination_json(nom, fields))
+            separator = ","
+
+        if len(page) < STREAM_BATCH_SIZE:
+            break
+        after = (page[-1].timestamp, page[-1].id)
+    yield "]}"
+
+
+@router.route("/nominations", name="nominations")
+@conditional(_export_entities)
+@json_errors
+async def export_nominations(request: Request):
+    fields = _get_fields(request, NOMINATION_FIELDS)
+    mode = _get_mode(request, MODES)
+    user_id = request.query_params.get("user")
+    if user_id is not None and not user_id.isnumeric():
+        raise HTTPException(400, "User must be an osu! ID.")
+
+    date_min, date_max = get_activity_window(request)
+    query = Nomination.activity_query(
+        int(user_id) if user_id else None, date_min, date_max, mode
+    )
+    # Only load the selected fields, and those needed to paginate.
+    query = query.only(*{*fields, "id", "timestamp"})
+    return StreamingResponse(
+        _stream_nominations(query, fields), media_type="application/json"
+    )
+
+
+@router.route("/users/{user_id:int}/score", name="user_score")
+@conditional(_user_entities)
+@json_errors
+async def show_user_score(request: Request):
+    calc_system = _get_calculator(request)
+    mode = _get_mode(request, MODES)
+    user = await _get_user_or_404(request.path_params["user_id"])
+
+    d = timezone.now() - timedelta(90)
+    nominations = await user.get_nomination_activity(d, mode=mode)
+    scored = [n for n in nominations if "total_score" in n.score[calc_system.name]]
+    scored.sort(
+        key=lambda x: abs(x.score[calc_system.name]["total_score"]),
+        reverse=True,
+    )
+
+    score = calc_system.get_activity_score(scored)
+    nomination_scores: List[Dict[str, Any]] = []
+    for nom in scored:
+        nom_json = _nomination_json(
+            nom, ("id", "beatmapsetId", "artistTitle", "creatorName", "timestamp")
+        )
+        nom_json["score"] = nom.score[calc_system.name]
+        nomination_scores.append(nom_json)
+
+    return JSONResponse(
+        {
+            "osuId": user.osuId,
+            "calculator": calc_system.name,
+            "mode": mode,
+            "total_score": score.total_score,
+            "attribs": score.attribs,
+            "nominations": nomination_scores,
+        }
+    )
+
+
+@router.route("/leaderboard", name="leaderboard")
+@conditional(
+    lambda request: [
+        leaderboard_entity(_get_calculator_name(request)),
+        USERS_ENTITY,
+    ]
+)
+@json_errors
+async def show_leaderboard(request: Request):
+    calc_system = _get_calculator(request)
+    mode = _get_mode(request, LEADERBOARD_MODES) or ""
+    ranked, last_update = await _get_leaderboard(calc_system.name, mode)
+
+    users = []
+    for u in ranked:
+        users.append(
+            {
+                "osuId": u["osuId"],
+                "username": u["username"],
+                "modes": u["modes"],
+                "score": u["score"] and u["score"]._asdict(),
+                "score_modes": {m: s._asdict() for m, s in u["score_modes"].items()},
+            }
+        )
+    return JSONResponse(
+        {
+            "calculator": calc_system.name,
+            "mode": mode,
+            "users": users,
+            "last_update": _to_json(last_update),
+        }
+    )
@@ -7,9 +7,11 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Router
 
+from bnstats.cache import USERS_ENTITY, cache, user_entity
 from bnstats.helper import generate_mongo_id, mode_to_db
-from bnstats.models import Nomination, Reset, User
+from bnstats.models import ChartBucket, Nomination, Reset, User
 from bnstats.routine import update_maps_db, update_users_db
+from bnstats.score.invalidation import invalidate_nominations, invalidate_resets
 
 router = Router()
 
@@ -44,8 +46,15 @@ async def nomination_update(event: Dict[str, Any]):
 
     if not db_event:
         db_event = await Nomination.create(**event)
+        await invalidate_nominations([db_event])
+        await cache.bump(USERS_ENTITY, user_entity(db_event.userId))
+        created = True
+    else:
+        created = False
 
     await update_maps_db(db_event)
+    if created:
+        await ChartBucket.refresh([db_event])
 
 
 async def reset_update(event: Dict[str, Any]):
@@ -81,6 +90,7 @@ async def reset_update(event: Dict[str, Any]):
             await db_event.user_affected.add(user)
 
     await db_event.save()
+    await invalidate_resets([db_event])
 
 
 classes = {
@@ -1,20 +1,25 @@
-from datetime import timedelta
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
-from dateutil.parser import parse
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.routing import Router
 from tortoise import timezone
 from tortoise.query_utils import Q
 
-from bnstats.models import User
-from bnstats.plugins import templates, cache
+from bnstats.models import LeaderboardEntry, Nomination, User
+from bnstats.cache import USERS_ENTITY, cache, leaderboard_entity, user_entity
+from bnstats.conditional import conditional
+from bnstats.plugins import render, templates
+from bnstats.score import _AVAILABLE
 
 router = Router()
 
+LEADERBOARD_MODES = ["", "osu", "taiko", "catch", "mania"]
+
 
 @router.route("/{user_id:int}", name="show")
+@conditional(lambda request: [user_entity(request.path_params["user_id"])])
 async def show_user(request: Request):
     calc_system = request.scope["calculator"]
 
@@ -34,8 +39,7 @@ async def show_user(request: Request):
         ctx = {"request": request, "user": user, "error": True, "title": user.username}
         return templates.TemplateResponse("pages/user/no_noms.html", ctx)
 
-    for nom in nominations:
-        nom.map = await nom.get_map()
+    await Nomination.attach_maps(nominations)
 
     nominations.sort(
         key=lambda x: abs(x.score[calc_system.name]["total_score"]),
@@ -50,67 +54,90 @@ async def show_user(request: Request):
         "nominations": nominations,
         "title": user.username,
     }
-    return templates.TemplateResponse("pages/score/show.html", ctx)
+    return await render("pages/score/show.html", ctx)
 
 
-@router.route("/leaderboard", name="leaderboard")
-async def leaderboard(request: Request):
-    calc_system = request.scope["calculator"]
+async def _load_leaderboard(
+    calculator: str, mode: str
+) -> Tuple[List[Dict[str, Any]], Optional[datetime]]:
+    entries = (
+        await LeaderboardEntry.filter(
+            Q(user__isBn=True) | Q(user__isNat=True),
+            calculator=calculator,
+        )
+        .prefetch_related("user")
+        .order_by("-total_score")
+        .all()
+    )
 
-    selected_mode: str = request.query_params.get("mode", "")
-    is_valid_mode = selected_mode and selected_mode in [
-        "osu",
-        "taiko",
-        "catch",
-        "mania",
-    ]
-    if is_valid_mode:
-        users = (
-            await User.filter(
-                Q(isBn=True) | Q(isNat=True),
-                modes__contains=[selected_mode],
-            )
-            .all()
-            .order_by("username")
+    users: Dict[int, Dict[str, Any]] = {}
+    for entry in entries:
+        u = users.setdefault(
+            entry.user.osuId,
+            {
+                "osuId": entry.user.osuId,
+                "username": entry.user.username,
+                "modes": entry.user.modes,
+                "score": None,
+                "score_modes": {},
+            },
         )
+        if entry.mode:
+            u["score_modes"][entry.mode] = entry.score
+        else:
+            u["score"] = entry.score
+
+    if mode:
+        ranked = [u for u in users.values() if mode in u["score_modes"]]
+        ranked.sort(key=lambda x: x["score_modes"][mode].total_score, reverse=True)
     else:
-        selected_mode = ""
-        users = await User.get_users(show_former=False)
+        ranked = [u for u in users.values() if u["score"] is not None]
+        ranked.sort(key=lambda x: x["score"].total_score, reverse=True)
+
+    last_update = max((e.updated_at for e in entries), default=None)
+    return ranked, last_update
 
-    last_update = max(users, key=lambda x: x.last_updated).last_updated
-    cached_score = await cache.get(f"scores-{selected_mode}-{calc_system.name}", None)
-    has_cache = (
-        cached_score is not None and parse(cached_score["+last_update"]) >= last_update
+
+def _get_leaderboard(
+    calculator: str, mode: str
+) -> Awaitable[Tuple[List[Dict[str, Any]], Optional[datetime]]]:
+    return cache.get_or_load(
+        f"leaderboard:{calculator}:{mode}",
+        [leaderboard_entity(calculator), USERS_ENTITY],
+        lambda: _load_leaderboard(calculator, mode),
     )
 
-    new_cache = {}
-    for u in users:
-        if has_cache and u.osuId in cached_score:
-            u.score = cached_score[u.osuId]["score"]
-            u.score_modes = cached_score[u.osuId]["score_modes"]
-            continue
 
-        u.score = await u.get_score(calc_system)
-        u.score_modes = {}
-        for mode in u.modes:
-            u.score_modes[mode] = await u.get_score(calc_system, mode=mode)
+async def warm_leaderboard_cache():
+    """Load every leaderboard into the cache, rebuilding the outdated ones."""
+    for calculator in _AVAILABLE:
+        for mode in LEADERBOARD_MODES:
+            await _get_leaderboard(calculator, mode)
+
 
-        new_cache[u.osuId] = {"score": u.score, "score_modes": u.score_modes}
+@router.route("/leaderboard", name="leaderboard")
+@conditional(
+    lambda request: [
+        leaderboard_entity(request.scope["calculator"].name),
+        USERS_ENTITY,
+    ]
+)
+async def leaderboard(request: Request):
+    calc_system = request.scope["calculator"]
 
-    if not has_cache:
-        new_cache["+last_update"] = last_update.isoformat()
-        await cache.set(f"scores-{selected_mode}-{calc_system.name}", new_cache)
+    selected_mode: str = request.query_params.get("mode", "")
+    is_valid_mode = selected_mode and selected_mode in LEADERBOARD_MODES
+    if not is_valid_mode:
+        selected_mode = ""
 
-    if is_valid_mode:
-        users.sort(key=lambda x: x.score_modes[selected_mode], reverse=True)
-    else:
-        users.sort(key=lambda x: x.score, reverse=True)
+    ranked, last_update = await _get_leaderboard(calc_system.name, selected_mode)
 
     ctx = {
+        "calc_system": calc_system,
         "request": request,
-        "users": users,
-        "last_update": max(users, key=lambda x: x.last_updated).last_updated,
+        "users": ranked,
+        "last_update": last_update,
         "title": "Leaderboard",
         "mode": selected_mode,
     }
-    return templates.TemplateResponse("pages/score/leaderboard.html", ctx)
+    return await render("pages/score/leaderboard.html", ctx)
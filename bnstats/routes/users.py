@@ -1,10 +1,9 @@
-import operator
 from collections import Counter
-from datetime import datetime, timedelta
-from itertools import groupby
-from typing import Dict, List, Tuple
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from enum import Enum
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Type
 
-from dateutil.parser import parse
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.routing import Router
@@ -12,202 +11,164 @@ from tortoise import timezone
 
 from bnstats.bnsite.enums import Difficulty, Genre, Language
 from bnstats.helper import ensure_int, format_time
-from bnstats.models import BeatmapSet, Nomination, User
-from bnstats.plugins import templates, cache
+from bnstats.models import ChartBucket, Nomination, User
+from bnstats.cache import USERS_ENTITY, cache, user_entity
+from bnstats.conditional import conditional
+from bnstats.plugins import render, templates
 
 router = Router()
 
 
-def _create_length_chartdata(nominations):
-    counter = [0, 0, 0, 0, 0, 0]
-    for nom in nominations:
-        mapset: BeatmapSet = nom.map
-
-        for i in range(1, 6):
-            if mapset.longest_length <= i * 60:
-                counter[i - 1] += 1
-                break
-
-        if mapset.longest_length > 300:
-            counter[5] += 1
-    return counter
+def _create_nomination_chartdata(buckets: List[ChartBucket]):
+    months: Counter = Counter()
+    for bucket in buckets:
+        months[bucket.day.year * 12 + bucket.day.month - 1] += bucket.nominations
 
+    labels = []
+    datas = []
+    if months:
+        # Fill in months without nominations.
+        for month in range(min(months), max(months) + 1):
+            year, month_index = divmod(month, 12)
+            labels.append(f"{month_index + 1}/{year}")
+            datas.append(months[month])
 
-def _create_nomination_chartdata(nominations: List[Nomination]):
-    f = operator.attrgetter("timestamp.month", "timestamp.year")
-    sorted_nominations = sorted(nominations, key=lambda x: x.timestamp)
-    grouped = groupby(sorted_nominations, f)
+    return labels, datas
 
-    Timestamp = Tuple[int, int]
-    nomination_groups: List[Tuple[Timestamp, List[Nomination]]] = []
 
-    k: Timestamp
-    for k, v in grouped:  # type: ignore
-        nomination_groups.append((k, list(v)))
+def _create_count_chartdata(
+    buckets: List[ChartBucket], attr: str, enum: Type[Enum]
+) -> Tuple[List[str], List[int]]:
+    counts: Counter = Counter()
+    for bucket in buckets:
+        for key, count in getattr(bucket, attr).items():
+            counts[enum(int(key))] += count
 
-    # To anyone reading this:
-    # If you know a better way to fill in the chart graph, then please let me know.
-    # Current one works, but I'm very uncertain about the performance.
-    i = len(nomination_groups) - 1
-    while i > 0:
-        current = nomination_groups[i][0]
-        last = nomination_groups[i - 1][0]
+    labels = []
+    datas = []
+    for elem, cnt in sorted(counts.items(), key=lambda x: x[0].value):
+        labels.append(elem.name.replace("_", " "))
+        datas.append(cnt)
+    return labels, datas
 
-        yeargap = 0
-        delta = 0
-        if current[1] != last[1]:
-            if current[0] == 1 and last[0] == 12:
-                i -= 1
-                continue
-            yeargap += 1
 
-        if current[0] - last[0] == 1:
-            i -= 1
-            continue
+def get_activity_window(
+    request: Request,
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Get the dates of activity to show, from `days` or `year` query parameter.
 
-        delta += current[0] + 12 * yeargap - last[0]
+    Args:
+        request (Request): The request.
 
-        new_year = current[1]
-        for j in range(1, delta):
-            new_month = current[0] - j
-            if new_month < 1:
-                new_month += 12
-                if yeargap > 0:
-                    new_year -= 1
-                    yeargap -= 1
-            nomination_groups.insert(i, ((new_month, new_year), []))
+    Returns:
+        Tuple[Optional[datetime], Optional[datetime]]: Minimum and maximum date, or
+            None if unbounded.
+    """
+    day_limit_str = request.query_params.get("days")
+    year_limit_str = request.query_params.get("year")
 
-        i -= 1
+    date_min = None
+    date_max = None
+    if day_limit_str and day_limit_str != "0":
+        day_limit = ensure_int(day_limit_str)
+        if day_limit and day_limit in (30, 90, 360):
+            # Windows start at a day boundary, to match the chart buckets.
+            today = timezone.now().astimezone(dt_timezone.utc).date()
+            start = datetime.combine(today - timedelta(day_limit), time.min)
+            date_min = start.replace(tzinfo=dt_timezone.utc)
 
-    labels = []
-    datas = []
-    for k, noms in nomination_groups:
-        labels.append("/".join(map(str, k)))
-        datas.append(len(noms))
+    elif year_limit_str:
+        year_limit = ensure_int(year_limit_str)
+        if year_limit:
+            date_min = timezone.make_aware(datetime(year_limit, 1, 1))
+            date_max = timezone.make_aware(datetime(year_limit + 1, 1, 1))
 
-    return labels, datas
+    return date_min, date_max
 
 
-@router.route("/", name="list")
-async def listing(request: Request):
+async def _load_listing() -> Dict[str, Any]:
     COUNTS = [0, 90, 360]
     users = await User.get_users(show_former=False)
     last_update = max(users, key=lambda x: x.last_updated).last_updated
 
-    counts = await cache.get("user-counts", None)
-    if not counts or parse(counts["+last_update"]) < last_update:
-        counts = {}
-        for u in users:
-            counts[u.username] = [await u.total_nominations(c) for c in COUNTS]
+    user_counts = await User.get_nomination_counts(COUNTS, [u.osuId for u in users])
+    counts = {u.username: user_counts.get(u.osuId, [0] * len(COUNTS)) for u in users}
+    return {
+        "users": [u.to_json() for u in users],
+        "counts": counts,
+        "last_update": last_update,
+    }
+
+
+def _get_listing() -> Awaitable[Dict[str, Any]]:
+    return cache.get_or_load("users:list", [USERS_ENTITY], _load_listing)
 
-        counts["+last_update"] = last_update.isoformat()
-        await cache.set("user-counts", counts)
+
+async def warm_listing_cache():
+    """Load the user listing into the cache, rebuilding it if outdated."""
+    await _get_listing()
+
+
+@router.route("/", name="list")
+@conditional(lambda request: [USERS_ENTITY])
+async def listing(request: Request):
+    listing = await _get_listing()
 
     ctx = {
         "request": request,
-        "users": [u.to_json() for u in users],
-        "counts": counts,
+        "users": listing["users"],
+        "counts": listing["counts"],
         "genres": [g.name.replace("_", " ") for g in Genre],
         "languages": [lang.name for lang in Language],
         "diffs": [diff.name for diff in Difficulty],
-        "last_update": last_update,
+        "last_update": listing["last_update"],
         "title": "User Listing",
     }
     return templates.TemplateResponse("pages/user/listing.html", ctx)
 
 
 @router.route("/{user_id:int}", name="show")
+@conditional(lambda request: [user_entity(request.path_params["user_id"])])
 async def show_user(request: Request):
     uid: int = request.path_params["user_id"]
     user = await User.get_or_none(osuId=uid)
     if not user:
         raise HTTPException(404, "User not found.")
 
-    day_limit_str = request.query_params.get("days")
-    year_limit_str = request.query_params.get("year")
-
-    nominations = None
-    if day_limit_str and day_limit_str != "0":
-        datetime_limit = None
-        day_limit = ensure_int(day_limit_str)
-        if day_limit and day_limit in (30, 90, 360):
-            datetime_limit = timezone.now() - timedelta(day_limit)
-            nominations = await user.get_nomination_activity(datetime_limit)
-
-    elif year_limit_str:
-        year_limit = ensure_int(year_limit_str)
-        if year_limit:
-            dt_min = timezone.make_aware(datetime(year_limit, 1, 1))
-            dt_max = timezone.make_aware(datetime(year_limit + 1, 1, 1))
-            nominations = await user.get_nomination_activity(
-                date_min=dt_min, date_max=dt_max
-            )
-
-    if nominations is None:
-        nominations = await user.get_nomination_activity()
+    date_min, date_max = get_activity_window(request)
+    nominations = await user.get_nomination_activity(
+        date_min=date_min, date_max=date_max
+    )
 
     # No nominations present, what even to show?
     if not nominations:
         ctx = {"request": request, "user": user, "error": True, "title": user.username}
         return templates.TemplateResponse("pages/user/no_noms.html", ctx)
 
-    invalid_nominations = []
-    for nom in nominations:
-        nom.map = await nom.get_map()
+    await Nomination.attach_summaries(nominations)
 
-        # Map is deleted in osu!
-        if not nom.map.beatmaps:
-            invalid_nominations.append(nom)
+    # Map is deleted in osu!
+    nominations = [nom for nom in nominations if nom.summary]
 
-    for nom in invalid_nominations:
-        nominations.remove(nom)
-
-    graph_labels: Dict[str, List[str]] = {
-        "genre": [],
-        "language": [],
-        "sr-top": [],
-        "sr-all": [],
-    }
-    graph_data: Dict[str, List[int]] = {
-        "genre": [],
-        "language": [],
-        "sr-top": [],
-        "sr-all": [],
+    buckets = await ChartBucket.load(user.osuId, date_min, date_max)
+    graph_labels: Dict[str, List[str]] = {}
+    graph_data: Dict[str, List[int]] = {}
+    charts = {
+        "genre": ("genres", Genre),
+        "language": ("languages", Language),
+        "sr-top": ("top_difficulties", Difficulty),
+        "sr-all": ("difficulties", Difficulty),
     }
+    for name, (attr, enum) in charts.items():
+        graph_labels[name], graph_data[name] = _create_count_chartdata(
+            buckets, attr, enum
+        )
 
-    # Count for genres
-    counts_genre = Counter([nom.map.genre for nom in nominations])
-    for elem, cnt in counts_genre.items():
-        graph_labels["genre"].append(elem.name.replace("_", " "))
-        graph_data["genre"].append(cnt)
-
-    # Count for languages
-    counts_lang = Counter([nom.map.language for nom in nominations])
-    for elem, cnt in counts_lang.items():
-        graph_labels["language"].append(elem.name)
-        graph_data["language"].append(cnt)
-
-    # Count for difficulty
-    counts_top = list(
-        Counter([nom.map.top_difficulty.difficulty for nom in nominations]).items()
-    )
-    counts_top.sort(key=lambda x: x[0].value)
-    for elem, cnt in counts_top:
-        graph_labels["sr-top"].append(elem.name)
-        graph_data["sr-top"].append(cnt)
-
-    difficulties = []
-    for nom in nominations:
-        for bmap in nom.map.beatmaps:
-            difficulties.append(bmap.difficulty)
-
-    counts_diff = list(Counter(difficulties).items())
-    counts_diff.sort(key=lambda x: x[0].value)
-    for elem, cnt in counts_diff:
-        graph_labels["sr-all"].append(elem.name)
-        graph_data["sr-all"].append(cnt)
+    length_data = [0] * 6
+    for bucket in buckets:
+        length_data = [a + b for a, b in zip(length_data, bucket.lengths)]
 
-    line_labels, line_datas = _create_nomination_chartdata(nominations)
+    line_labels, line_datas = _create_nomination_chartdata(buckets)
 
     calc_system = request.scope["calculator"]
     user.score = await calc_system.get_user_score(user, activities=nominations)
@@ -231,11 +192,11 @@ async def show_user(request: Request):
         "labels": graph_labels,
         "datas": graph_data,
         "avg_length": format_time(user.avg_length),
-        "length_data": _create_length_chartdata(nominations),
+        "length_data": length_data,
         "line_labels": line_labels,
         "line_datas": line_datas,
         "last_update": user.last_updated,
         "title": user.username,
         "valid_years": valid_years,
     }
-    return templates.TemplateResponse("pages/user/show.html", ctx)
+    return await render("pages/user/show.html", ctx)
@@ -1,4 +1,5 @@
 # flake8: noqa
+from bnstats.routine.attribution import attribute_resets
 from bnstats.routine.fetchers import (
     fetch_events_api,
     fetch_events_interop,
@@ -6,8 +7,17 @@ from bnstats.routine.fetchers import (
     fetch_users_interop,
 )
 from bnstats.routine.workers import (
+    refresh_due_mapsets,
     update_events_db,
     update_maps_db,
+    update_mapset_db,
     update_user_details,
     update_users_db,
 )
+from bnstats.routine.pipeline import (
+    SCORE_DAYS,
+    IncrementalPipeline,
+    PopulatePipeline,
+    populate_users,
+    process_user,
+)
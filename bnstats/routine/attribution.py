@@ -0,0 +1,137 @@
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from pypika import Table
+from tortoise.transactions import in_transaction
+
+from bnstats.models import Nomination, Reset
+from bnstats.models.bulk import BATCH_SIZE
+
+logger = logging.getLogger("bnstats.routine")
+
+Link = Tuple[str, int]
+
+
+def reset_limit(reset: Reset) -> int:
+    """Get how many of the last nominators are affected by a reset.
+
+    Disqualifications affect both nominators, while pops only affect the last one.
+
+    Args:
+        reset (Reset): The reset.
+
+    Returns:
+        int: Number of affected nominators.
+    """
+    return 1 + (reset.type == "disqualify")
+
+
+async def attribute_resets(
+    resets: Sequence[Reset],
+    extra: Optional[Dict[str, Set[int]]] = None,
+    prune: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> Set[str]:
+    """Attribute resets to the last nominators of their beatmapset before them.
+
+    Instead of querying nominations for every reset, nominations of all
+    beatmapsets in a batch are loaded at once and matched in memory. The result
+    is compared with the existing `user_reset` rows, and only the difference is
+    written.
+
+    Args:
+        resets (Sequence[Reset]): Resets to attribute.
+        extra (Dict[str, Set[int]], optional): Other affected user IDs, keyed by
+            reset ID.
+        prune (bool, optional): Whether to remove users that are no longer
+            affected. Defaults to only adding them.
+        batch_size (int, optional): Maximum resets per batch. Defaults to 500.
+
+    Returns:
+        Set[str]: IDs of resets whose affected users changed.
+    """
+    extra = extra or {}
+    changed: Set[str] = set()
+    for i in range(0, len(resets), batch_size):
+        batch = resets[i : i + batch_size]
+
+        expected = await _get_nominators(batch)
+        for reset_id, user_ids in extra.items():
+            if reset_id in expected:
+                expected[reset_id] |= user_ids
+        existing = await _get_links([r.id for r in batch])
+
+        wanted = {(r, u) for r, users in expected.items() for u in users}
+        added = wanted - existing
+        removed = existing - wanted if prune else set()
+        await _apply_links(added, removed)
+        changed |= {r for r, _ in added | removed}
+
+    logger.info(f"Attributed {len(resets)} resets, {len(changed)} changed.")
+    return changed
+
+
+async def _get_nominators(resets: Sequence[Reset]) -> Dict[str, Set[int]]:
+    # Nominations of each beatmapset, sorted by time.
+    timestamps: Dict[int, List[datetime]] = defaultdict(list)
+    nominators: Dict[int, List[Optional[int]]] = defaultdict(list)
+    rows = (
+        await Nomination.filter(beatmapsetId__in={r.beatmapsetId for r in resets})
+        .order_by("timestamp")
+        .values_list("beatmapsetId", "timestamp", "user_id")
+    )
+    for beatmapset_id, timestamp, user_id in rows:
+        timestamps[beatmapset_id].append(timestamp)
+        nominators[beatmapset_id].append(user_id)
+
+    affected: Dict[str, Set[int]] = {}
+    for reset in resets:
+        end = bisect_left(timestamps[reset.beatmapsetId], reset.timestamp)
+        start = max(0, end - reset_limit(reset))
+        users = nominators[reset.beatmapsetId][start:end]
+        affected[reset.id] = {u for u in users if u is not None}
+    return affected
+
+
+def _through() -> Tuple[Table, str, str]:
+    field = Reset._meta.fields_map["user_affected"]
+    return Table(field.through), field.backward_key, field.forward_key
+
+
+async def _get_links(reset_ids: List[str]) -> Set[Link]:
+    table, reset_key, user_key = _through()
+    db = Reset._meta.db
+    query = (
+        db.query_class.from_(table)
+        .select(table[reset_key], table[user_key])
+        .where(table[reset_key].isin(reset_ids))
+    )
+    _, rows = await db.execute_query(str(query))
+    return {(row[reset_key], row[user_key]) for row in rows}
+
+
+async def _apply_links(added: Set[Link], removed: Set[Link]):
+    if not added and not removed:
+        return
+
+    table, reset_key, user_key = _through()
+    async with in_transaction(Reset._meta.default_connection) as db:
+        executor = db.executor_class(model=Reset, db=db)
+        if added:
+            query = (
+                db.query_class.into(table)
+                .columns(reset_key, user_key)
+                .insert(executor.parameter(0), executor.parameter(1))
+            )
+            await db.execute_many(str(query), [list(link) for link in added])
+        if removed:
+            query = (
+                db.query_class.from_(table)
+                .where(table[reset_key] == executor.parameter(0))
+                .where(table[user_key] == executor.parameter(1))
+                .delete()
+            )
+            await db.execute_many(str(query), [list(link) for link in removed])
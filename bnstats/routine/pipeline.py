@@ -0,0 +1,302 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from tortoise import timezone
+
+from bnstats.bnsite.request import client
+from bnstats.models import BeatmapSet, Nomination, User
+from bnstats.routine.workers import (
+    update_events_db,
+    update_maps_db,
+    update_user_details,
+    update_users_db,
+)
+from bnstats.score import calculate_user_scores
+from bnstats.score.invalidation import recalculate_dirty
+
+logger = logging.getLogger("bnstats.routine")
+
+UserActivity = Tuple[User, List[Nomination]]
+
+# Days of events scores are calculated from.
+SCORE_DAYS = 90
+
+# How often unranked maps of a user are checked for changes in incremental mode.
+MAP_CHECK_INTERVAL = timedelta(hours=6)
+
+# Marks the end of a stage's input.
+_DONE = object()
+
+
+def _nominated_maps(nominations: List[Nomination]) -> List[BeatmapSet]:
+    # Maps deleted from osu! have no difficulties left to count.
+    return [nom.map for nom in nominations if nom.map and nom.map.beatmaps]
+
+
+class PopulatePipeline:
+    """Populate users with concurrent stages.
+
+    Every user goes through three stages, connected with bounded queues so that
+    a fast stage can't run too far ahead of a slow one:
+
+    1. Fetching nomination activities from BN site.
+    2. Fetching the nominated beatmapsets from osu! API.
+    3. Updating user details and scores in database.
+
+    Each beatmapset is only fetched once per run, even if it is nominated by
+    multiple users.
+    """
+
+    def __init__(
+        self,
+        days: int,
+        bnsite_concurrency: int = 2,
+        osu_concurrency: int = 4,
+        queue_size: int = 8,
+    ):
+        """Initializes PopulatePipeline.
+
+        Args:
+            days (int): Number of days of events to fetch.
+            bnsite_concurrency (int, optional): Maximum concurrent requests to BN site.
+                Defaults to 2.
+            osu_concurrency (int, optional): Maximum concurrent requests to osu! API.
+                Defaults to 4.
+            queue_size (int, optional): Maximum users waiting between stages.
+                Defaults to 8.
+        """
+        self.days = days
+        self.bnsite_concurrency = bnsite_concurrency
+        self.osu_concurrency = osu_concurrency
+        self.queue_size = queue_size
+
+        self._osu_limit: Optional[asyncio.Semaphore] = None
+        self._mapsets: Dict[int, "asyncio.Future[BeatmapSet]"] = {}
+
+    async def run(self, users: List[User]):
+        """Populate the given users.
+
+        Nominations marked dirty during the run are recalculated afterwards. If any
+        of the stages fails, the rest of the pipeline will be cancelled and the
+        exception is reraised.
+
+        Args:
+            users (List[User]): Users to be populated.
+        """
+        self._osu_limit = asyncio.Semaphore(self.osu_concurrency)
+        events_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        maps_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        db_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        tasks = [
+            asyncio.ensure_future(self._produce(users, events_queue)),
+            asyncio.ensure_future(
+                self._stage(
+                    self._fetch_events,
+                    self.bnsite_concurrency,
+                    events_queue,
+                    maps_queue,
+                    self.osu_concurrency,
+                )
+            ),
+            asyncio.ensure_future(
+                self._stage(
+                    self._fetch_maps, self.osu_concurrency, maps_queue, db_queue, 1
+                )
+            ),
+            # Database writes are done one user at a time.
+            asyncio.ensure_future(self._stage(self._update_user, 1, db_queue)),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for t in tasks + list(self._mapsets.values()):
+                t.cancel()
+            raise
+        finally:
+            self._mapsets.clear()
+
+        logger.info("Recalculating dirty nominations")
+        await recalculate_dirty()
+
+    async def _produce(self, users: List[User], target: asyncio.Queue):
+        for u in users:
+            await target.put(u)
+        for _ in range(self.bnsite_concurrency):
+            await target.put(_DONE)
+
+    async def _stage(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        workers: int,
+        source: asyncio.Queue,
+        target: Optional[asyncio.Queue] = None,
+        target_workers: int = 0,
+    ):
+        async def worker():
+            while True:
+                item = await source.get()
+                if item is _DONE:
+                    return
+
+                result = await handler(item)
+                if target is not None:
+                    await target.put(result)
+
+        await asyncio.gather(*[worker() for _ in range(workers)])
+        if target is not None:
+            for _ in range(target_workers):
+                await target.put(_DONE)
+
+    async def _fetch_events(self, u: User) -> UserActivity:
+        logger.info(f"Populating {u.username}")
+        await update_events_db(u, self.days)
+
+        nominations = await u.get_nomination_activity()
+        await Nomination.attach_maps(nominations)
+        return u, nominations
+
+    async def _fetch_maps(self, item: UserActivity) -> UserActivity:
+        u, nominations = item
+        logger.info(f"Fetching maps for user: {u.username}")
+        mapsets = await asyncio.gather(*[self._get_mapset(nom) for nom in nominations])
+        for nom, mapset in zip(nominations, mapsets):
+            nom.map = mapset
+        return u, nominations
+
+    def _get_mapset(self, nom: Nomination) -> "asyncio.Future[BeatmapSet]":
+        task = self._mapsets.get(nom.beatmapsetId)
+        if task is None:
+            task = asyncio.ensure_future(self._update_mapset(nom))
+            self._mapsets[nom.beatmapsetId] = task
+        return task
+
+    async def _update_mapset(self, nom: Nomination) -> BeatmapSet:
+        assert self._osu_limit
+        async with self._osu_limit:
+            return await update_maps_db(nom, nom.map)
+
+    async def _update_user(self, item: UserActivity):
+        u, nominations = item
+        nominated_maps = _nominated_maps(nominations)
+        if nominated_maps:
+            logger.info("Updating user information")
+            await update_user_details(u, nominated_maps)
+
+        logger.info("Recalculating score")
+        await calculate_user_scores(u)
+
+
+class IncrementalPipeline(PopulatePipeline):
+    """Populate only what changed since the users' last population.
+
+    Events are fetched starting from the user's `last_event_at` watermark, up to
+    `SCORE_DAYS` back, so missed runs are caught up on. Users without a watermark
+    get the given number of days. Unranked maps are only rechecked every
+    `MAP_CHECK_INTERVAL`. Changed events and maps mark the affected nominations
+    dirty, which are recalculated at the end of the run.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._changed: Dict[int, Set[int]] = {}
+
+    async def _fetch_events(self, u: User) -> UserActivity:
+        days = self.days
+        if u.last_event_at:
+            # Overlap a day in case events show up late on BN site.
+            days = min(SCORE_DAYS, (timezone.now() - u.last_event_at).days + 2)
+
+        logger.info(f"Populating {u.username} for the last {days} days")
+        nominations_changed, resets_changed = await update_events_db(u, days)
+
+        nominations = await u.get_nomination_activity()
+        await Nomination.attach_maps(nominations)
+        if nominations_changed or resets_changed:
+            self._changed[u.osuId] = {nom.id for nom in nominations_changed}
+
+        timestamps = [e.timestamp for e in nominations_changed + resets_changed]
+        if u.last_event_at:
+            timestamps.append(u.last_event_at)
+        if timestamps:
+            u.last_event_at = max(timestamps)
+        return u, nominations
+
+    async def _fetch_maps(self, item: UserActivity) -> UserActivity:
+        u, nominations = item
+        changed = self._changed.get(u.osuId, set())
+
+        now = timezone.now()
+        check_all = (
+            not u.maps_checked_at or now - u.maps_checked_at >= MAP_CHECK_INTERVAL
+        )
+        targets = [nom for nom in nominations if check_all or nom.id in changed]
+        if targets:
+            logger.info(f"Fetching {len(targets)} maps for user: {u.username}")
+            mapsets = await asyncio.gather(*[self._get_mapset(nom) for nom in targets])
+            for nom, mapset in zip(targets, mapsets):
+                nom.map = mapset
+
+        if check_all:
+            u.maps_checked_at = now
+            self._changed.setdefault(u.osuId, set())
+        return u, nominations
+
+    async def _update_user(self, item: UserActivity):
+        u, nominations = item
+        nominated_maps = _nominated_maps(nominations)
+        if self._changed.pop(u.osuId, None) is not None and nominated_maps:
+            logger.info("Updating user information")
+            await update_user_details(u, nominated_maps)
+
+        await u.save(update_fields=["last_event_at", "maps_checked_at"])
+
+
+async def populate_users(
+    days: int,
+    incremental: bool = False,
+    skip_former: bool = False,
+    bnsite_concurrency: int = 2,
+    osu_concurrency: int = 4,
+):
+    """Update the user list from BN site, then populate every user.
+
+    Args:
+        days (int): Number of days of events to fetch. Incremental runs only use it
+            for users that were never populated.
+        incremental (bool, optional): Whether to use `IncrementalPipeline`.
+            Defaults to False.
+        skip_former (bool, optional): Whether to skip former users. Defaults to False.
+        bnsite_concurrency (int, optional): Maximum concurrent requests to BN site.
+            Defaults to 2.
+        osu_concurrency (int, optional): Maximum concurrent requests to osu! API.
+            Defaults to 4.
+    """
+    users = await update_users_db(touch_unchanged=not incremental)
+
+    if skip_former:
+        for u in users:
+            if not u.isBn and not u.isNat:
+                logger.info(f">> Skipping former BN: {u.username}")
+        users = [u for u in users if u.isBn or u.isNat]
+
+    logger.info(f"Populating {len(users)} users...")
+    pipeline_type = IncrementalPipeline if incremental else PopulatePipeline
+    pipeline = pipeline_type(days, bnsite_concurrency, osu_concurrency)
+    await pipeline.run(users)
+
+    for host, metrics in client.metrics.items():
+        logger.info(f"Requests to {host}: {metrics.to_json()}")
+
+
+async def process_user(u: User, days: int):
+    """Populate a single user.
+
+    Args:
+        u (User): User to be populated.
+        days (int): Number of days of events to fetch.
+    """
+    await PopulatePipeline(days).run([u])
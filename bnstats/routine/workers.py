@@ -1,27 +1,53 @@
+import asyncio
 from collections import Counter
 import json
 import logging
-from typing import List
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urlencode
 
 from dateutil.parser import parse
 from tortoise import timezone
 
-from bnstats.bnsite.enums import MapStatus
-from bnstats.bnsite.request import get
+from bnstats.cache import USERS_ENTITY, cache, user_entity
+from bnstats.bnsite.request import cached_get
 from bnstats.config import API_KEY, USE_AIESS, USE_INTEROP
 from bnstats.helper import mode_to_db
-from bnstats.models import Beatmap, BeatmapSet, Nomination, Reset, User
+from bnstats.models import (
+    Beatmap,
+    BeatmapSet,
+    ChartBucket,
+    MapsetInfo,
+    MapsetSummary,
+    Nomination,
+    Reset,
+    User,
+)
+from bnstats.models.bulk import bulk_upsert
 from bnstats.routine.fetchers import (
     fetch_events_api,
     fetch_events_interop,
     fetch_users_api,
     fetch_users_interop,
 )
+from bnstats.routine.attribution import attribute_resets
 from bnstats.routine.constants import API_URL
+from bnstats.score.invalidation import (
+    invalidate_mapsets,
+    invalidate_nominations,
+    invalidate_resets,
+)
+from bnstats.singleflight import single_flight
 
 logger = logging.getLogger("bnstats.routine")
 
+# Fields of a difficulty refreshed from osu! API.
+BEATMAP_UPDATE_FIELDS = [
+    f for f in Beatmap._meta.fields_db_projection if f not in ("id", "beatmap_id")
+]
+# Beatmapset, user and time identifying a reset.
+ResetKey = Tuple[int, int, datetime]
+
 
 async def reconnect_relations(user: User):
     logger.info(f"Reconnecting relations for user {user.username}")
@@ -31,7 +57,19 @@ async def reconnect_relations(user: User):
         await nom.save()
 
 
-async def update_users_db():
+@single_flight(lambda touch_unchanged=True: touch_unchanged)
+async def update_users_db(touch_unchanged: bool = True):
+    """Update users from BN site.
+
+    Concurrent calls share a single update.
+
+    Args:
+        touch_unchanged (bool, optional): Whether to save users whose data didn't
+            change, bumping their `last_updated`. Defaults to True.
+
+    Returns:
+        List[User]: All current users.
+    """
     if USE_INTEROP:
         fetcher = fetch_users_interop
     else:
@@ -54,6 +92,7 @@ async def update_users_db():
 
     logger.info("Updating users.")
     users: List[User] = []
+    changed = False
     for u in r:
         # HACK: This is for no mode NAT. They can nominate anything, so they will be given any modes.
         if "none" in u["modes"]:
@@ -65,8 +104,12 @@ async def update_users_db():
             ]
             u["modes"] = ["mania", "osu", "taiko", "catch"]
 
-        u["last_updated"] = timezone.now()
         user = await User.get_or_none(osuId=u["osuId"])
+        if user and not touch_unchanged and not _user_changed(user, u):
+            users.append(user)
+            continue
+
+        u["last_updated"] = timezone.now()
         if user:
             logger.debug(f"Updating user: {user.username}")
             user.update_from_dict(u)
@@ -77,41 +120,156 @@ async def update_users_db():
             await reconnect_relations(user)
 
         users.append(user)
+        changed = True
+
+    if changed:
+        await cache.bump(USERS_ENTITY)
     return users
 
 
-async def _insert_reset_event(event):
-    event["id"] = event["_id"]
-    event["timestamp"] = parse(event["timestamp"])
+def _user_changed(user: User, data: dict) -> bool:
+    for k, v in data.items():
+        if k in User._meta.fields_map and getattr(user, k) != v:
+            return True
+    return False
+
+
+async def _upsert_nominations(events: List[dict]) -> List[Nomination]:
+    """Save nomination events in bulk.
 
-    # Hack because pishi mongodb zzz
-    if "obviousness" in event and not event["obviousness"]:
-        event["obviousness"] = 0
-    if "severity" in event and not event["severity"]:
-        event["severity"] = 0
+    Args:
+        events (List[dict]): Parsed nomination events, with their `as_modes`.
 
-    db_event = await Reset.get_or_none(
-        beatmapsetId=event["beatmapsetId"],
-        userId=event["userId"],
-        timestamp=event["timestamp"],
+    Returns:
+        List[Nomination]: Nominations that were created or changed.
+    """
+    existing = await _get_nominations((e["beatmapsetId"], e["userId"]) for e in events)
+
+    upserts: List[Nomination] = []
+    for event in events:
+        nom_event = existing.get((event["beatmapsetId"], event["userId"]))
+        if not nom_event:
+            logger.info(
+                f"Creating new nomination event: {event['userId']} for mapset {event['beatmapsetId']}"
+            )
+            upserts.append(Nomination(**event))
+        elif nom_event.as_modes != event["as_modes"]:
+            nom_event.as_modes = event["as_modes"]
+            nom_event.update_mode_mask()
+            upserts.append(nom_event)
+
+    await bulk_upsert(
+        Nomination, upserts, ("beatmapsetId", "userId"), ("as_modes", "mode_mask")
     )
-    if not db_event:
-        logger.info(
-            f"Creating reset event: {event['userId']} for mapset {event['beatmapsetId']}"
-        )
-        db_event = await Reset.create(**event)
-    else:
+    changed = await _get_nominations((n.beatmapsetId, n.userId) for n in upserts)
+    return list(changed.values())
+
+
+async def _get_nominations(
+    keys: Iterable[Tuple[int, int]]
+) -> Dict[Tuple[int, int], Nomination]:
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    nominations = await Nomination.filter(
+        beatmapsetId__in={k[0] for k in keys}, userId__in={k[1] for k in keys}
+    )
+    return {
+        (n.beatmapsetId, n.userId): n
+        for n in nominations
+        if (n.beatmapsetId, n.userId) in keys
+    }
+
+
+async def _get_resets(keys: Iterable[ResetKey]) -> Dict[ResetKey, Reset]:
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    resets = await Reset.filter(
+        beatmapsetId__in={k[0] for k in keys}, userId__in={k[1] for k in keys}
+    )
+    return {
+        (r.beatmapsetId, r.userId, r.timestamp): r
+        for r in resets
+        if (r.beatmapsetId, r.userId, r.timestamp) in keys
+    }
+
+
+async def _upsert_resets(events: List[dict]) -> Tuple[Dict[str, Reset], Set[str]]:
+    """Save reset events in bulk.
+
+    Resets are identified by their beatmapset, user and time, like AIESS does, as
+    resets from AIESS don't have the ID used by BN site. Every event's `id` is
+    replaced by the ID of the saved reset.
+
+    Args:
+        events (List[dict]): Reset events from BN site, which will be parsed in place.
+
+    Returns:
+        Tuple[Dict[str, Reset], Set[str]]: Every reset keyed by its ID, and IDs of
+            resets that were created or changed.
+    """
+    for event in events:
+        event["id"] = event["_id"]
+        event["timestamp"] = parse(event["timestamp"])
+
+        # Hack because pishi mongodb zzz
+        if "obviousness" in event and not event["obviousness"]:
+            event["obviousness"] = 0
+        if "severity" in event and not event["severity"]:
+            event["severity"] = 0
+
+    def key(event: dict) -> ResetKey:
+        return event["beatmapsetId"], event["userId"], event["timestamp"]
+
+    keys = {key(event) for event in events}
+    existing = await _get_resets(keys)
+
+    upserts: Dict[ResetKey, Reset] = {}
+    for event in events:
+        db_event = existing.get(key(event))
+        if not db_event:
+            logger.info(
+                f"Creating reset event: {event['userId']} for mapset {event['beatmapsetId']}"
+            )
+            upserts[key(event)] = Reset(**event)
+            continue
+
         update_data = {
             "obviousness": event["obviousness"] if "obviousness" in event else 0,
             "severity": event["severity"] if "severity" in event else 0,
         }
-        db_event.update_from_dict(update_data)
-        await db_event.save()
+        if any(getattr(db_event, k) != v for k, v in update_data.items()):
+            db_event.update_from_dict(update_data)
+            upserts[key(event)] = db_event
+
+    await bulk_upsert(
+        Reset,
+        list(upserts.values()),
+        ("beatmapsetId", "userId", "timestamp"),
+        ("obviousness", "severity"),
+    )
+    resets = await _get_resets(keys)
+    for event in events:
+        event["id"] = resets[key(event)].id
+    return {r.id: r for r in resets.values()}, {resets[k].id for k in upserts}
 
-    return db_event
 
+async def update_events_db(
+    user: User, days: int = 90
+) -> Tuple[List[Nomination], List[Reset]]:
+    """Fetch user's events from BN site and save them to database.
 
-async def update_events_db(user: User, days: int = 90):
+    Args:
+        user (User): User whose events will be fetched.
+        days (int, optional): Number of days of events to fetch. Defaults to 90.
+
+    Returns:
+        Tuple[List[Nomination], List[Reset]]: Nominations and resets that were
+            created or changed.
+    """
     if USE_INTEROP:
         fetcher = fetch_events_interop
     else:
@@ -123,10 +281,6 @@ async def update_events_db(user: User, days: int = 90):
         activities["uniqueNominations"] = []
 
     for event in activities["uniqueNominations"]:
-        nom_event = await Nomination.get_or_none(
-            beatmapsetId=event["beatmapsetId"],
-            userId=event["userId"],
-        )
         event["timestamp"] = parse(event["timestamp"])
         event["user"] = user
 
@@ -134,69 +288,136 @@ async def update_events_db(user: User, days: int = 90):
         for mode in user.modes:
             if mode in event["modes"]:
                 nomination_modes.append(mode_to_db(mode))
-
         event["as_modes"] = nomination_modes
-        if not nom_event:
-            logger.info(
-                f"Creating new nomination event: {event['userId']} for mapset {event['beatmapsetId']}"
-            )
-            nom_event = await Nomination.create(**event)
-        else:
-            nom_event.update_from_dict({"as_modes": nomination_modes})
-            await nom_event.save()
+    changed_nominations = await _upsert_nominations(activities["uniqueNominations"])
+    await ChartBucket.refresh(changed_nominations)
 
     resets = activities["nominationsDisqualified"] + activities["nominationsPopped"]
-    for event in resets:
-        reset_event = await _insert_reset_event(event)
+    resets_done = activities["disqualifications"] + activities["pops"]
+    reset_events, changed_ids = await _upsert_resets(resets + resets_done)
+
+    # Resets of the user's nominations always affect the user.
+    own_resets = {event["id"]: {user.osuId} for event in resets}
+    changed_ids |= await attribute_resets(list(reset_events.values()), own_resets)
+    changed_resets = [r for r in reset_events.values() if r.id in changed_ids]
+
+    await invalidate_nominations(changed_nominations)
+    await invalidate_resets(changed_resets)
+    if changed_nominations:
+        await cache.bump(USERS_ENTITY)
+    if changed_nominations or changed_resets:
+        await cache.bump(user_entity(user.osuId))
+    return changed_nominations, changed_resets
+
+
+async def update_maps_db(nomination: Nomination, mapset: Optional[BeatmapSet] = None):
+    if mapset is None:
+        mapset = await nomination.get_map()
+    return await update_mapset_db(nomination.beatmapsetId, mapset)
+
+
+@single_flight(lambda beatmapset_id, *args, **kwargs: beatmapset_id)
+async def update_mapset_db(
+    beatmapset_id: int,
+    mapset: Optional[BeatmapSet] = None,
+    info: Optional[MapsetInfo] = None,
+) -> BeatmapSet:
+    """Refetch a beatmapset from osu! API, if it is due for a refresh.
+
+    Args:
+        beatmapset_id (int): ID of the beatmapset.
+        mapset (BeatmapSet, optional): The beatmapset currently in database. Defaults
+            to loading it.
+        info (MapsetInfo, optional): The beatmapset's freshness. Defaults to loading
+            it.
+
+    Returns:
+        BeatmapSet: The up to date beatmapset.
+    """
+    if mapset is None:
+        mapset = (await BeatmapSet.load_many([beatmapset_id]))[beatmapset_id]
+    if info is None:
+        info = await MapsetInfo.get_or_none(beatmapset_id=beatmapset_id)
+
+    db_result = mapset.beatmaps
+    if info:
+        due = info.is_due()
+    else:
+        # Not fetched since freshness is tracked, go by what database has.
+        status = db_result[0].approved if db_result else None
+        due = not db_result or MapsetInfo.refresh_interval(status) is not None
+    if not due:
+        return mapset
+
+    old_state = _mapset_state(mapset)
+    query = {"k": API_KEY, "s": beatmapset_id}
+    url = API_URL + "/get_beatmaps?" + urlencode(query)
+    logger.info(f"Fetching osu! for beatmapset: {beatmapset_id}")
+    r = await cached_get(url, "beatmaps", f"beatmaps:{beatmapset_id}")
+
+    diffs = [Beatmap(**bmap) for bmap in r]
+    await bulk_upsert(Beatmap, diffs, ("beatmap_id",), BEATMAP_UPDATE_FIELDS)
+    db_result = await Beatmap.filter(
+        beatmap_id__in=[d.beatmap_id for d in diffs]
+    ).order_by("id")
+
+    status = db_result[0].approved if db_result else None
+    await MapsetInfo.update_or_create(
+        {"approved": status, "last_fetched": timezone.now()},
+        beatmapset_id=beatmapset_id,
+    )
 
-        await reset_event.fetch_related("user_affected")
-        if user and user not in reset_event.user_affected:
-            await reset_event.user_affected.add(user)
+    mapset = BeatmapSet(db_result)
+    await MapsetSummary.refresh({beatmapset_id: mapset})
+    if _mapset_state(mapset) != old_state:
+        await invalidate_mapsets([beatmapset_id])
+        await ChartBucket.refresh(await Nomination.filter(beatmapsetId=beatmapset_id))
+    return mapset
 
-    resets_done = activities["disqualifications"] + activities["pops"]
-    for event in resets_done:
-        reset_event = await _insert_reset_event(event)
-
-        await reset_event.fetch_related("user_affected")
-        map_nominations = await Nomination.filter(
-            beatmapsetId=event["beatmapsetId"],
-            timestamp__lt=event["timestamp"]
-        ).order_by("-timestamp")
-        limit = 1 + (reset_event.type == "disqualify")
-
-        for nom in map_nominations[:limit]:
-            nominator = await nom.user
-            if nominator and nominator not in reset_event.user_affected:
-                await reset_event.user_affected.add(nominator)
-
-        await reset_event.save()
-
-
-async def update_maps_db(nomination: Nomination):
-    db_result = await Beatmap.filter(beatmapset_id=nomination.beatmapsetId).all()
-
-    if not db_result or db_result[0].status not in [
-        MapStatus.Approved,
-        MapStatus.Ranked,
-    ]:
-        query = {"k": API_KEY, "s": nomination.beatmapsetId}
-        url = API_URL + "/get_beatmaps?" + urlencode(query)
-        logger.info(f"Fetching osu! for beatmapset: {nomination.beatmapsetId}")
-        r = await get(url)
-
-        db_result: List[Beatmap] = []  # type: ignore
-        for bmap in r:
-            db_diff = await Beatmap.filter(beatmap_id=bmap["beatmap_id"]).get_or_none()
-
-            if not db_diff:
-                logger.info(f"Creating Beatmap entry for beatmap: {bmap['beatmap_id']}")
-                db_diff = await Beatmap.create(**bmap)
-            else:
-                logger.info(f"Updating Beatmap entry for beatmap: {bmap['beatmap_id']}")
-                db_diff.update_from_dict(bmap)
-                await db_diff.save()
-            db_result.append(db_diff)
-    return BeatmapSet(db_result)
+
+async def refresh_due_mapsets(limit: int = 200) -> int:
+    """Refetch beatmapsets that are due for a refresh, oldest first.
+
+    Args:
+        limit (int, optional): Maximum beatmapsets to refetch. Defaults to 200.
+
+    Returns:
+        int: Number of refetched beatmapsets.
+    """
+    infos = (
+        await MapsetInfo.filter(MapsetInfo.due_filter())
+        .order_by("last_fetched")
+        .limit(limit)
+    )
+    if not infos:
+        return 0
+
+    logger.info(f"Refreshing {len(infos)} due beatmapsets.")
+    mapsets = await BeatmapSet.load_many(info.beatmapset_id for info in infos)
+    # Requests are limited by the upstream client, so fetch them all at once.
+    await asyncio.gather(
+        *[
+            update_mapset_db(info.beatmapset_id, mapsets[info.beatmapset_id], info)
+            for info in infos
+        ]
+    )
+    return len(infos)
+
+
+def _mapset_state(mapset: BeatmapSet) -> List[Tuple[int, ...]]:
+    return sorted(
+        (
+            b.beatmap_id,
+            b.approved,
+            b.mode,
+            b.hit_length,
+            b.total_length,
+            b.difficultyrating,
+            b.genre_id,
+            b.language_id,
+        )
+        for b in mapset.beatmaps
+    )
 
 
 async def update_user_details(user: User, maps: List[BeatmapSet]):
@@ -278,3 +499,4 @@ async def update_user_details(user: User, maps: List[BeatmapSet]):
     }
     user.update_from_dict(updates)
     await user.save()
+    await cache.bump(USERS_ENTITY, user_entity(user.osuId))
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger("bnstats.scheduler")
+
+JobFunction = Callable[[], Awaitable[None]]
+
+
+class Job:
+    """A function ran periodically by the scheduler."""
+
+    def __init__(
+        self,
+        name: str,
+        func: JobFunction,
+        interval: float,
+        lock: str,
+        initial_delay: float,
+        jitter: float,
+        retry_delay: float,
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.lock = lock
+        self.initial_delay = initial_delay
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.failures = 0
+
+    def next_delay(self) -> float:
+        """Get the delay until the next run.
+
+        Failed jobs are retried with exponential backoff, but never later than
+        their usual interval.
+
+        Returns:
+            float: The delay in seconds, with jitter applied.
+        """
+        if self.failures:
+            delay = min(self.interval, self.retry_delay * 2 ** (self.failures - 1))
+        else:
+            delay = self.interval
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class Scheduler:
+    """Run periodic jobs inside the application's event loop.
+
+    Jobs sharing the same lock never run at the same time. If a job is due while
+    its lock is held, the run is skipped instead of queued, so slow jobs don't
+    pile up.
+    """
+
+    def __init__(self):
+        self.jobs: List[Job] = []
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def add_job(
+        self,
+        name: str,
+        func: JobFunction,
+        interval: float,
+        lock: Optional[str] = None,
+        initial_delay: Optional[float] = None,
+        jitter: float = 0.1,
+        retry_delay: float = 60,
+    ) -> Job:
+        """Register a periodic job.
+
+        Args:
+            name (str): Name of the job, used in logs.
+            func (JobFunction): Coroutine function to be ran.
+            interval (float): Seconds between runs.
+            lock (str, optional): Name of the lock the job holds while running.
+                Defaults to a lock of its own.
+            initial_delay (float, optional): Seconds before the first run. Defaults
+                to the interval.
+            jitter (float, optional): Maximum fraction of the delay to randomly add
+                or remove. Defaults to 0.1.
+            retry_delay (float, optional): Seconds before retrying the first failure,
+                doubled on every consecutive failure. Defaults to 60.
+
+        Returns:
+            Job: The registered job.
+        """
+        if initial_delay is None:
+            initial_delay = interval
+
+        job = Job(
+            name,
+            func,
+            interval,
+            lock or name,
+            initial_delay,
+            jitter,
+            retry_delay,
+        )
+        self.jobs.append(job)
+        return job
+
+    async def run_job(self, job: Job) -> bool:
+        """Run a job once, unless its lock is held.
+
+        Exceptions are logged and counted for the job's backoff.
+
+        Args:
+            job (Job): Job to be ran.
+
+        Returns:
+            bool: Whether the job ran successfully.
+        """
+        lock = self._locks.setdefault(job.lock, asyncio.Lock())
+        if lock.locked():
+            logger.info(f"Skipping job {job.name}, lock {job.lock} is held.")
+            return False
+
+        async with lock:
+            logger.info(f"Running job {job.name}.")
+            try:
+                await job.func()
+            except Exception:
+                job.failures += 1
+                logger.exception(f"Job {job.name} failed ({job.failures} in a row).")
+                return False
+
+        job.failures = 0
+        logger.info(f"Job {job.name} finished.")
+        return True
+
+    async def _loop(self, job: Job):
+        delay = job.initial_delay
+        while True:
+            await asyncio.sleep(delay)
+            await self.run_job(job)
+            delay = job.next_delay()
+
+    async def start(self):
+        """Start running every registered job."""
+        logger.info(f"Starting scheduler with {len(self.jobs)} jobs.")
+        self._tasks = [asyncio.ensure_future(self._loop(job)) for job in self.jobs]
+
+    async def stop(self):
+        """Cancel every job, including the running ones."""
+        logger.info("Stopping scheduler.")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -1,6 +1,14 @@
-from typing import Dict, Optional, Type
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Type
 
-from bnstats.score.base import CalculatorABC
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from bnstats.cache import SCORES_ENTITY, cache, leaderboard_entity, user_entity
+from bnstats.models import LeaderboardEntry, Nomination, User
+from bnstats.models.tables import MODE_CONVERTER
+from bnstats.score.base import CalculatorABC, save_nomination_scores
+from bnstats.score.context import ScoringContext
 from bnstats.score.naxess import NaxessCalculator
 from bnstats.score.ren import RenCalculator
 
@@ -20,3 +28,97 @@ def get_system(name: str) -> Optional[Type[CalculatorABC]]: # noqa
     """
     return _AVAILABLE.get(name)
 # fmt: on
+
+
+async def calculate_user_scores(
+    user: User,
+    systems: Optional[Iterable[str]] = None,
+    nominations: Optional[List[Nomination]] = None,
+):
+    """Calculate user's nominations with multiple systems and save them at once.
+
+    Every system shares the same prefetched data, and the results of all systems
+    are written with a single bulk update.
+
+    Args:
+        user (User): User to be calculated.
+        systems (Iterable[str], optional): Names of the systems to calculate with.
+            Defaults to every available system.
+        nominations (List[Nomination], optional): Only calculate these nominations.
+            Defaults to all of the user's nominations from the last 90 days.
+    """
+    d = timezone.now() - timedelta(90)
+    if nominations is None:
+        activity = await user.get_nomination_activity(d)
+    else:
+        activity = [nom for nom in nominations if nom.timestamp >= d]
+    context = await ScoringContext.load(activity, user)
+
+    scored: Dict[int, Nomination] = {}
+    for name in systems or _AVAILABLE.keys():
+        calc_system = _AVAILABLE[name]()
+        for nom, _ in calc_system.score_activity(activity, context):
+            scored[nom.id] = nom
+
+    await save_nomination_scores(list(scored.values()))
+    await refresh_leaderboard(user, activity if nominations is None else None)
+
+
+async def refresh_leaderboard(
+    user: User,
+    activity: Optional[List[Nomination]] = None,
+    systems: Optional[Iterable[str]] = None,
+):
+    """Recompute the user's leaderboard entries from the saved nomination scores.
+
+    Args:
+        user (User): User whose entries will be refreshed.
+        activity (List[Nomination], optional): The user's nominations from the last
+            90 days. Defaults to fetching them from database.
+        systems (Iterable[str], optional): Names of the systems to refresh. Defaults
+            to every available system.
+    """
+    if activity is None:
+        d = timezone.now() - timedelta(90)
+        activity = await user.get_nomination_activity(d)
+
+    entries: List[LeaderboardEntry] = []
+    for name in systems or _AVAILABLE.keys():
+        calc_system = _AVAILABLE[name]()
+        scored = [nom for nom in activity if "total_score" in nom.score[name]]
+
+        modes = [""] + list(user.modes)
+        mode_activities = []
+        for mode in modes:
+            mode_activity = scored
+            if mode:
+                mode_value = MODE_CONVERTER[mode]
+                mode_activity = [
+                    nom for nom in scored if mode_value in (nom.as_modes or [])
+                ]
+            mode_activities.append(mode_activity)
+
+        scores = calc_system.get_activity_scores(mode_activities)
+        for mode, score in zip(modes, scores):
+            entries.append(
+                LeaderboardEntry(
+                    user=user,
+                    calculator=name,
+                    mode=mode,
+                    total_score=score.total_score,
+                    attribs=score.attribs,
+                )
+            )
+
+    async with in_transaction(LeaderboardEntry._meta.default_connection):
+        await LeaderboardEntry.filter(
+            user_id=user.osuId, calculator__in=[e.calculator for e in entries]
+        ).delete()
+        await LeaderboardEntry.bulk_create(entries)
+
+    calculators = {e.calculator for e in entries}
+    await cache.bump(
+        SCORES_ENTITY,
+        user_entity(user.osuId),
+        *map(leaderboard_entity, calculators),
+    )
@@ -1,12 +1,24 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from tortoise import timezone
 
 from bnstats.bnsite.enums import Mode
+from bnstats.cache import SCORES_ENTITY, cache, user_entity
 from bnstats.models import BeatmapSet, Nomination, User
+from bnstats.models.bulk import bulk_update
+from bnstats.score.context import ScoringContext
+from bnstats.score.kernel import (
+    Groups,
+    MapsetArrays,
+    NominationArrays,
+    pack,
+    pack_mapsets,
+    pack_nominations,
+)
 from bnstats.score.object import Score
 
 logger = logging.getLogger("bnstats.score")
@@ -18,16 +30,87 @@ class CalculatorABC(ABC):
     This class must be used as function standardization in order for consistent
     code style.
 
-    `name`, `has_weight`, `calculate_mapset`, and `calculate_nomination`
-    must be overriden for the derived classes.
+    `name`, `has_weight`, `parameters`, `mapset_scores`, `score_nominations`, and
+    `activity_scores` must be overriden for the derived classes. They calculate
+    many beatmapsets, nominations, or activities at once with `bnstats.score.kernel`.
     """
 
     name = "abstract"
     has_weight = False
     attributes: Dict[str, Tuple[str, str]] = {}
+    # Attributes that can be overridden when creating the calculator.
+    parameters: Tuple[str, ...] = ()
+
+    def __init__(self, **params: float):
+        """Initializes the calculator, overriding its default parameters.
+
+        Args:
+            **params (float): New values of the calculator's `parameters`.
+
+        Raises:
+            ValueError: If the calculator has no such parameter.
+        """
+        for key, value in params.items():
+            if key not in self.parameters:
+                raise ValueError(f"Unknown parameter for {self.name}: {key}")
+            setattr(self, key, value)
+
+    def get_parameters(self) -> Dict[str, float]:
+        """Get the current values of the calculator's parameters."""
+        return {key: getattr(self, key) for key in self.parameters}
 
-    @abstractmethod
     def get_activity_score(self, nominations: List[Nomination]) -> Score:
+        """Calculate the score of scored nominations.
+
+        Args:
+            nominations (List[Nomination]): Nominations to be accounted.
+
+        Returns:
+            Score: Total score of the nominations.
+        """
+        return self.get_activity_scores([nominations])[0]
+
+    def get_activity_scores(
+        self, activities: Sequence[List[Nomination]]
+    ) -> List[Score]:
+        """Calculate scores of multiple activities at once.
+
+        Args:
+            activities (Sequence[List[Nomination]]): Nominations of each activity.
+
+        Returns:
+            List[Score]: Score of each activity.
+        """
+        scored = [
+            [nom for nom in nominations if nom.score[self.name] is not None]
+            for nominations in activities
+        ]
+        totals = pack(
+            [
+                [nom.score[self.name]["total_score"] for nom in nominations]
+                for nominations in scored
+            ]
+        )
+        # Mapper IDs are positive, so missing ones can be counted as the same mapper.
+        mappers = pack(
+            [
+                [-1 if nom.creatorId is None else nom.creatorId for nom in nominations]
+                for nominations in scored
+            ]
+        )
+        return self.activity_scores(totals, mappers)
+
+    @abstractmethod
+    def activity_scores(self, totals: Groups, mappers: Groups) -> List[Score]:
+        """Calculate scores of activities from packed nominations.
+
+        Args:
+            totals (Groups): Total scores of every activity's nominations.
+            mappers (Groups): Mapper IDs of the same nominations.
+
+        Returns:
+            List[Score]: Score of each activity.
+        """
         pass
 
     async def get_user_score(
@@ -54,7 +137,6 @@ class CalculatorABC(ABC):
             activities = await user.get_nomination_activity(date, mode=mode)
         return self.get_activity_score(activities)
 
-    @abstractmethod
     def calculate_mapset(self, beatmap: BeatmapSet) -> float:
         """Calculate a beatmapset's score worth.
 
@@ -64,30 +146,128 @@ class CalculatorABC(ABC):
         Returns:
             float: The beatmapset's score.
         """
+        return self.calculate_mapsets([beatmap])[0]
+
+    def calculate_mapsets(self, beatmaps: Sequence[BeatmapSet]) -> List[float]:
+        """Calculate multiple beatmapsets' score worth at once.
+
+        Args:
+            beatmaps (Sequence[BeatmapSet]): The beatmapsets to be calculated.
+
+        Returns:
+            List[float]: Score of each beatmapset.
+        """
+        return self.mapset_scores(pack_mapsets(beatmaps)).tolist()
+
+    @abstractmethod
+    def mapset_scores(self, mapsets: MapsetArrays) -> np.ndarray:
+        """Calculate scores of packed beatmapsets.
+
+        Args:
+            mapsets (MapsetArrays): The beatmapsets to be calculated.
+
+        Returns:
+            np.ndarray: Score of each beatmapset.
+        """
         pass
 
+    def score_nomination(
+        self, nom: Nomination, context: ScoringContext
+    ) -> Optional[Dict[str, float]]:
+        """Calculate a nomination's score from prefetched data.
+
+        Args:
+            nom (Nomination): Nomination to be calculated.
+            context (ScoringContext): Prefetched data the nomination depends on.
+
+        Returns:
+            Dict[str, float]: Result of nomination calculation.
+        """
+        results = self.score_activity([nom], context, apply_scores=False)
+        return results[0][1] if results else None
+
     @abstractmethod
-    async def calculate_nomination(self, nom: Nomination) -> Optional[Dict[str, float]]:
+    def score_nominations(self, nominations: NominationArrays) -> Dict[str, np.ndarray]:
+        """Calculate scores of packed nominations.
+
+        Args:
+            nominations (NominationArrays): Features of the nominations.
+
+        Returns:
+            Dict[str, np.ndarray]: Score attributes of each nomination, including
+                `total_score`.
+        """
+        pass
+
+    async def calculate_nomination(
+        self, nom: Nomination, context: Optional[ScoringContext] = None
+    ) -> Optional[Dict[str, float]]:
         """Calculate a nomination's score.
 
         Args:
             nom (Nomination): Nomination to be calculated
+            context (ScoringContext, optional): Prefetched data to calculate with.
+                Defaults to fetching the data for this nomination only.
 
         Returns:
             Dict[str, float]: Result of nomination calculation.
         """
-        pass
+        if context is None:
+            context = await ScoringContext.load([nom])
+        return self.score_nomination(nom, context)
 
-    async def _save_nomination_score(
-        self, nom: Nomination, score_data: Dict[str, float]
-    ):
+    def _apply_nomination_score(self, nom: Nomination, score_data: Dict[str, float]):
         new_data = nom.score
         new_data[self.name] = dict(calculator_name=self.name, **score_data)
+        nom.update_from_dict({"score": new_data})
 
-        update_data = {"score": new_data}
-        logger.info("Saving nomination data.")
-        nom.update_from_dict(update_data)
-        await nom.save()
+    def score_activity(
+        self,
+        activity: List[Nomination],
+        context: ScoringContext,
+        apply_scores: bool = True,
+    ) -> List[Tuple[Nomination, Dict[str, float]]]:
+        """Calculate scores of multiple nominations.
+
+        Nominations that can't be scored will be skipped.
+
+        Args:
+            activity (List[Nomination]): Nominations to be calculated.
+            context (ScoringContext): Prefetched data of the nominations.
+            apply_scores (bool, optional): Whether to put the results to each
+                nomination's `score`, without saving them. Defaults to True.
+
+        Returns:
+            List[Tuple[Nomination, Dict[str, float]]]: Scored nominations along with
+                their results.
+        """
+        features = []
+        scorable: List[Nomination] = []
+        for nom in activity:
+            logger.info(
+                "Calculating nomination score for beatmap: "
+                + f"({nom.beatmapsetId}) {nom.artistTitle} [{nom.creatorName})]"
+            )
+            nom_features = context.get_features(nom)
+            if nom_features is not None:
+                features.append(nom_features)
+                scorable.append(nom)
+        if not scorable:
+            return []
+
+        # Score every nomination at once, then split the results per nomination.
+        scores = self.score_nominations(pack_nominations(features))
+        columns = {key: values.tolist() for key, values in scores.items()}
+
+        results = []
+        for i, nom in enumerate(scorable):
+            score_data = {key: values[i] for key, values in columns.items()}
+            logger.debug(f"Final score: {score_data['total_score']}")
+            results.append((nom, score_data))
+
+            if apply_scores:
+                self._apply_nomination_score(nom, score_data)
+        return results
 
     async def calculate_user(
         self, user: User, save_to_db: bool = True
@@ -106,14 +286,26 @@ class CalculatorABC(ABC):
         logger.info("Fetching activity for last 90 days.")
         d = timezone.now() - timedelta(90)
         activity = await user.get_nomination_activity(d)
+        context = await ScoringContext.load(activity, user)
 
-        scores = []
-        for nom in activity:
-            nomination_score = await self.calculate_nomination(nom)
-            if not nomination_score:
-                continue
-            scores.append(nomination_score)
-
-            if save_to_db:
-                await self._save_nomination_score(nom, nomination_score)
-        return scores
+        results = self.score_activity(activity, context, apply_scores=save_to_db)
+        if save_to_db:
+            await save_nomination_scores([nom for nom, _ in results])
+        return [score for _, score in results]
+
+
+async def save_nomination_scores(nominations: List[Nomination]):
+    """Save calculated scores of the nominations in bulk.
+
+    `as_modes` is saved as well, as calculators may fill it for legacy nominations.
+
+    Args:
+        nominations (List[Nomination]): Nominations to be saved.
+    """
+    logger.info("Saving nomination data.")
+    for nom in nominations:
+        nom.update_mode_mask()
+    await bulk_update(Nomination, nominations, ("score", "as_modes", "mode_mask"))
+    if nominations:
+        users = {user_entity(nom.userId) for nom in nominations}
+        await cache.bump(SCORES_ENTITY, *users)
@@ -0,0 +1,197 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from tortoise import timezone
+
+from bnstats.bnsite.enums import MapStatus
+from bnstats.helper import mode_to_db
+from bnstats.models import BeatmapSet, Nomination, Reset, User
+
+logger = logging.getLogger("bnstats.score")
+
+MAPPER_LOOKBACK_DAYS = 180
+
+
+class NominationFeatures(NamedTuple):
+    """What a nomination's score is calculated from, regardless of calculator."""
+
+    # Difficulties of the nominated game modes.
+    beatmap: BeatmapSet
+    ranked: bool
+    # Earlier nominations of the mapper, see `count_mapper_nominations`.
+    own_mapper_count: int
+    other_mapper_count: int
+    # Obviousness plus severity of every reset affecting the nominator.
+    reset_totals: List[int]
+
+
+class ScoringContext:
+    """Prefetched data needed to calculate nomination scores.
+
+    Loading a context fetches the nominators, the nominated beatmapsets, the
+    nominations of the same mappers inside the lookback window and the nominators'
+    resets in bulk, so that scoring the nominations afterwards doesn't need to
+    touch the database.
+    """
+
+    def __init__(
+        self,
+        users: Dict[int, User],
+        mapper_nominations: Dict[int, List[Nomination]],
+        resets: Dict[Tuple[int, int], List[Reset]],
+        since: datetime,
+    ):
+        """Initializes ScoringContext with prefetched data.
+
+        Args:
+            users (Dict[int, User]): Nominators, keyed by their osu! ID.
+            mapper_nominations (Dict[int, List[Nomination]]): Nominations within the
+                lookback window, keyed by the mapper's ID.
+            resets (Dict[Tuple[int, int], List[Reset]]): Resets affecting a nominator,
+                keyed by nominator's ID and beatmapset ID.
+            since (datetime): Start of the mapper lookback window.
+        """
+        self.users = users
+        self.mapper_nominations = mapper_nominations
+        self.resets = resets
+        self.since = since
+
+    @classmethod
+    async def load(
+        cls, nominations: List[Nomination], user: Optional[User] = None
+    ) -> "ScoringContext":
+        """Prefetch everything needed to score the given nominations.
+
+        Beatmapsets will be attached to the nominations that don't have one yet.
+
+        Args:
+            nominations (List[Nomination]): Nominations that will be scored.
+            user (User, optional): The nominator, if every nomination comes from the
+                same user. Defaults to fetching them from database.
+
+        Returns:
+            ScoringContext: The loaded context.
+        """
+        await Nomination.attach_maps(
+            [nom for nom in nominations if "map" not in nom.__dict__]
+        )
+
+        if user:
+            users = {user.osuId: user}
+        else:
+            user_ids = {nom.userId for nom in nominations}
+            users = {u.osuId: u for u in await User.filter(osuId__in=user_ids)}
+
+        since = timezone.now() - timedelta(MAPPER_LOOKBACK_DAYS)
+        mappers = set()
+        for nom in nominations:
+            mappers.update(diff.creator_id for diff in nom.map.beatmaps)
+
+        mapper_nominations: Dict[int, List[Nomination]] = defaultdict(list)
+        if mappers:
+            logger.info(f"Fetching nominations of {len(mappers)} mappers.")
+            mapper_noms = await Nomination.filter(
+                creatorId__in=list(mappers),
+                timestamp__gte=since,
+            ).all()
+            for nom in mapper_noms:
+                mapper_nominations[nom.creatorId].append(nom)
+
+        resets: Dict[Tuple[int, int], List[Reset]] = defaultdict(list)
+        for u in users.values():
+            mapsets = {nom.beatmapsetId for nom in nominations if nom.userId == u.osuId}
+            if not mapsets:
+                continue
+
+            logger.info(f"Fetching resets for user: {u.username}")
+            for r in await u.resets.filter(beatmapsetId__in=list(mapsets)).all():
+                resets[(u.osuId, r.beatmapsetId)].append(r)
+
+        return cls(users, mapper_nominations, resets, since)
+
+    def get_user(self, nom: Nomination) -> User:
+        """Get the nominator of a nomination."""
+        return self.users[nom.userId]
+
+    def get_resets(self, nom: Nomination) -> List[Reset]:
+        """Get the resets affecting the nominator on the nominated beatmapset."""
+        return self.resets.get((nom.userId, nom.beatmapsetId), [])
+
+    def get_features(self, nom: Nomination) -> Optional[NominationFeatures]:
+        """Collect what the nomination's score is calculated from.
+
+        Legacy nominations without `as_modes` are assumed to nominate every game
+        mode of the beatmapset the nominator could nominate, which is filled into
+        `as_modes`.
+
+        Args:
+            nom (Nomination): The nomination being scored.
+
+        Returns:
+            Optional[NominationFeatures]: Features of the nomination, or None if the
+                beatmapset no longer exists.
+        """
+        user = self.get_user(nom)
+        beatmap = nom.map
+        if not beatmap.beatmaps:
+            logger.warning("Beatmap no longer exists in osu!. Skipping.")
+            # Skip beatmaps that doesn't exist anymore.
+            return None
+
+        # Filter beatmaps only to the mode being nominated.
+        nomination_modes = nom.as_modes
+        user_modes = [mode_to_db(m) for m in user.modes]
+        map_modes = set([diff.mode for diff in beatmap.beatmaps])
+
+        # Fallback to legacy if as_modes isnt set
+        # and select all diffs where the nominator could nominate
+        if not nomination_modes:
+            for mode in user_modes:
+                if mode in map_modes:
+                    nomination_modes.append(mode)
+        logger.debug(f"Mode for nomination: {nomination_modes}")
+
+        diffs = []
+        for mode in nomination_modes:
+            diffs.extend(list(filter(lambda x: x.mode == mode, beatmap.beatmaps)))
+        beatmap = BeatmapSet(diffs)
+
+        own_count, other_count = self.count_mapper_nominations(nom, beatmap.creator_id)
+        logger.debug(f"Self: {own_count} | Other: {other_count}")
+
+        return NominationFeatures(
+            beatmap=beatmap,
+            ranked=beatmap.status == MapStatus.Ranked,
+            own_mapper_count=own_count,
+            other_mapper_count=other_count,
+            reset_totals=[r.obviousness + r.severity for r in self.get_resets(nom)],
+        )
+
+    def count_mapper_nominations(self, nom: Nomination, mapper: int) -> Tuple[int, int]:
+        """Count the mapper's earlier nominations inside the lookback window.
+
+        Nominations of the same beatmapset are not counted.
+
+        Args:
+            nom (Nomination): The nomination being scored.
+            mapper (int): The mapper's ID.
+
+        Returns:
+            Tuple[int, int]: Number of the nominator's own nominations, and number of
+                beatmapsets nominated by other nominators.
+        """
+        own_count = 0
+        other_maps = set()
+        for other in self.mapper_nominations.get(mapper, []):
+            if other.timestamp >= nom.timestamp:
+                continue
+            if other.beatmapsetId == nom.beatmapsetId:
+                continue
+
+            if other.userId == nom.userId:
+                own_count += 1
+            else:
+                other_maps.add(other.beatmapsetId)
+        return own_count, len(other_maps)
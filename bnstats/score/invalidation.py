@@ -0,0 +1,113 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from tortoise import timezone
+from tortoise.query_utils import Q
+
+from bnstats.models import Nomination, Reset, User
+from bnstats.score import calculate_user_scores
+
+logger = logging.getLogger("bnstats.score")
+
+# A nomination's score depends on:
+# - Earlier nominations of the same mapper (mapper factor).
+# - Resets on the nominated beatmapset affecting the nominator (penalty).
+# - The nominated beatmapset itself (mapset score and ranked factor).
+#
+# Mappers are matched with `Nomination.creatorId`, while calculators use the
+# mapset's creator. Both are the same mapper for nominations from BN site.
+
+
+async def invalidate_nominations(nominations: Iterable[Nomination]) -> int:
+    """Mark nominations and the nominations depending on them as dirty.
+
+    Should be called when nominations are created or changed.
+
+    Args:
+        nominations (Iterable[Nomination]): Created or changed nominations.
+
+    Returns:
+        int: Number of nominations marked.
+    """
+    ids: List[int] = []
+    mapper_since: Dict[int, datetime] = {}
+    for nom in nominations:
+        ids.append(nom.id)
+        if nom.creatorId is not None:
+            since = mapper_since.get(nom.creatorId, nom.timestamp)
+            mapper_since[nom.creatorId] = min(since, nom.timestamp)
+
+    if not ids:
+        return 0
+
+    query = Q(id__in=ids)
+    for mapper, since in mapper_since.items():
+        query |= Q(creatorId=mapper, timestamp__gt=since)
+    return await Nomination.filter(query).update(score_dirty=True)
+
+
+async def invalidate_resets(resets: Iterable[Reset]) -> int:
+    """Mark nominations affected by the resets as dirty.
+
+    Should be called when resets are created, changed, or attributed to other users.
+
+    Args:
+        resets (Iterable[Reset]): Created or changed resets.
+
+    Returns:
+        int: Number of nominations marked.
+    """
+    return await invalidate_mapsets(r.beatmapsetId for r in resets)
+
+
+async def invalidate_mapsets(beatmapset_ids: Iterable[int]) -> int:
+    """Mark nominations of the beatmapsets as dirty.
+
+    Should be called when the beatmapsets' difficulties or status change.
+
+    Args:
+        beatmapset_ids (Iterable[int]): IDs of the changed beatmapsets.
+
+    Returns:
+        int: Number of nominations marked.
+    """
+    ids = list(set(beatmapset_ids))
+    if not ids:
+        return 0
+    return await Nomination.filter(beatmapsetId__in=ids).update(score_dirty=True)
+
+
+async def recalculate_dirty() -> List[User]:
+    """Recalculate every dirty nomination.
+
+    Dirty nominations outside of the scoring window are only marked clean.
+
+    Returns:
+        List[User]: Users whose nominations were recalculated.
+    """
+    dirty = await Nomination.filter(score_dirty=True).all()
+    if not dirty:
+        return []
+
+    logger.info(f"Recalculating {len(dirty)} dirty nominations.")
+    by_user: Dict[int, List[Nomination]] = defaultdict(list)
+    for nom in dirty:
+        by_user[nom.userId].append(nom)
+
+    # Mark them clean first, so that nominations invalidated while we are still
+    # calculating stay dirty for the next run.
+    ids = [nom.id for nom in dirty]
+    await Nomination.filter(id__in=ids).update(score_dirty=False)
+
+    users = await User.filter(osuId__in=list(by_user.keys())).all()
+    try:
+        for u in users:
+            await calculate_user_scores(u, nominations=by_user[u.osuId])
+            u.last_updated = timezone.now()
+            await u.save(update_fields=["last_updated"])
+    except BaseException:
+        await Nomination.filter(id__in=ids).update(score_dirty=True)
+        raise
+    return users
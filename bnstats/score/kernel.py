@@ -0,0 +1,354 @@
+"""Columnar scoring kernel.
+
+Scores of many beatmapsets and activities are calculated at once from packed
+arrays, where groups of values (difficulties of a beatmapset, nominations of an
+activity) are stored contiguously and split by offsets.
+
+Results are identical to calculating every group one by one in Python: groups are
+summed in the same order, and transcendental functions go through `math`, as
+NumPy's vectorized routines may differ from it in the last bit.
+"""
+import math
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from bnstats.models import BeatmapSet
+from bnstats.score.context import NominationFeatures
+
+
+class Groups(NamedTuple):
+    """Values packed into a single array, split into contiguous groups."""
+
+    values: np.ndarray
+    # Group `i` is `values[offsets[i] : offsets[i + 1]]`.
+    offsets: np.ndarray
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Index of the group every value belongs to."""
+        return np.repeat(np.arange(len(self.offsets) - 1), self.sizes)
+
+
+class MapsetArrays(NamedTuple):
+    """Difficulties of beatmapsets, packed by beatmapset."""
+
+    hit_length: Groups
+    difficultyrating: Groups
+
+
+class NominationArrays(NamedTuple):
+    """Features of nominations, see `NominationFeatures`."""
+
+    mapsets: MapsetArrays
+    ranked: np.ndarray
+    own_mapper_count: np.ndarray
+    other_mapper_count: np.ndarray
+    reset_totals: Groups
+
+
+def pack(groups: Sequence[Sequence[float]]) -> Groups:
+    """Pack groups of values into a single array.
+
+    Args:
+        groups (Sequence[Sequence[float]]): Values of each group.
+
+    Returns:
+        Groups: The packed groups.
+    """
+    offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(g) for g in groups])
+    values = [v for g in groups for v in g]
+    return Groups(np.array(values, dtype=np.float64), offsets)
+
+
+def pack_mapsets(mapsets: Sequence[BeatmapSet]) -> MapsetArrays:
+    """Pack difficulties of beatmapsets.
+
+    Args:
+        mapsets (Sequence[BeatmapSet]): Beatmapsets to be packed.
+
+    Returns:
+        MapsetArrays: The packed difficulties.
+    """
+    return MapsetArrays(
+        hit_length=pack([[b.hit_length for b in m.beatmaps] for m in mapsets]),
+        difficultyrating=pack(
+            [[b.difficultyrating for b in m.beatmaps] for m in mapsets]
+        ),
+    )
+
+
+def pack_nominations(features: Sequence[NominationFeatures]) -> NominationArrays:
+    """Pack features of nominations.
+
+    Args:
+        features (Sequence[NominationFeatures]): Features to be packed.
+
+    Returns:
+        NominationArrays: The packed features.
+    """
+    return NominationArrays(
+        mapsets=pack_mapsets([f.beatmap for f in features]),
+        ranked=np.array([f.ranked for f in features], dtype=np.float64),
+        own_mapper_count=np.array(
+            [f.own_mapper_count for f in features], dtype=np.float64
+        ),
+        other_mapper_count=np.array(
+            [f.other_mapper_count for f in features], dtype=np.float64
+        ),
+        reset_totals=pack([f.reset_totals for f in features]),
+    )
+
+
+def _exact(func: Callable[[float], float], values: np.ndarray) -> np.ndarray:
+    # Apply a scalar function to every distinct value.
+    unique, inverse = np.unique(values, return_inverse=True)
+    results = np.array([func(v) for v in unique.tolist()], dtype=np.float64)
+    return results[inverse.reshape(-1)]
+
+
+def _powers(base: float, count: int) -> np.ndarray:
+    return np.array([base**i for i in range(count)], dtype=np.float64)
+
+
+def _ranks(groups: Groups) -> np.ndarray:
+    # Position of every value inside its group.
+    starts = np.repeat(groups.offsets[:-1], groups.sizes)
+    return np.arange(len(groups.values)) - starts
+
+
+def _sort_descending(groups: Groups, key: np.ndarray) -> Groups:
+    # Stable sort, so equal values keep their order like `sorted` does.
+    order = np.lexsort((-key, groups.ids))
+    return Groups(groups.values[order], groups.offsets)
+
+
+def _sum(groups: Groups) -> np.ndarray:
+    # Sum groups value by value, so the rounding matches a sequential loop.
+    starts = groups.offsets[:-1]
+    sizes = groups.sizes
+    totals = np.zeros(len(sizes), dtype=np.float64)
+    for i in range(int(sizes.max(initial=0))):
+        active = sizes > i
+        totals[active] += groups.values[starts[active] + i]
+    return totals
+
+
+def weighted_sum(groups: Groups, weight: float) -> np.ndarray:
+    """Sum every group with decaying weights, largest value first.
+
+    The `i`-th largest value by magnitude is multiplied by `weight**i`.
+
+    Args:
+        groups (Groups): Values to be summed.
+        weight (float): Weight decay.
+
+    Returns:
+        np.ndarray: Weighted sum of each group.
+    """
+    ordered = _sort_descending(groups, np.abs(groups.values))
+    weights = _powers(weight, int(groups.sizes.max(initial=0)))
+    values = ordered.values * weights[_ranks(ordered)]
+    return _sum(Groups(values, groups.offsets))
+
+
+def unique_counts(groups: Groups) -> np.ndarray:
+    """Count distinct values of every group.
+
+    Args:
+        groups (Groups): Values to be counted.
+
+    Returns:
+        np.ndarray: Number of distinct values in each group.
+    """
+    pairs = np.unique(np.stack([groups.ids, groups.values]), axis=1)
+    return np.bincount(
+        pairs[0].astype(np.int64), minlength=len(groups.offsets) - 1
+    ).astype(np.float64)
+
+
+def ren_mapset_scores(mapsets: MapsetArrays) -> np.ndarray:
+    """Calculate beatmapset scores of the ren system.
+
+    See `RenCalculator.calculate_mapset`.
+
+    Args:
+        mapsets (MapsetArrays): Beatmapsets to be calculated.
+
+    Returns:
+        np.ndarray: Score of each beatmapset, NaN for beatmapsets without
+            difficulties.
+    """
+    hit_length = mapsets.hit_length
+    sizes = hit_length.sizes
+    drain_time = _sum(hit_length)
+
+    # Expect all maps to be above 300s (5:00) of total drain time
+    # This would be:
+    # 5:00 * 1 diff
+    # 1:30 * 4 diff
+    #
+    # If there are more diffs, we expect the map to have longer drain time
+    # so that it is more or less normalized.
+    diffs = np.where(sizes > 0, sizes, 1)
+    mapset_base = _exact(
+        lambda n: 300 + (120 * n / 4) * (math.log(n / 4) + 0.601), diffs
+    )
+
+    # Bigger mapset means extra checking for each difficulty
+    # And with that, we give bonus to bigger sets.
+    # Easier diffs tend to be much easier to check
+    # Of course, this is extremely naive especially with how slider is treated.
+    bonus = hit_length.values * (mapsets.difficultyrating.values - 5.5) / 5.5
+    bonus_drain = _sum(Groups(bonus, hit_length.offsets))
+    bonus_drain *= _exact(lambda n: math.log(n, 8), diffs)
+
+    scores = _exact(lambda x: round(x, 2), (drain_time + bonus_drain) / mapset_base)
+    scores[sizes == 0] = np.nan
+    return scores
+
+
+def naxess_mapset_scores(mapsets: MapsetArrays, length_decay: float) -> np.ndarray:
+    """Calculate beatmapset scores of the naxess system.
+
+    See `NaxessCalculator.calculate_mapset`.
+
+    Args:
+        mapsets (MapsetArrays): Beatmapsets to be calculated.
+        length_decay (float): Weight decay of the difficulties, longest first.
+
+    Returns:
+        np.ndarray: Score of each beatmapset.
+    """
+    hit_length = mapsets.hit_length
+    multiplier = weighted_sum(hit_length, length_decay) / 300
+    return _exact(lambda x: math.log(1 + x, 2), multiplier)
+
+
+def _mapper_scores(
+    nominations: NominationArrays, own_decay: float, other_decay: float
+) -> np.ndarray:
+    own = _exact(lambda c: own_decay**c, nominations.own_mapper_count)
+    return own * _exact(lambda c: other_decay**c, nominations.other_mapper_count)
+
+
+def _penalties(
+    nominations: NominationArrays, penalty: Callable[[float], float]
+) -> np.ndarray:
+    # Resets with neither obviousness nor severity aren't penalized.
+    totals = nominations.reset_totals
+    values = _exact(lambda t: penalty(t) if t else 0, totals.values)
+    return _sum(Groups(values, totals.offsets))
+
+
+def ren_nomination_scores(
+    nominations: NominationArrays,
+    base_score: float,
+    recurring_mapper_decay: float,
+    other_nominator_decay: float,
+) -> Dict[str, np.ndarray]:
+    """Calculate nomination scores of the ren system.
+
+    See `RenCalculator.score_nominations`.
+
+    Args:
+        nominations (NominationArrays): Nominations to be calculated.
+        base_score (float): Score multiplier of every nomination.
+        recurring_mapper_decay (float): Score multiplier for each of the
+            nominator's earlier nominations of the mapper.
+        other_nominator_decay (float): Score multiplier for each beatmapset of the
+            mapper nominated by others.
+
+    Returns:
+        Dict[str, np.ndarray]: Score attributes of each nomination.
+    """
+    mapper_score = _mapper_scores(
+        nominations, recurring_mapper_decay, other_nominator_decay
+    )
+    penalty = _penalties(nominations, lambda t: (2**t) / 8)
+    ranked_score = (nominations.ranked + 1) / 2
+    mapset_score = ren_mapset_scores(nominations.mapsets)
+
+    score = _exact(lambda x: round(x, 2), base_score * mapper_score * mapset_score)
+    score *= ranked_score
+    score -= penalty
+    return {
+        "ranked_score": ranked_score,
+        "mapper_score": mapper_score,
+        "mapset_score": mapset_score,
+        "penalty": penalty,
+        "total_score": score,
+    }
+
+
+def naxess_nomination_scores(
+    nominations: NominationArrays,
+    recurring_mapper_decay: float,
+    other_nominator_decay: float,
+    length_decay: float,
+) -> Dict[str, np.ndarray]:
+    """Calculate nomination scores of the naxess system.
+
+    See `NaxessCalculator.score_nominations`.
+
+    Args:
+        nominations (NominationArrays): Nominations to be calculated.
+        recurring_mapper_decay (float): Score multiplier for each of the
+            nominator's earlier nominations of the mapper.
+        other_nominator_decay (float): Score multiplier for each beatmapset of the
+            mapper nominated by others.
+        length_decay (float): Weight decay of the difficulties, longest first.
+
+    Returns:
+        Dict[str, np.ndarray]: Score attributes of each nomination.
+    """
+    mapper_score = _mapper_scores(
+        nominations, recurring_mapper_decay, other_nominator_decay
+    )
+    penalty = _penalties(nominations, lambda t: 0.5 + ((t - 1) / 2 * t))
+    # Qualified/Pending: 25%
+    # Ranked: 100%
+    ranked_score = (nominations.ranked + 1) ** 2 / 4
+    mapset_score = naxess_mapset_scores(nominations.mapsets, length_decay)
+
+    score = _exact(lambda x: round(x, 2), mapper_score * mapset_score * ranked_score)
+    score -= penalty
+    return {
+        "ranked_score": ranked_score,
+        "mapper_score": mapper_score,
+        "mapset_score": mapset_score,
+        "penalty": penalty,
+        "total_score": score,
+    }
+
+
+def ren_activity_scores(
+    totals: Groups, mappers: Groups, weight: float
+) -> List[Tuple[float, float]]:
+    """Calculate activity scores of the ren system.
+
+    See `RenCalculator.get_activity_score`.
+
+    Args:
+        totals (Groups): Total scores of every activity's nominations.
+        mappers (Groups): Mapper IDs of the same nominations.
+        weight (float): Weight decay of the nominations.
+
+    Returns:
+        List[Tuple[float, float]]: Total score and uniqueness of each activity.
+    """
+    sizes = totals.sizes
+    total_mappers = unique_counts(mappers)
+    uniqueness = total_mappers / np.where(sizes > 0, sizes, 1)
+    uniqueness = np.where(
+        total_mappers > 1,
+        uniqueness * _exact(math.log10, np.maximum(total_mappers, 1)),
+        uniqueness,
+    )
+    total_score = weighted_sum(totals, weight) * uniqueness
+    return list(zip(total_score.tolist(), uniqueness.tolist()))
@@ -0,0 +1,155 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from itertools import repeat
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from tortoise import timezone
+
+from bnstats.helper import mode_mask
+from bnstats.models import Nomination
+from bnstats.score.base import CalculatorABC
+from bnstats.score.context import ScoringContext
+from bnstats.score.kernel import Groups, NominationArrays, pack_nominations
+
+logger = logging.getLogger("bnstats.score")
+
+Leaderboard = List[Tuple[int, float]]
+
+
+class Dataset(NamedTuple):
+    """Every scorable nomination, packed to evaluate calculators in memory.
+
+    Nominations are sorted by time, like the activities calculators usually get.
+    """
+
+    nominations: NominationArrays
+    # Nominator and mapper ID of each nomination, -1 for unknown mappers.
+    users: np.ndarray
+    mappers: np.ndarray
+    # Nominated game modes of each nomination, see `helper.mode_mask`.
+    mode_masks: np.ndarray
+
+    @classmethod
+    async def load(cls, days: int = 90) -> "Dataset":
+        """Load nominations from database.
+
+        Args:
+            days (int, optional): Maximum days of nomination to be accounted.
+                Defaults to 90.
+
+        Returns:
+            Dataset: The loaded nominations.
+        """
+        since = timezone.now() - timedelta(days)
+        nominations = await Nomination.filter(timestamp__gte=since).order_by(
+            "timestamp"
+        )
+        context = await ScoringContext.load(nominations)
+
+        features = []
+        scorable: List[Nomination] = []
+        for nom in nominations:
+            if nom.userId not in context.users:
+                continue
+            nom_features = context.get_features(nom)
+            if nom_features is not None:
+                features.append(nom_features)
+                scorable.append(nom)
+        logger.info(f"Loaded {len(scorable)} nominations to evaluate.")
+
+        return cls(
+            nominations=pack_nominations(features),
+            users=np.array([nom.userId for nom in scorable], dtype=np.int64),
+            mappers=np.array(
+                [-1 if nom.creatorId is None else nom.creatorId for nom in scorable],
+                dtype=np.float64,
+            ),
+            mode_masks=np.array(
+                [mode_mask(nom.as_modes) for nom in scorable], dtype=np.int64
+            ),
+        )
+
+
+def evaluate(
+    dataset: Dataset, calculator: CalculatorABC, mode: Optional[int] = None
+) -> Leaderboard:
+    """Calculate a leaderboard without touching the database.
+
+    Args:
+        dataset (Dataset): Nominations to be accounted.
+        calculator (CalculatorABC): Calculator to evaluate, with its parameters.
+        mode (int, optional): Integer enum of the game mode to be accounted.
+            Defaults to all game mode.
+
+    Returns:
+        Leaderboard: osu! ID and score of every nominator, highest score first.
+    """
+    totals = calculator.score_nominations(dataset.nominations)["total_score"]
+    selected = np.ones(len(totals), dtype=bool)
+    if mode is not None:
+        selected = (dataset.mode_masks & (1 << mode)) != 0
+
+    # Group nominations by nominator, keeping them sorted by time.
+    users = dataset.users[selected]
+    order = np.argsort(users, kind="stable")
+    user_ids, starts = np.unique(users[order], return_index=True)
+    offsets = np.append(starts, len(order))
+
+    scores = calculator.activity_scores(
+        Groups(totals[selected][order], offsets),
+        Groups(dataset.mappers[selected][order], offsets),
+    )
+    leaderboard = zip(user_ids.tolist(), [s.total_score for s in scores])
+    return sorted(leaderboard, key=lambda x: x[1], reverse=True)
+
+
+_dataset: Optional[Dataset] = None
+
+
+def _init_worker(dataset: Dataset):
+    global _dataset
+    _dataset = dataset
+
+
+def _evaluate_worker(calculator: CalculatorABC, mode: Optional[int]) -> Leaderboard:
+    assert _dataset is not None
+    return evaluate(_dataset, calculator, mode)
+
+
+def evaluate_many(
+    dataset: Dataset,
+    calculators: Sequence[CalculatorABC],
+    mode: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> List[Leaderboard]:
+    """Calculate leaderboards of multiple calculators in parallel.
+
+    The dataset is sent to every worker process once, then each calculator is
+    evaluated by whichever worker is free. Workers are spawned rather than forked,
+    as forking a process running database threads may deadlock.
+
+    Args:
+        dataset (Dataset): Nominations to be accounted.
+        calculators (Sequence[CalculatorABC]): Calculators to evaluate, usually with
+            different parameters.
+        mode (int, optional): Integer enum of the game mode to be accounted.
+            Defaults to all game mode.
+        processes (int, optional): Number of worker processes, 1 to evaluate in
+            this process. Defaults to the number of CPUs.
+
+    Returns:
+        List[Leaderboard]: Leaderboard of each calculator.
+    """
+    if processes == 1:
+        return [evaluate(dataset, c, mode) for c in calculators]
+
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(dataset,),
+    ) as pool:
+        return list(pool.map(_evaluate_worker, calculators, repeat(mode)))
@@ -0,0 +1,66 @@
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger("bnstats.singleflight")
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one.
+
+    While a call is in flight, every other call with the same key waits for it
+    and gets the same result or exception, instead of doing the work again.
+    Finished calls are not remembered.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run the function, unless a call with the same key is in flight.
+
+        Cancelling a caller doesn't cancel the shared call, as other callers may
+        still be waiting for it.
+
+        Args:
+            key (Hashable): Identity of the call.
+            func (Callable[[], Awaitable[T]]): Coroutine function doing the work.
+
+        Returns:
+            T: Result of the call.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight call: {key}")
+        return await asyncio.shield(future)
+
+
+def single_flight(key: Callable[..., Hashable]):
+    """Coalesce concurrent calls of the decorated coroutine function.
+
+    Args:
+        key (Callable[..., Hashable]): Function receiving the call's arguments and
+            returning its identity.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        flights = SingleFlight()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Awaitable[T]:
+            return flights.do(key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.flights = flights  # type: ignore
+        return wrapper
+
+    return decorator
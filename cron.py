@@ -4,14 +4,25 @@ import time
 
 from tortoise import run_async
 
+from bnstats.routine import SCORE_DAYS
 from populate import run
 
+
 @repeat(every().hour)
 def job():
     print("-- Start cron " + datetime.datetime.now().isoformat())
-    run_async(run(1, False))
+    run_async(run(SCORE_DAYS, False, incremental=True))
     print("-- End cron " + datetime.datetime.now().isoformat())
 
+
+# Scores depend on time windows, so do a full pass once in a while.
+@repeat(every().day.at("00:30"))
+def full_job():
+    print("-- Start full cron " + datetime.datetime.now().isoformat())
+    run_async(run(SCORE_DAYS, False))
+    print("-- End full cron " + datetime.datetime.now().isoformat())
+
+
 while True:
     run_pending()
-    time.sleep(1)
\ No newline at end of file
+    time.sleep(1)
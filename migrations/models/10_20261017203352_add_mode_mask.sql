@@ -0,0 +1,10 @@
+-- upgrade --
+ALTER TABLE "nomination" ADD "mode_mask" INT NOT NULL DEFAULT 0;
+UPDATE "nomination" SET "mode_mask" = COALESCE((
+    SELECT SUM(DISTINCT 1 << "mode"::INT)::INT
+    FROM jsonb_array_elements_text("as_modes") AS "mode"
+), 0) WHERE jsonb_typeof("as_modes") = 'array';
+CREATE INDEX "idx_nomination_userId_5e9a02" ON "nomination" ("userId", "mode_mask", "timestamp");
+-- downgrade --
+DROP INDEX "idx_nomination_userId_5e9a02";
+ALTER TABLE "nomination" DROP COLUMN "mode_mask";
@@ -0,0 +1,22 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "mapsetsummary" (
+    "beatmapset_id" INT NOT NULL PRIMARY KEY,
+    "artist" VARCHAR(255) NOT NULL,
+    "title" VARCHAR(255) NOT NULL,
+    "creator" VARCHAR(255) NOT NULL,
+    "creator_id" INT NOT NULL DEFAULT 0,
+    "approved" INT NOT NULL,
+    "genre_id" INT NOT NULL,
+    "language_id" INT NOT NULL,
+    "total_diffs" INT NOT NULL,
+    "total_length" INT NOT NULL,
+    "longest_length" INT NOT NULL,
+    "hit_length" INT NOT NULL,
+    "top_difficultyrating" DOUBLE PRECISION NOT NULL,
+    "difficulty_counts" JSONB NOT NULL,
+    "modes" JSONB NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+COMMENT ON TABLE "mapsetsummary" IS 'Precomputed summary of a beatmapset''s difficulties.';
+-- downgrade --
+DROP TABLE IF EXISTS "mapsetsummary";
@@ -0,0 +1,16 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "chartbucket" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "userId" INT NOT NULL,
+    "day" DATE NOT NULL,
+    "nominations" INT NOT NULL DEFAULT 0,
+    "genres" JSONB NOT NULL,
+    "languages" JSONB NOT NULL,
+    "top_difficulties" JSONB NOT NULL,
+    "difficulties" JSONB NOT NULL,
+    "lengths" JSONB NOT NULL,
+    CONSTRAINT "uid_chartbucket_userId_7d1f5c" UNIQUE ("userId", "day")
+);
+COMMENT ON TABLE "chartbucket" IS 'Profile chart data of a user''s nominations on a single day (UTC).';
+-- downgrade --
+DROP TABLE IF EXISTS "chartbucket";
@@ -0,0 +1,17 @@
+-- upgrade --
+INSERT INTO "user_reset" ("reset_id", "user_id")
+    SELECT DISTINCT b."id", l."user_id" FROM "reset" a
+    JOIN "reset" b ON a."beatmapsetId" = b."beatmapsetId" AND a."userId" = b."userId"
+        AND a."timestamp" = b."timestamp" AND a."id" > b."id"
+    JOIN "user_reset" l ON l."reset_id" = a."id"
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "user_reset" x WHERE x."reset_id" = b."id" AND x."user_id" = l."user_id"
+    );
+DELETE FROM "reset" a USING "reset" b
+    WHERE a."beatmapsetId" = b."beatmapsetId" AND a."userId" = b."userId"
+        AND a."timestamp" = b."timestamp" AND a."id" > b."id";
+DROP INDEX "idx_reset_beatmap_2d8a53";
+CREATE UNIQUE INDEX "uid_reset_beatmap_5c2e71" ON "reset" ("beatmapsetId", "userId", "timestamp");
+-- downgrade --
+DROP INDEX "uid_reset_beatmap_5c2e71";
+CREATE INDEX "idx_reset_beatmap_2d8a53" ON "reset" ("beatmapsetId", "userId", "timestamp");
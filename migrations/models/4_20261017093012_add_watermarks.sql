@@ -0,0 +1,8 @@
+-- upgrade --
+ALTER TABLE "user"
+    ADD "last_event_at" TIMESTAMPTZ,
+    ADD "maps_checked_at" TIMESTAMPTZ;
+-- downgrade --
+ALTER TABLE "user"
+    DROP COLUMN "last_event_at",
+    DROP COLUMN "maps_checked_at";
@@ -0,0 +1,6 @@
+-- upgrade --
+ALTER TABLE "nomination" ADD "score_dirty" BOOL NOT NULL DEFAULT FALSE;
+CREATE INDEX "idx_nomination_score_d_8c1f4e" ON "nomination" ("score_dirty");
+-- downgrade --
+DROP INDEX "idx_nomination_score_d_8c1f4e";
+ALTER TABLE "nomination" DROP COLUMN "score_dirty";
@@ -0,0 +1,15 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "leaderboardentry" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "calculator" VARCHAR(20) NOT NULL,
+    "mode" VARCHAR(10) NOT NULL DEFAULT '',
+    "total_score" DOUBLE PRECISION NOT NULL,
+    "attribs" JSONB NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "user_id" INT NOT NULL REFERENCES "user" ("osuId") ON DELETE CASCADE,
+    CONSTRAINT "uid_leaderboard_user_id_3b7a51" UNIQUE ("user_id", "calculator", "mode")
+);
+COMMENT ON TABLE "leaderboardentry" IS 'A user''s precomputed score for the leaderboard.';
+CREATE INDEX "idx_leaderboard_calcula_9e0d2c" ON "leaderboardentry" ("calculator", "mode", "total_score");
+-- downgrade --
+DROP TABLE IF EXISTS "leaderboardentry";
@@ -0,0 +1,10 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "mapsetinfo" (
+    "beatmapset_id" INT NOT NULL PRIMARY KEY,
+    "approved" INT,
+    "last_fetched" TIMESTAMPTZ NOT NULL
+);
+COMMENT ON TABLE "mapsetinfo" IS 'Freshness of a beatmapset fetched from osu! API.';
+CREATE INDEX "idx_mapsetinfo_last_fe_5c1a7e" ON "mapsetinfo" ("last_fetched");
+-- downgrade --
+DROP TABLE IF EXISTS "mapsetinfo";
@@ -0,0 +1,10 @@
+-- upgrade --
+DELETE FROM "beatmap" a USING "beatmap" b
+    WHERE a."beatmap_id" = b."beatmap_id" AND a."id" < b."id";
+DELETE FROM "nomination" a USING "nomination" b
+    WHERE a."beatmapsetId" = b."beatmapsetId" AND a."userId" = b."userId" AND a."id" > b."id";
+CREATE UNIQUE INDEX "uid_beatmap_beatmap_3c5e9b" ON "beatmap" ("beatmap_id");
+CREATE UNIQUE INDEX "uid_nomination_beatmap_8a1f4d" ON "nomination" ("beatmapsetId", "userId");
+-- downgrade --
+DROP INDEX "uid_nomination_beatmap_8a1f4d";
+DROP INDEX "uid_beatmap_beatmap_3c5e9b";
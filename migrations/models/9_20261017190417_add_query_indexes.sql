@@ -0,0 +1,14 @@
+-- upgrade --
+CREATE INDEX "idx_nomination_creator_6f2e1b" ON "nomination" ("creatorId", "timestamp");
+CREATE INDEX "idx_nomination_userId_b47c90" ON "nomination" ("userId", "timestamp");
+DROP INDEX "idx_nomination_userId_483bfd";
+CREATE INDEX "idx_reset_beatmap_2d8a53" ON "reset" ("beatmapsetId", "userId", "timestamp");
+CREATE INDEX "idx_user_reset_user_id_91c4f7" ON "user_reset" ("user_id", "reset_id");
+CREATE INDEX "idx_user_reset_reset_i_e03b6a" ON "user_reset" ("reset_id");
+-- downgrade --
+DROP INDEX "idx_user_reset_reset_i_e03b6a";
+DROP INDEX "idx_user_reset_user_id_91c4f7";
+DROP INDEX "idx_reset_beatmap_2d8a53";
+CREATE INDEX "idx_nomination_userId_483bfd" ON "nomination" ("userId");
+DROP INDEX "idx_nomination_userId_b47c90";
+DROP INDEX "idx_nomination_creator_6f2e1b";
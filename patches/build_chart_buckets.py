@@ -0,0 +1,20 @@
+from tortoise import Tortoise, run_async
+from starlette.config import Config
+
+from bnstats.models import ChartBucket, Nomination
+
+config = Config(".env")
+DB_URL = config("DB_URL")
+
+
+async def apply_patch():
+    await Tortoise.init(db_url=DB_URL, modules={"models": ["bnstats.models"]})
+
+    user_ids = await Nomination.all().distinct().values_list("userId", flat=True)
+    for user_id in user_ids:
+        await ChartBucket.rebuild(user_id)
+    print(f"Built chart buckets of {len(user_ids)} users.")
+
+
+if __name__ == "__main__":
+    run_async(apply_patch())
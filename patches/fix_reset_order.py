@@ -1,8 +1,9 @@
-
 from tortoise import Tortoise, run_async
 from starlette.config import Config
 
-from bnstats.models import  Reset, Nomination
+from bnstats.models import Reset
+from bnstats.routine import attribute_resets
+from bnstats.score.invalidation import invalidate_resets
 
 config = Config(".env")
 DB_URL = config("DB_URL")
@@ -10,21 +11,10 @@ DB_URL = config("DB_URL")
 async def apply_patch():
     await Tortoise.init(db_url=DB_URL, modules={"models": ["bnstats.models"]})
 
-    resets = await Reset.all().prefetch_related("user_affected")
-    for reset in resets:
-        await reset.user_affected.clear()
-        map_nominations = await Nomination.filter(
-            beatmapsetId=reset.beatmapsetId,
-            timestamp__lt=reset.timestamp
-        ).order_by("-timestamp")
-        limit = 1 + (reset.type == "disqualify")
-
-        for nom in map_nominations[:limit]:
-            nominator = await nom.user
-            if nominator and nominator not in reset.user_affected:
-                await reset.user_affected.add(nominator)
-        
-        await reset.save()
+    resets = await Reset.all().order_by("beatmapsetId")
+    changed = await attribute_resets(resets, prune=True)
+    await invalidate_resets(r for r in resets if r.id in changed)
+    print(f"Fixed {len(changed)} of {len(resets)} resets.")
 
 if __name__ == "__main__":
     run_async(apply_patch())
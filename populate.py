@@ -4,16 +4,10 @@ import logging
 import warnings
 from tortoise import Tortoise, run_async
 from tortoise.query_utils import Q
-from typing import List
 from starlette.config import Config
 
-from bnstats.routine import (
-    update_events_db,
-    update_users_db,
-    update_maps_db,
-    update_user_details,
-)
-from bnstats.score import get_system
+from bnstats.routine import populate_users, process_user
+from bnstats.score import calculate_user_scores
 from bnstats.models import User
 
 config = Config(".env")
@@ -45,33 +39,16 @@ async def run_calculate():
     for i, u in enumerate(users):
         print(f">>> Calculating score for user: {u.username} ({i+1}/{c})")
 
-        for system_name in ("ren", "naxess"):
-            print(">>>> Using system:", system_name)
-            calc_system = get_system(system_name)()
-            await calc_system.calculate_user(u)
+        await calculate_user_scores(u)
 
 
-async def process_user(u: User, days: int):
-    await update_events_db(u, days)
-
-    nominations = await u.get_nomination_activity()
-
-    logger.info("Fetching maps")
-    nominated_maps = []
-    for nom in nominations:
-        nominated_maps.append(await update_maps_db(nom))
-
-    if nominated_maps:
-        logger.info("Updating user information")
-        await update_user_details(u, nominated_maps)
-
-    logger.info("Recalculating score")
-    for system_name in ("ren", "naxess"):
-        calc_system = get_system(system_name)()  # type: ignore
-        await calc_system.calculate_user(u)
-
-
-async def run(days: int, skip_former: bool):
+async def run(
+    days: int,
+    skip_former: bool,
+    bnsite_concurrency: int = 2,
+    osu_concurrency: int = 4,
+    incremental: bool = False,
+):
     send_webhook("Population starts.")
     try:
         await Tortoise.init(db_url=DB_URL, modules={"models": ["bnstats.models"]})
@@ -79,16 +56,13 @@ async def run(days: int, skip_former: bool):
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            users: List[User] = await update_users_db()
-
-            logger.info(f"Populating {len(users)} users...")
-            for u in users:
-                logger.info(f"Populating {u.username}")
-                if skip_former and not u.isBn and not u.isNat:
-                    logger.info(">> Skipping former BN:", u.username)
-                    continue
-
-                await process_user(u, days)
+            await populate_users(
+                days,
+                incremental,
+                skip_former,
+                bnsite_concurrency,
+                osu_concurrency,
+            )
 
             if len(w):
                 e_msg = "\r\n".join(list(map(lambda x: str(x.message), w)))
@@ -124,6 +98,23 @@ if __name__ == "__main__":
         help="Whether or not to skip populating former user",
         action="store_true",
     )
+    parser.add_argument(
+        "--incremental",
+        help="Only process events and maps that changed since the last population.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--bnsite-concurrency",
+        type=int,
+        default=2,
+        help="Maximum concurrent requests to BN site.",
+    )
+    parser.add_argument(
+        "--osu-concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent requests to osu! API.",
+    )
 
     args = parser.parse_args()
     if args.only_recalculate:
@@ -132,4 +123,12 @@ if __name__ == "__main__":
         if args.user:
             run_async(run_user(args.user, args.days))
         else:
-            run_async(run(args.days, args.skip_former))
+            run_async(
+                run(
+                    args.days,
+                    args.skip_former,
+                    args.bnsite_concurrency,
+                    args.osu_concurrency,
+                    args.incremental,
+                )
+            )
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from bnstats.models import Nomination, Reset, User
+from bnstats.routine import attribute_resets
+
+
+def _time(day: int) -> datetime:
+    return datetime(2020, 10, day, tzinfo=timezone.utc)
+
+
+async def _create_reset(reset_id: str, type: str, day: int, user_id: int = 3) -> Reset:
+    return await Reset.create(
+        id=reset_id,
+        beatmapsetId=1,
+        userId=user_id,
+        artistTitle="Artist - Title",
+        timestamp=_time(day),
+        type=type,
+    )
+
+
+@pytest.mark.asyncio
+async def test_attribute_resets():
+    first = await User.get(pk=1)
+    second = await User.create(
+        _id="second",
+        osuId=2,
+        username="SecondUser",
+        modesInfo=[],
+        isNat=False,
+        isBn=True,
+        modes=["osu"],
+    )
+    for user, day in ((second, 1), (first, 2)):
+        await Nomination.create(
+            beatmapsetId=1,
+            userId=user.osuId,
+            user=user,
+            artistTitle="Artist - Title",
+            timestamp=_time(day),
+        )
+
+    early = await _create_reset("early", "disqualify", 1)
+    dq = await _create_reset("dq", "disqualify", 3)
+    # Resets are identified by their time and user, so pop is by someone else.
+    pop = await _create_reset("pop", "nomination_reset", 3, user_id=4)
+    await pop.user_affected.add(second)
+    resets = [early, dq, pop]
+
+    changed = await attribute_resets(resets, batch_size=2)
+    assert changed == {"dq", "pop"}, "Changed resets unmatch!"
+    assert not await early.user_affected.all(), "Reset attributed to later users!"
+    assert set(await dq.user_affected.all()) == {first, second}
+    assert set(await pop.user_affected.all()) == {first, second}, "Users removed!"
+
+    changed = await attribute_resets(resets, {"early": {2}}, prune=True)
+    assert changed == {"early", "pop"}, "Changed resets unmatch!"
+    assert await early.user_affected.all() == [second], "Extra user not added!"
+    assert await pop.user_affected.all() == [first], "Stale user not removed!"
+
+    assert not await attribute_resets(resets, {"early": {2}}, prune=True)
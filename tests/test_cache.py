@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from aiocache import Cache
+from aiocache.serializers import PickleSerializer
+
+from bnstats.cache import VersionedCache
+
+
+@pytest.fixture
+def versioned_cache():
+    return VersionedCache(Cache(Cache.MEMORY, serializer=PickleSerializer()))
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.calls
+
+
+@pytest.mark.asyncio
+async def test_cache_hit(versioned_cache: VersionedCache):
+    loader = Loader()
+    assert await versioned_cache.get_or_load("key", ["a"], loader) == 1
+    assert await versioned_cache.get_or_load("key", ["a"], loader) == 1
+    assert loader.calls == 1, "Fresh entry loaded again!"
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight(versioned_cache: VersionedCache):
+    loader = Loader()
+    results = await asyncio.gather(
+        *[versioned_cache.get_or_load("key", ["a"], loader) for _ in range(5)]
+    )
+    assert results == [1] * 5
+    assert loader.calls == 1, "Concurrent misses loaded more than once!"
+
+
+@pytest.mark.asyncio
+async def test_cache_stale_while_revalidate(versioned_cache: VersionedCache):
+    loader = Loader()
+    await versioned_cache.get_or_load("key", ["a", "b"], loader)
+
+    # Unrelated entities don't invalidate the entry.
+    await versioned_cache.bump("c")
+    assert await versioned_cache.get_or_load("key", ["a", "b"], loader) == 1
+    assert loader.calls == 1, "Entry invalidated by unrelated entity!"
+
+    # The outdated entry is served while it is rebuilt.
+    await versioned_cache.bump("b")
+    assert await versioned_cache.get_or_load("key", ["a", "b"], loader) == 1
+    await versioned_cache.wait_background()
+    assert loader.calls == 2, "Outdated entry not rebuilt!"
+    assert await versioned_cache.get_or_load("key", ["a", "b"], loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expiry(versioned_cache: VersionedCache):
+    loader = Loader()
+    await versioned_cache.get_or_load("key", [], loader, fresh_ttl=0)
+    assert await versioned_cache.get_or_load("key", [], loader) == 1
+    await versioned_cache.wait_background()
+    assert loader.calls == 2, "Expired entry not rebuilt!"
@@ -0,0 +1,73 @@
+import pytest
+from aiocache import Cache
+from aiocache.serializers import PickleSerializer
+from jinja2 import DictLoader, Environment
+from markupsafe import Markup
+from starlette.concurrency import run_in_threadpool
+
+from bnstats.cache import VersionedCache
+from bnstats.fragments import FragmentCache, FragmentCacheExtension
+
+TEMPLATE = "{% cache ('user', uid), ['user:' ~ uid] %}{{ render() }}{% endcache %}"
+
+
+class Renderer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> Markup:
+        self.calls += 1
+        return Markup(f"<b>{self.calls}</b>")
+
+
+@pytest.fixture
+def fragment_cache():
+    backend = Cache(Cache.MEMORY, serializer=PickleSerializer())
+    return FragmentCache(VersionedCache(backend))
+
+
+@pytest.fixture
+def env(fragment_cache: FragmentCache):
+    env = Environment(
+        loader=DictLoader({"page.html": TEMPLATE}),
+        extensions=[FragmentCacheExtension],
+        autoescape=True,
+    )
+    env.fragment_cache = fragment_cache  # type: ignore
+    return env
+
+
+@pytest.mark.asyncio
+async def test_fragment_cache(env: Environment, fragment_cache: FragmentCache):
+    template = env.get_template("page.html")
+    render = Renderer()
+
+    assert await run_in_threadpool(template.render, uid=1, render=render) == "<b>1</b>"
+    assert await run_in_threadpool(template.render, uid=1, render=render) == "<b>1</b>"
+    assert render.calls == 1, "Cached fragment rendered again!"
+
+    await run_in_threadpool(template.render, uid=2, render=render)
+    assert render.calls == 2, "Fragment served for another key!"
+
+    await fragment_cache.cache.bump("user:1")
+    assert await run_in_threadpool(template.render, uid=1, render=render) == "<b>3</b>"
+
+    # The backend can't be reached outside worker threads.
+    assert template.render(uid=1, render=render) == "<b>4</b>"
+
+
+@pytest.mark.asyncio
+async def test_fragment_eviction(fragment_cache: FragmentCache):
+    fragment_cache.max_size = 8
+    await fragment_cache.set("a", "1234")
+    await fragment_cache.set("b", "1234")
+    # "a" is the oldest, but it is used more recently than "b".
+    await fragment_cache.get("a")
+    await fragment_cache.set("c", "1234")
+
+    assert await fragment_cache.get("b") is None, "Least recently used not evicted!"
+    assert await fragment_cache.get("a") == "1234"
+    assert await fragment_cache.get("c") == "1234"
+
+    await fragment_cache.set("d", "123456789")
+    assert await fragment_cache.get("d") is None, "Oversized fragment stored!"
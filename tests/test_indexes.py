@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from bnstats.models import Beatmap, LeaderboardEntry, Nomination, Reset
+
+SINCE = timezone.now() - timedelta(days=90)
+
+# Hot queries of scoring and ingestion, which must never scan a whole table.
+QUERIES = {
+    "mapper nominations": lambda: Nomination.filter(
+        creatorId__in=[1, 2], timestamp__gte=SINCE
+    ),
+    "later mapper nominations": lambda: Nomination.filter(
+        creatorId=1, timestamp__gt=SINCE
+    ),
+    "user activity": lambda: Nomination.filter(userId=1, timestamp__gte=SINCE).order_by(
+        "timestamp"
+    ),
+    "user mode activity": lambda: Nomination.filter(
+        userId=1, mode_mask__in=[1, 3], timestamp__gte=SINCE
+    ).order_by("timestamp"),
+    "nomination upsert": lambda: Nomination.filter(beatmapsetId=1, userId=1),
+    "mapset nominations": lambda: Nomination.filter(beatmapsetId__in=[1, 2]),
+    "dirty nominations": lambda: Nomination.filter(score_dirty=True),
+    "reset lookup": lambda: Reset.filter(beatmapsetId=1, userId=1, timestamp=SINCE),
+    "beatmap upsert": lambda: Beatmap.filter(beatmap_id=1),
+    "beatmapset": lambda: Beatmap.filter(beatmapset_id__in=[1, 2]),
+    "leaderboard": lambda: LeaderboardEntry.filter(
+        calculator="naxess", mode=""
+    ).order_by("-total_score"),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(QUERIES))
+async def test_query_uses_index(name: str):
+    plan = [row["detail"] for row in await QUERIES[name]().explain()]
+
+    assert any("USING" in step and "INDEX" in step for step in plan), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
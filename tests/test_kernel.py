@@ -0,0 +1,163 @@
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from bnstats.models import BeatmapSet, Nomination
+from bnstats.score import NaxessCalculator, RenCalculator
+from bnstats.score.context import NominationFeatures
+from bnstats.score.kernel import pack, pack_nominations, unique_counts, weighted_sum
+
+
+def _ren_mapset(beatmap: BeatmapSet) -> float:
+    drain_time = sum(diff.hit_length for diff in beatmap.beatmaps)
+    mapset_base = 300 + (120 * beatmap.total_diffs / 4) * (
+        math.log(beatmap.total_diffs / 4) + 0.601
+    )
+    bonus_drain = 0.0
+    for diff in beatmap.beatmaps:
+        bonus_drain += diff.hit_length * (diff.difficultyrating - 5.5) / 5.5
+    bonus_drain *= math.log(beatmap.total_diffs, 8)
+    return round((drain_time + bonus_drain) / mapset_base, 2)
+
+
+def _naxess_mapset(beatmap: BeatmapSet) -> float:
+    length_sorted = sorted(beatmap.beatmaps, key=lambda x: x.hit_length, reverse=True)
+    multiplier = 0.0
+    for i, b in enumerate(length_sorted):
+        multiplier += b.hit_length * math.pow(0.8, i)
+    multiplier /= 300
+    return math.log(1 + multiplier, 2)
+
+
+def _weighted_sum(values, weight: float) -> float:
+    total = 0
+    for i, v in enumerate(sorted(values, key=abs, reverse=True)):
+        total += v * (weight**i)
+    return total
+
+
+def _ren_nomination(features: NominationFeatures) -> float:
+    mapper_score = 0.8**features.own_mapper_count
+    mapper_score *= 0.95**features.other_mapper_count
+    penalty = 0
+    for total in features.reset_totals:
+        if total:
+            penalty += (2**total) / 8
+    ranked_score = (features.ranked + 1) / 2
+    score = round(mapper_score * _ren_mapset(features.beatmap), 2)
+    score *= ranked_score
+    return score - penalty
+
+
+def _naxess_nomination(features: NominationFeatures) -> float:
+    mapper_score = (0.4**features.own_mapper_count) * (
+        0.9**features.other_mapper_count
+    )
+    penalty = 0.0
+    for total in features.reset_totals:
+        if total:
+            penalty += 0.5 + ((total - 1) / 2 * total)
+    ranked_score = math.pow(features.ranked + 1, 2) / 4
+    score = round(mapper_score * _naxess_mapset(features.beatmap) * ranked_score, 2)
+    return score - penalty
+
+
+def _random_mapset(rng: random.Random) -> BeatmapSet:
+    diffs = [
+        SimpleNamespace(
+            hit_length=rng.randint(30, 400), difficultyrating=rng.uniform(1, 9)
+        )
+        for _ in range(rng.randint(1, 16))
+    ]
+    return BeatmapSet(diffs)  # type: ignore
+
+
+def _activity(name: str, scores, mappers):
+    return [
+        SimpleNamespace(score={name: {"total_score": s}}, creatorId=m)
+        for s, m in zip(scores, mappers)
+    ]
+
+
+def test_mapset_scores():
+    rng = random.Random(0)
+    mapsets = [_random_mapset(rng) for _ in range(500)]
+
+    assert RenCalculator().calculate_mapsets(mapsets) == [
+        _ren_mapset(m) for m in mapsets
+    ], "Ren mapset scores unmatch!"
+    assert NaxessCalculator().calculate_mapsets(mapsets) == [
+        _naxess_mapset(m) for m in mapsets
+    ], "Naxess mapset scores unmatch!"
+
+
+def test_nomination_scores():
+    rng = random.Random(0)
+    features = [
+        NominationFeatures(
+            beatmap=_random_mapset(rng),
+            ranked=rng.random() < 0.5,
+            own_mapper_count=rng.randint(0, 3),
+            other_mapper_count=rng.randint(0, 5),
+            reset_totals=[rng.randint(0, 4) for _ in range(rng.randint(0, 3))],
+        )
+        for _ in range(500)
+    ]
+    nominations = pack_nominations(features)
+
+    scores = RenCalculator().score_nominations(nominations)["total_score"]
+    assert scores.tolist() == [_ren_nomination(f) for f in features]
+    scores = NaxessCalculator().score_nominations(nominations)["total_score"]
+    assert scores.tolist() == [_naxess_nomination(f) for f in features]
+
+
+def test_activity_scores():
+    rng = random.Random(0)
+    activities = []
+    for _ in range(300):
+        count = rng.randint(0, 40)
+        # Rounded scores, so that ties are common.
+        scores = [round(rng.uniform(-1, 4), 1) for _ in range(count)]
+        mappers = [rng.choice([1, 2, 3, None]) for _ in range(count)]
+        activities.append((scores, mappers))
+
+    naxess = NaxessCalculator()
+    results = naxess.get_activity_scores(
+        [_activity("naxess", s, m) for s, m in activities]  # type: ignore
+    )
+    expected = [_weighted_sum(s, naxess.weight) for s, _ in activities]
+    assert [r.total_score for r in results] == expected, "Naxess scores unmatch!"
+
+    ren = RenCalculator()
+    results = ren.get_activity_scores(
+        [_activity("ren", s, m) for s, m in activities]  # type: ignore
+    )
+    for (scores, mappers), result in zip(activities, results):
+        uniqueness = len(set(mappers)) / len(scores) if scores else 0.0
+        if len(set(mappers)) > 1:
+            uniqueness *= math.log10(len(set(mappers)))
+        total = _weighted_sum(scores, ren.weight) * uniqueness
+        assert result.total_score == total, "Ren scores unmatch!"
+        assert result.attribs["uniqueness"] == uniqueness, "Uniqueness unmatch!"
+
+
+def test_empty_groups():
+    groups = pack([[], [1.0, 1.0, 2.0], []])
+    assert weighted_sum(groups, 0.5).tolist() == [0.0, 2.75, 0.0]
+    assert unique_counts(groups).tolist() == [0.0, 2.0, 0.0]
+    assert weighted_sum(pack([]), 0.5).tolist() == []
+
+
+@pytest.mark.asyncio
+async def test_fixture_mapsets():
+    noms = await Nomination.all()
+    mapsets = [await nom.get_map() for nom in noms]
+
+    assert RenCalculator().calculate_mapsets(mapsets) == [
+        _ren_mapset(m) for m in mapsets
+    ], "Ren mapset scores unmatch!"
+    assert NaxessCalculator().calculate_mapsets(mapsets) == [
+        _naxess_mapset(m) for m in mapsets
+    ], "Naxess mapset scores unmatch!"
@@ -1,9 +1,23 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from tortoise import timezone
 
 from bnstats.bnsite.enums import Difficulty, Genre, Language, MapStatus, Mode
-from bnstats.models import Beatmap, Nomination, Reset, User
+from bnstats.models import (
+    Beatmap,
+    BeatmapSet,
+    ChartBucket,
+    MapsetInfo,
+    MapsetSummary,
+    Nomination,
+    Reset,
+    User,
+)
+from bnstats.models.bulk import bulk_upsert
+from bnstats.routes.qat import reset_update
+from bnstats.routine.workers import _upsert_resets
 
 
 @pytest.mark.asyncio
@@ -48,3 +62,180 @@ async def test_reset():
     assert expected_user in (
         await event.user_affected.all()
     ), "User affected FK unexpected!"
+
+
+@pytest.mark.asyncio
+async def test_attach_maps():
+    noms = await Nomination.all()
+    await Nomination.attach_maps(noms)
+    for nom in noms:
+        expected = await Beatmap.filter(beatmapset_id=nom.beatmapsetId).order_by("id")
+        assert nom.map.beatmaps == expected, "Attached beatmapset unmatch!"
+        assert await nom.get_map() is nom.map, "Attached beatmapset is not reused!"
+
+
+@pytest.mark.asyncio
+async def test_nomination_counts():
+    u = await User.first()
+    counts = await User.get_nomination_counts((0, 90, 360, 30))
+
+    expected = [await u.total_nominations(c) for c in (0, 90, 360, 30)]
+    assert counts == {u.osuId: expected}, "Nomination counts unmatch!"
+    assert await User.get_nomination_counts(user_ids=[2]) == {}, "Unexpected user!"
+
+
+@pytest.mark.asyncio
+async def test_mapset_info():
+    now = timezone.now()
+    qualified = await MapsetInfo.create(
+        beatmapset_id=1,
+        approved=MapStatus.Qualified.value,
+        last_fetched=now - timedelta(hours=2),
+    )
+    ranked = await MapsetInfo.create(
+        beatmapset_id=2,
+        approved=MapStatus.Ranked.value,
+        last_fetched=now - timedelta(days=365),
+    )
+    pending = await MapsetInfo.create(
+        beatmapset_id=3,
+        approved=MapStatus.Pending.value,
+        last_fetched=now - timedelta(hours=2),
+    )
+
+    assert qualified.is_due(now), "Qualified map not refetched!"
+    assert not ranked.is_due(now), "Ranked map refetched!"
+    assert not pending.is_due(now), "Pending map refetched too early!"
+
+    due = await MapsetInfo.filter(MapsetInfo.due_filter(now))
+    assert [i.beatmapset_id for i in due] == [1], "Due filter unmatch!"
+
+
+@pytest.mark.parametrize(
+    "dialects", [{"sqlite"}, set()], ids=["on_conflict", "fallback"]
+)
+@pytest.mark.asyncio
+async def test_bulk_upsert(dialects):
+    existing = await Nomination.first()
+    changed = Nomination(
+        beatmapsetId=existing.beatmapsetId,
+        userId=existing.userId,
+        artistTitle="Changed",
+        timestamp=existing.timestamp,
+        as_modes=[3],
+    )
+    new = Nomination(
+        beatmapsetId=1,
+        userId=existing.userId,
+        artistTitle="New",
+        timestamp=timezone.now(),
+    )
+
+    with patch("bnstats.models.bulk.UPSERT_DIALECTS", dialects):
+        await bulk_upsert(
+            Nomination, [changed, new], ("beatmapsetId", "userId"), ("as_modes",)
+        )
+
+    updated = await Nomination.get(id=existing.id)
+    assert updated.as_modes == [3], "Existing row not updated!"
+    assert updated.artistTitle == existing.artistTitle, "Unlisted field updated!"
+    assert await Nomination.filter(beatmapsetId=1).count() == 1, "New row unmatch!"
+    assert await Nomination.all().count() == 4, "Duplicated rows!"
+
+
+@pytest.mark.asyncio
+async def test_reset_sources():
+    event = {
+        "type": "disqualify",
+        "timestamp": "2020-11-01T10:00:00.000Z",
+        "beatmapsetId": 1,
+        "userId": 11771,
+        "artistTitle": "Artist - Title",
+        "obviousness": 1,
+        "severity": 1,
+    }
+    # AIESS sends the reset first, then BN site lists it with its own ID.
+    await reset_update(dict(event))
+    bn_event = dict(event, _id="5f9ba8200f15a3cbce42282b", obviousness=2)
+    resets, changed = await _upsert_resets([bn_event])
+
+    assert await Reset.filter(beatmapsetId=1).count() == 1, "Duplicated reset!"
+    reset = await Reset.get(beatmapsetId=1)
+    assert reset.obviousness == 2, "Existing reset not updated!"
+    assert bn_event["id"] == reset.id
+    assert set(resets) == changed == {reset.id}
+
+
+@pytest.mark.asyncio
+async def test_nomination_modes():
+    u = await User.first()
+    noms = await Nomination.all().order_by("timestamp")
+    noms[0].as_modes = [Mode.Standard.value, Mode.Mania.value]
+    await noms[0].save()
+    noms[1].as_modes = []
+    await noms[1].save(update_fields=["as_modes"])
+    noms[2].as_modes = [Mode.Mania.value]
+    await noms[2].save(update_fields=["as_modes"])
+
+    assert [n.mode_mask for n in await Nomination.all().order_by("timestamp")] == [
+        0b1001,
+        0,
+        0b1000,
+    ], "Mode mask not synced!"
+
+    standard = await u.get_nomination_activity(mode=Mode.Standard)
+    assert [n.id for n in standard] == [noms[0].id], "Standard nominations unmatch!"
+    mania = await u.get_nomination_activity(mode="mania")
+    assert [n.id for n in mania] == [noms[0].id, noms[2].id], "Mania unmatch!"
+    assert not await u.get_nomination_activity(mode=Mode.Taiko), "Taiko unmatch!"
+
+
+@pytest.mark.asyncio
+async def test_mapset_summary():
+    noms = await Nomination.all()
+    await Nomination.attach_maps(noms)
+    await Nomination.attach_summaries(noms)
+
+    for nom in noms:
+        mapset, summary = nom.map, nom.summary
+        assert summary.total_diffs == mapset.total_diffs, "Diff count unmatch!"
+        assert summary.longest_length == mapset.longest_length, "Length unmatch!"
+        assert summary.difficulty == mapset.top_difficulty.difficulty
+        assert summary.genre == mapset.genre, "Genre unmatch!"
+        assert sum(summary.difficulty_counts.values()) == mapset.total_diffs
+        assert sum(m["diffs"] for m in summary.modes.values()) == mapset.total_diffs
+
+    assert await MapsetSummary.all().count() == len(noms), "Summaries not saved!"
+
+    # Summaries of deleted beatmapsets are removed.
+    await Beatmap.filter(beatmapset_id=noms[0].beatmapsetId).delete()
+    await MapsetSummary.refresh({noms[0].beatmapsetId: BeatmapSet([])})
+    await Nomination.attach_summaries(noms)
+    assert noms[0].summary is None, "Deleted beatmapset summarized!"
+
+
+@pytest.mark.asyncio
+async def test_chart_buckets():
+    u = await User.get(osuId=1)
+    noms = await u.get_nomination_activity()
+    await Nomination.attach_summaries(noms)
+    await ChartBucket.rebuild(u.osuId)
+
+    buckets = await ChartBucket.load(u.osuId)
+    assert sum(b.nominations for b in buckets) == len(noms), "Count unmatch!"
+    assert sum(map(sum, (b.lengths for b in buckets))) == len(noms)
+    genres = sum(b.genres.get(str(noms[0].summary.genre_id), 0) for b in buckets)
+    assert genres == sum(n.summary.genre_id == noms[0].summary.genre_id for n in noms)
+    assert [b.day for b in buckets] == sorted({b.day for b in buckets}), "Unsorted!"
+
+    # Buckets are rebuilt when a nominated beatmapset changes.
+    nom = noms[0]
+    day = nom.timestamp.date()
+    await MapsetSummary.filter(beatmapset_id=nom.beatmapsetId).update(
+        genre_id=Genre.Other.value
+    )
+    await ChartBucket.refresh([nom])
+
+    bucket = await ChartBucket.get(userId=u.osuId, day=day)
+    assert bucket.genres.get(str(Genre.Other.value)) == 1, "Bucket not rebuilt!"
+    assert len(await ChartBucket.load(u.osuId)) == len(buckets), "Buckets changed!"
@@ -0,0 +1,179 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from tortoise import timezone
+
+from bnstats.bnsite.enums import MapStatus
+from bnstats.models import Beatmap, MapsetInfo, Nomination, User
+from bnstats.routine import (
+    SCORE_DAYS,
+    IncrementalPipeline,
+    PopulatePipeline,
+    update_maps_db,
+    update_mapset_db,
+)
+from bnstats.score.invalidation import invalidate_nominations
+
+
+async def _return_mapset(nom, mapset):
+    return mapset
+
+
+@pytest.mark.asyncio
+async def test_pipeline():
+    users = await User.all()
+
+    with patch("bnstats.routine.pipeline.update_events_db") as events_mock, patch(
+        "bnstats.routine.pipeline.update_maps_db", side_effect=_return_mapset
+    ) as maps_mock, patch(
+        "bnstats.routine.pipeline.calculate_user_scores"
+    ) as calculate_mock:
+        await PopulatePipeline(999, osu_concurrency=2, queue_size=1).run(users)
+
+    assert events_mock.call_count == len(users), "Events not fetched for every user!"
+    assert calculate_mock.call_count == len(users), "Score not calculated!"
+
+    fetched = [call.args[0].beatmapsetId for call in maps_mock.call_args_list]
+    assert len(fetched) == 3, "Nominated maps not fetched!"
+    assert len(set(fetched)) == len(fetched), "Mapset fetched more than once!"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_error():
+    users = await User.all()
+
+    with patch("bnstats.routine.pipeline.update_events_db") as events_mock:
+        events_mock.side_effect = ValueError("BN site down")
+        with pytest.raises(ValueError):
+            await PopulatePipeline(999).run(users)
+
+
+@pytest.mark.asyncio
+async def test_incremental_pipeline():
+    u = await User.get(pk=1)
+    u.maps_checked_at = timezone.now()
+    await u.save()
+    nom = await Nomination.get(beatmapsetId=1208022)
+
+    async def _new_nomination(u, days):
+        await invalidate_nominations([nom])
+        return [nom], []
+
+    with patch("bnstats.routine.pipeline.update_events_db") as events_mock, patch(
+        "bnstats.routine.pipeline.update_maps_db", side_effect=_return_mapset
+    ) as maps_mock, patch(
+        "bnstats.score.invalidation.calculate_user_scores"
+    ) as calculate_mock:
+        # Nothing changed, nothing should be touched.
+        events_mock.return_value = ([], [])
+        await IncrementalPipeline(999).run([u])
+        assert not maps_mock.called, "Maps fetched without changes!"
+        assert not calculate_mock.called, "Score calculated without changes!"
+
+        # Only the new nomination should be recalculated.
+        events_mock.side_effect = _new_nomination
+        await IncrementalPipeline(999).run([u])
+
+    fetched = [call.args[0].beatmapsetId for call in maps_mock.call_args_list]
+    assert fetched == [nom.beatmapsetId], "Unchanged maps fetched!"
+
+    targets = calculate_mock.call_args.kwargs["nominations"]
+    assert nom.id in [n.id for n in targets], "New nomination not calculated!"
+    assert all(
+        n.creatorId == nom.creatorId and n.timestamp >= nom.timestamp for n in targets
+    ), "Unaffected nominations calculated!"
+    assert not await Nomination.filter(score_dirty=True).exists(), "Dirty left over!"
+
+    u = await User.get(pk=1)
+    assert u.last_event_at == nom.timestamp, "Watermark not updated!"
+
+
+@pytest.mark.asyncio
+async def test_incremental_no_nominations():
+    u = await User.create(
+        _id="second",
+        osuId=2,
+        username="SecondUser",
+        modesInfo=[],
+        isNat=False,
+        isBn=True,
+        modes=["osu"],
+    )
+
+    with patch("bnstats.routine.pipeline.update_events_db") as events_mock, patch(
+        "bnstats.routine.pipeline.update_user_details"
+    ) as details_mock:
+        events_mock.return_value = ([], [])
+        await IncrementalPipeline(SCORE_DAYS).run([u])
+
+    assert not details_mock.called, "User details updated without maps!"
+    u = await User.get(pk=2)
+    assert u.maps_checked_at, "User not saved!"
+
+
+@pytest.mark.asyncio
+async def test_incremental_window():
+    u = await User.get(pk=1)
+
+    with patch("bnstats.routine.pipeline.update_events_db") as events_mock, patch(
+        "bnstats.routine.pipeline.update_maps_db", side_effect=_return_mapset
+    ):
+        events_mock.return_value = ([], [])
+
+        # Never populated, the whole given window is fetched.
+        await IncrementalPipeline(SCORE_DAYS).run([u])
+        assert events_mock.call_args.args[1] == SCORE_DAYS
+
+        # Missed runs are caught up on, with a day of overlap.
+        u.last_event_at = timezone.now() - timedelta(days=10)
+        await IncrementalPipeline(1).run([u])
+        assert events_mock.call_args.args[1] == 12, "Missed events not fetched!"
+
+        # But never beyond the scoring window.
+        u.last_event_at = timezone.now() - timedelta(days=200)
+        await IncrementalPipeline(1).run([u])
+        assert events_mock.call_args.args[1] == SCORE_DAYS
+
+
+@pytest.mark.asyncio
+async def test_update_maps_freshness():
+    nom = await Nomination.get(beatmapsetId=1208022)
+
+    with patch("bnstats.routine.workers.cached_get") as get_mock:
+        # Ranked maps in database are never refetched.
+        await update_maps_db(nom)
+        assert not get_mock.called, "Ranked map refetched!"
+
+        # Recently fetched maps wait for their interval.
+        await MapsetInfo.create(
+            beatmapset_id=nom.beatmapsetId, approved=3, last_fetched=timezone.now()
+        )
+        await update_maps_db(nom)
+        assert not get_mock.called, "Fresh map refetched!"
+
+        # Missing maps are always fetched.
+        get_mock.return_value = []
+        nom.beatmapsetId = 1
+        await update_maps_db(nom)
+        assert get_mock.called, "Missing map not fetched!"
+
+    info = await MapsetInfo.get(beatmapset_id=1)
+    assert info.approved is None, "Missing map status unmatch!"
+
+
+@pytest.mark.asyncio
+async def test_update_mapset_upsert():
+    with open("tests/data/api/1209473.json") as f:
+        response = json.load(f)
+    await Beatmap.create(**{**response[0], "approved": 0})
+
+    with patch("bnstats.routine.workers.cached_get", return_value=response):
+        mapset = await update_mapset_db(1209473)
+
+    assert [b.beatmap_id for b in mapset.beatmaps] == [
+        int(b["beatmap_id"]) for b in response
+    ], "Beatmapset unmatch!"
+    assert mapset.status == MapStatus.Qualified, "Existing difficulty not updated!"
+    assert await Beatmap.filter(beatmapset_id=1209473).count() == len(response)
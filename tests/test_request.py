@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from bnstats.bnsite.request import HostPolicy, TokenBucket, UpstreamClient
+
+URL = "https://osu.ppy.sh/api/get_beatmaps?s=1"
+
+
+@pytest.fixture
+def upstream():
+    policies = {"osu.ppy.sh": HostPolicy(rate=1000, burst=10, max_connections=2)}
+    return UpstreamClient(policies, backoff_base=0)
+
+
+@pytest.mark.asyncio
+async def test_retry_rate_limited(upstream: UpstreamClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=URL, status_code=429)
+    httpx_mock.add_response(url=URL, status_code=503)
+    httpx_mock.add_response(url=URL, json=[])
+
+    r = await upstream.request("GET", URL)
+    assert r.json() == []
+
+    metrics = upstream.metrics["osu.ppy.sh"]
+    assert metrics.requests == 3
+    assert metrics.retries == 2
+    assert metrics.statuses == {429: 1, 503: 1, 200: 1}
+
+
+@pytest.mark.asyncio
+async def test_no_retry_client_error(upstream: UpstreamClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=URL, status_code=404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await upstream.request("GET", URL)
+    assert upstream.metrics["osu.ppy.sh"].requests == 1, "Client error retried!"
+
+
+@pytest.mark.asyncio
+async def test_retry_exhausted(upstream: UpstreamClient, httpx_mock: HTTPXMock):
+    for _ in range(3):
+        httpx_mock.add_response(url=URL, status_code=500)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await upstream.request("GET", URL, attempts=3)
+    assert upstream.metrics["osu.ppy.sh"].failures == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket():
+    bucket = TokenBucket(rate=100, capacity=2)
+
+    # Time is frozen in tests, so check the waits instead of measuring them.
+    with patch("asyncio.sleep") as sleep_mock:
+        for _ in range(2):
+            await bucket.acquire()
+        assert not sleep_mock.called, "Burst is rate limited!"
+
+        await bucket.acquire()
+        sleep_mock.assert_awaited_once_with(pytest.approx(0.01))
+
+
+@pytest.mark.asyncio
+async def test_retry_transport_error(httpx_mock: HTTPXMock):
+    policies = {"osu.ppy.sh": HostPolicy(rate=1000, burst=10, max_connections=2)}
+    upstream = UpstreamClient(policies, backoff_base=1)
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused."), url=URL)
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused."), url=URL)
+    httpx_mock.add_response(url=URL, json=[])
+
+    with patch("asyncio.sleep") as sleep_mock:
+        r = await upstream.request("GET", URL)
+    assert r.json() == []
+    assert upstream.metrics["osu.ppy.sh"].retries == 2
+
+    delays = [c.args[0] for c in sleep_mock.await_args_list]
+    assert len(delays) == 2, "Connection error retried without backoff!"
+    assert 0.5 <= delays[0] <= 1
+    assert 1 <= delays[1] <= 2
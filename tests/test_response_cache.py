@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from bnstats.bnsite import request
+from bnstats.bnsite.response_cache import ResponseCache
+
+URL = "https://osu.ppy.sh/api/get_beatmaps?s=1"
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    return ResponseCache(str(tmp_path / "responses.sqlite3"), max_size=10)
+
+
+@pytest.mark.asyncio
+async def test_response_cache(response_cache: ResponseCache):
+    assert await response_cache.get("a") is None
+
+    await response_cache.set("a", b"[]", None, etag='"abc"')
+    cached = await response_cache.get("a")
+    assert cached.body == b"[]"
+    assert not cached.expired, "Response without TTL expired!"
+    assert cached.validators == {"If-None-Match": '"abc"'}
+
+    await response_cache.set("b", b"[]", 0)
+    assert (await response_cache.get("b")).expired, "Response not expired!"
+    await response_cache.refresh("b", 60)
+    assert not (await response_cache.get("b")).expired, "Response not refreshed!"
+    await response_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_eviction(response_cache: ResponseCache):
+    with patch("bnstats.bnsite.response_cache.time") as time_mock:
+        for i, key in enumerate(("a", "b")):
+            time_mock.time.return_value = i
+            await response_cache.set(key, b"1234", None)
+
+        # "a" is the oldest, but it is used more recently than "b".
+        time_mock.time.return_value = 2
+        await response_cache.get("a")
+        time_mock.time.return_value = 3
+        await response_cache.set("c", b"1234", None)
+
+    assert await response_cache.get("b") is None, "Least recently used not evicted!"
+    assert await response_cache.get("a") is not None
+    assert await response_cache.get("c") is not None
+    await response_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_get(response_cache: ResponseCache, httpx_mock: HTTPXMock):
+    response_cache.max_size = 1024
+    httpx_mock.add_response(url=URL, json=[1], headers={"ETag": '"v1"'})
+    httpx_mock.add_response(
+        url=URL, status_code=304, match_headers={"If-None-Match": '"v1"'}
+    )
+
+    with patch.object(request, "response_cache", response_cache), patch.dict(
+        request.CACHE_TTLS, {"test": 60}
+    ):
+        assert await request.cached_get(URL, "test") == [1]
+        assert await request.cached_get(URL, "test") == [1]
+        assert len(httpx_mock.get_requests()) == 1, "Fresh response refetched!"
+
+        request.CACHE_TTLS["test"] = 0
+        await response_cache.refresh(URL, 0)
+        assert await request.cached_get(URL, "test") == [1]
+
+    assert len(httpx_mock.get_requests()) == 2, "Expired response not revalidated!"
+    await response_cache.close()
@@ -1,6 +1,10 @@
+import asyncio
+
 from bs4 import BeautifulSoup
 from starlette.testclient import TestClient
 
+from bnstats.cache import SCORES_ENTITY, cache, user_entity
+from bnstats.conditional import etag_matches
 from bnstats.score import NaxessCalculator
 
 
@@ -44,3 +48,76 @@ def test_user_score(client: TestClient):
 def test_user_score_404(client: TestClient):
     res = client.get("/score/2")
     assert res.status_code == 404
+
+
+def test_api_user(client: TestClient):
+    res = client.get("/api/v1/users/1?fields=osuId,username")
+    assert res.status_code == 200
+    assert set(res.json()) == {"osuId", "username"}
+
+    assert client.get("/api/v1/users/2").json()["status"] == 404
+    assert client.get("/api/v1/users/1?fields=password").status_code == 400
+
+
+def test_api_nomination_pages(client: TestClient):
+    res = client.get("/api/v1/users/1/nominations?limit=1&fields=id,timestamp")
+    assert res.status_code == 200
+
+    ids = []
+    while True:
+        page = res.json()
+        assert len(page["nominations"]) <= 1
+        ids += [nom["id"] for nom in page["nominations"]]
+        if not page["next"]:
+            break
+        res = client.get(f"/api/v1/users/1/nominations?limit=1&after={page['next']}")
+
+    export = client.get("/api/v1/nominations?user=1&fields=id").json()
+    assert ids == [nom["id"] for nom in export["nominations"]]
+    assert len(ids) == 3
+
+
+def test_api_user_score(client: TestClient):
+    res = client.get("/api/v1/users/1/score?calculator=naxess")
+    assert res.status_code == 200
+    assert len(res.json()["nominations"]) == 2
+
+    assert client.get("/api/v1/leaderboard?mode=std").status_code == 400
+
+
+def test_conditional_get(client: TestClient):
+    res = client.get("/api/v1/users/1")
+    etag = res.headers["ETag"]
+    assert res.status_code == 200
+
+    res = client.get("/api/v1/users/1", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+
+    res = client.get("/api/v1/users/1?fields=osuId", headers={"If-None-Match": etag})
+    assert res.status_code == 200, "Validator ignores the query!"
+
+    asyncio.get_event_loop().run_until_complete(cache.bump(user_entity(1)))
+    res = client.get("/api/v1/users/1", headers={"If-None-Match": etag})
+    assert res.status_code == 200, "Validator ignores data versions!"
+    assert res.headers["ETag"] != etag
+
+
+def test_export_etag(client: TestClient):
+    loop = asyncio.get_event_loop()
+    for url, entity in (
+        ("/api/v1/nominations", SCORES_ENTITY),
+        ("/api/v1/nominations?user=1", user_entity(1)),
+    ):
+        etag = client.get(url).headers["ETag"]
+        loop.run_until_complete(cache.bump(entity))
+        res = client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 200, "Validator ignores nomination scores!"
+
+
+def test_etag_matches():
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches("*", 'W/"a"')
+    assert not etag_matches('"ab"', 'W/"a"')
+    assert not etag_matches(None, 'W/"a"')
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from bnstats.scheduler import Scheduler
+
+
+@pytest.mark.asyncio
+async def test_scheduler_lock():
+    scheduler = Scheduler()
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = []
+
+    async def slow():
+        calls.append("slow")
+        started.set()
+        await release.wait()
+
+    async def other():
+        calls.append("other")
+
+    slow_job = scheduler.add_job("slow", slow, 60, lock="db")
+    other_job = scheduler.add_job("other", other, 60, lock="db")
+
+    running = asyncio.ensure_future(scheduler.run_job(slow_job))
+    await started.wait()
+    assert not await scheduler.run_job(slow_job), "Overlapping run not skipped!"
+    assert not await scheduler.run_job(other_job), "Shared lock not respected!"
+
+    release.set()
+    assert await running
+    assert await scheduler.run_job(other_job)
+    assert calls == ["slow", "other"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_backoff():
+    scheduler = Scheduler()
+
+    async def failing():
+        raise ValueError("BN site down")
+
+    job = scheduler.add_job("failing", failing, 3600, jitter=0, retry_delay=10)
+    assert job.next_delay() == 3600
+
+    delays = []
+    for _ in range(3):
+        assert not await scheduler.run_job(job)
+        delays.append(job.next_delay())
+    assert delays == [10, 20, 40], "Failures not backed off!"
+
+    for _ in range(10):
+        await scheduler.run_job(job)
+    assert job.next_delay() == 3600, "Backoff exceeds interval!"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_start_stop():
+    scheduler = Scheduler()
+    ran = asyncio.Event()
+
+    async def job():
+        ran.set()
+
+    scheduler.add_job("job", job, 3600, initial_delay=0)
+    await scheduler.start()
+    await asyncio.wait_for(ran.wait(), 1)
+    await scheduler.stop()
+    assert not scheduler._tasks
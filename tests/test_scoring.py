@@ -1,57 +1,179 @@
-import pytest
-
-from bnstats.models import Nomination, User
-from bnstats.score import NaxessCalculator, RenCalculator
-
-
-class FakeNomination:
-    def __init__(self, js):
-        self._js = js
-
-    def __getattr__(self, name: str) -> float:
-        return self._js[name]
-
-
-@pytest.fixture
-def naxess_calculator():
-    return NaxessCalculator()
-
-
-@pytest.fixture
-def ren_calculator():
-    return RenCalculator()
-
-
-@pytest.mark.asyncio
-async def test_user_naxess(naxess_calculator: NaxessCalculator):
-    u = await User.get(pk=1)
-    scores = await naxess_calculator.calculate_user(u)
-    activities = [FakeNomination(a) for a in scores]
-    score = naxess_calculator.get_activity_score(activities)
-    # Floating point
-    assert f"{score:.2f}" == "3.08", "Incorrect score calculation for user."
-
-
-@pytest.mark.asyncio
-async def test_beatmap_naxess(naxess_calculator: NaxessCalculator):
-    m = await Nomination.get(beatmapsetId=1052074)
-    beatmap = await m.get_map()
-    score = naxess_calculator.calculate_mapset(beatmap)
-    assert score == 1.7332097022818713, "Incorrect score calculation for beatmap."
-
-
-@pytest.mark.asyncio
-async def test_user(ren_calculator: RenCalculator):
-    u = await User.get(pk=1)
-    scores = await ren_calculator.calculate_user(u)
-    activities = [FakeNomination(a) for a in scores]
-    score = ren_calculator.get_activity_score(activities)
-    assert score == 3.53, "Incorrect score calculation for user."
-
-
-@pytest.mark.asyncio
-async def test_beatmap(ren_calculator: RenCalculator):
-    m = await Nomination.get(beatmapsetId=1052074)
-    beatmap = await m.get_map()
-    score = ren_calculator.calculate_mapset(beatmap)
-    assert score == 2.09, "Incorrect score calculation for beatmap."
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from bnstats.cache import SCORES_ENTITY, cache, user_entity
+from bnstats.models import LeaderboardEntry, Nomination, User
+from bnstats.score import NaxessCalculator, RenCalculator, calculate_user_scores
+from bnstats.score.invalidation import (
+    invalidate_mapsets,
+    invalidate_nominations,
+    recalculate_dirty,
+)
+
+
+# Scores of the sample user's nominations in the last 90 days, as calculated
+# before scoring was batched.
+EXPECTED_SCORES = {
+    "naxess": [
+        dict(mapset_score=1.1059670885158166, total_score=1.11),
+        dict(mapset_score=2.192997321292092, total_score=2.19),
+    ],
+    "ren": [
+        dict(mapset_score=1.03, total_score=1.03),
+        dict(mapset_score=2.68, total_score=2.68),
+    ],
+}
+
+
+class FakeNomination:
+    def __init__(self, js):
+        self._js = js
+
+    def __getattr__(self, name: str) -> float:
+        return self._js[name]
+
+
+@pytest.fixture
+def naxess_calculator():
+    return NaxessCalculator()
+
+
+@pytest.fixture
+def ren_calculator():
+    return RenCalculator()
+
+
+@pytest.mark.asyncio
+async def test_user_naxess(naxess_calculator: NaxessCalculator):
+    u = await User.get(pk=1)
+    scores = await naxess_calculator.calculate_user(u)
+    activities = [FakeNomination(a) for a in scores]
+    score = naxess_calculator.get_activity_score(activities)
+    # Floating point
+    assert f"{score:.2f}" == "3.08", "Incorrect score calculation for user."
+
+
+@pytest.mark.asyncio
+async def test_beatmap_naxess(naxess_calculator: NaxessCalculator):
+    m = await Nomination.get(beatmapsetId=1052074)
+    beatmap = await m.get_map()
+    score = naxess_calculator.calculate_mapset(beatmap)
+    assert score == 1.7332097022818713, "Incorrect score calculation for beatmap."
+
+
+@pytest.mark.asyncio
+async def test_user(ren_calculator: RenCalculator):
+    u = await User.get(pk=1)
+    scores = await ren_calculator.calculate_user(u)
+    activities = [FakeNomination(a) for a in scores]
+    score = ren_calculator.get_activity_score(activities)
+    assert score == 3.53, "Incorrect score calculation for user."
+
+
+@pytest.mark.asyncio
+async def test_beatmap(ren_calculator: RenCalculator):
+    m = await Nomination.get(beatmapsetId=1052074)
+    beatmap = await m.get_map()
+    score = ren_calculator.calculate_mapset(beatmap)
+    assert score == 2.09, "Incorrect score calculation for beatmap."
+
+
+@pytest.mark.asyncio
+async def test_batch_calculation(
+    naxess_calculator: NaxessCalculator, ren_calculator: RenCalculator
+):
+    u = await User.get(pk=1)
+    d = timezone.now() - timedelta(90)
+    for calculator in (naxess_calculator, ren_calculator):
+        scores = await calculator.calculate_user(u, save_to_db=False)
+
+        expected = []
+        for nom in await u.get_nomination_activity(d):
+            nomination_score = await calculator.calculate_nomination(nom)
+            if nomination_score:
+                expected.append(nomination_score)
+        assert scores == expected, "Batch calculation differs from single nomination."
+
+        assert len(scores) == len(EXPECTED_SCORES[calculator.name])
+        for score, fixed in zip(scores, EXPECTED_SCORES[calculator.name]):
+            assert score == pytest.approx(
+                dict(ranked_score=1.0, mapper_score=1.0, penalty=0.0, **fixed)
+            ), "Incorrect score calculation for nomination."
+
+
+@pytest.mark.asyncio
+async def test_save_scores(
+    naxess_calculator: NaxessCalculator, ren_calculator: RenCalculator
+):
+    u = await User.get(pk=1)
+    await calculate_user_scores(u)
+
+    d = timezone.now() - timedelta(90)
+    for calculator in (naxess_calculator, ren_calculator):
+        expected = await calculator.calculate_user(u, save_to_db=False)
+        noms = await u.get_nomination_activity(d)
+        saved = [nom.score[calculator.name] for nom in noms]
+
+        assert len(saved) == len(expected), "Unmatched saved nominations."
+        for score, saved_score in zip(expected, saved):
+            assert saved_score == dict(calculator_name=calculator.name, **score)
+
+
+@pytest.mark.asyncio
+async def test_save_scores_bump(naxess_calculator: NaxessCalculator):
+    u = await User.get(pk=1)
+    entities = [SCORES_ENTITY, user_entity(u.osuId)]
+    versions = await cache.get_versions(entities)
+
+    await naxess_calculator.calculate_user(u)
+    new_versions = await cache.get_versions(entities)
+    assert all(
+        new > old for new, old in zip(new_versions, versions)
+    ), "Saved scores not bumped!"
+
+
+@pytest.mark.asyncio
+async def test_invalidation():
+    nom = await Nomination.get(beatmapsetId=1052074)
+    await invalidate_nominations([nom])
+
+    dirty = await Nomination.filter(score_dirty=True).all()
+    assert nom.id in [n.id for n in dirty], "Changed nomination not marked."
+    for n in dirty:
+        if n.id != nom.id:
+            assert n.creatorId == nom.creatorId, "Unrelated mapper marked."
+            assert n.timestamp > nom.timestamp, "Earlier nomination marked."
+
+    await invalidate_mapsets([nom.beatmapsetId])
+    same_map = await Nomination.filter(beatmapsetId=nom.beatmapsetId).all()
+    assert all(n.score_dirty for n in same_map), "Nominations of mapset not marked."
+
+    users = await recalculate_dirty()
+    assert nom.userId in [u.osuId for u in users], "Nominator not recalculated."
+    assert not await Nomination.filter(score_dirty=True).exists(), "Dirty left over."
+
+
+@pytest.mark.asyncio
+async def test_leaderboard(
+    naxess_calculator: NaxessCalculator, ren_calculator: RenCalculator
+):
+    u = await User.get(pk=1)
+    await calculate_user_scores(u)
+
+    for calculator in (naxess_calculator, ren_calculator):
+        entries = await LeaderboardEntry.filter(
+            user_id=u.osuId, calculator=calculator.name
+        ).all()
+        assert sorted(e.mode for e in entries) == sorted([""] + u.modes)
+
+        for entry in entries:
+            expected = await u.get_score(calculator, mode=entry.mode or None)
+            assert entry.score.total_score == pytest.approx(expected.total_score)
+
+    # Refreshing replaces the entries instead of adding new ones.
+    await calculate_user_scores(u)
+    assert await LeaderboardEntry.filter(user_id=u.osuId).count() == 2 * (
+        1 + len(u.modes)
+    )
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from bnstats.singleflight import SingleFlight, single_flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"id": 1}
+
+    results = await asyncio.gather(*[flights.do("a", fetch) for _ in range(3)])
+    assert len(calls) == 1, "Concurrent calls not coalesced!"
+    assert all(r is results[0] for r in results)
+    assert "a" not in flights, "Finished call remembered!"
+
+    await flights.do("a", fetch)
+    assert len(calls) == 2, "Sequential calls coalesced!"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_error():
+    calls = []
+
+    @single_flight(lambda key: key)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        raise ValueError(key)
+
+    results = await asyncio.gather(
+        fetch("a"), fetch("a"), fetch("b"), return_exceptions=True
+    )
+    assert calls == ["a", "b"]
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancel():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return 1
+
+    first = asyncio.ensure_future(flights.do("a", fetch))
+    second = asyncio.ensure_future(flights.do("a", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+    assert await second == 1, "Shared call cancelled with a caller!"
@@ -0,0 +1,41 @@
+import pytest
+
+from bnstats.helper import mode_to_db
+from bnstats.models import LeaderboardEntry, User
+from bnstats.score import NaxessCalculator, RenCalculator, calculate_user_scores
+from bnstats.score.whatif import Dataset, evaluate, evaluate_many
+
+
+@pytest.mark.asyncio
+async def test_evaluate():
+    u = await User.get(pk=1)
+    await calculate_user_scores(u)
+    dataset = await Dataset.load()
+
+    for calculator in (NaxessCalculator(), RenCalculator()):
+        for mode in [""] + u.modes:
+            entry = await LeaderboardEntry.get(
+                user_id=u.osuId, calculator=calculator.name, mode=mode
+            )
+            mode_value = mode_to_db(mode) if mode else None
+            leaderboard = evaluate(dataset, calculator, mode_value)
+            assert leaderboard == [(u.osuId, entry.total_score)], "Leaderboard unmatch!"
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many(time_freeze):
+    dataset = await Dataset.load()
+    calculators = [RenCalculator(), RenCalculator(weight=0.5, BASE_SCORE=2)]
+
+    # Worker processes wait for results with real time.
+    time_freeze.stop()
+    try:
+        leaderboards = evaluate_many(dataset, calculators, processes=2)
+    finally:
+        time_freeze.start()
+    assert leaderboards == evaluate_many(dataset, calculators, processes=1)
+    assert leaderboards[0] != leaderboards[1], "Parameters not applied!"
+    assert not evaluate(dataset, calculators[0], mode=mode_to_db("mania"))
+
+    with pytest.raises(ValueError):
+        RenCalculator(length_decay=0.5)
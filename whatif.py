@@ -0,0 +1,80 @@
+import sys
+import logging
+from tortoise import Tortoise, run_async
+from starlette.config import Config
+
+from bnstats.helper import mode_to_db
+from bnstats.models import User
+from bnstats.score import get_system
+from bnstats.score.whatif import Dataset, evaluate_many
+
+config = Config(".env")
+DB_URL = config("DB_URL")
+
+bnstats_logger = logging.getLogger("bnstats")
+bnstats_logger.setLevel(logging.INFO)
+bnstats_logger.addHandler(logging.StreamHandler(sys.stdout))
+
+
+def parse_parameters(text: str):
+    params = {}
+    for pair in filter(None, text.split(",")):
+        key, value = pair.split("=")
+        params[key.strip()] = float(value)
+    return params
+
+
+async def run(system: str, parameter_sets, days: int, mode, top: int, processes):
+    await Tortoise.init(db_url=DB_URL, modules={"models": ["bnstats.models"]})
+
+    calc_class = get_system(system)
+    if not calc_class:
+        raise ValueError(f"Unknown calculator: {system}")
+    calculators = [calc_class(**parse_parameters(p)) for p in parameter_sets]
+
+    dataset = await Dataset.load(days)
+    usernames = dict(await User.all().values_list("osuId", "username"))
+
+    mode_value = mode_to_db(mode) if mode else None
+    leaderboards = evaluate_many(dataset, calculators, mode_value, processes)
+    for calculator, leaderboard in zip(calculators, leaderboards):
+        print(f">>> {calculator.name}: {calculator.get_parameters()}")
+        for i, (user_id, score) in enumerate(leaderboard[:top]):
+            print(f"{i + 1:>3}. {usernames.get(user_id, user_id):<20} {score:.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare leaderboards of calculator parameters, without saving."
+    )
+    parser.add_argument("system", help="Calculator system's name.")
+    parser.add_argument(
+        "parameters",
+        nargs="*",
+        default=[""],
+        help="Parameter sets to evaluate, e.g. weight=0.9,BASE_SCORE=2.",
+    )
+    parser.add_argument(
+        "-d", "--days", type=int, default=90, help="Number of days to account."
+    )
+    parser.add_argument("-m", "--mode", help="Game mode to account, e.g. osu.")
+    parser.add_argument(
+        "-t", "--top", type=int, default=20, help="Number of users to show."
+    )
+    parser.add_argument(
+        "-p", "--processes", type=int, help="Number of worker processes."
+    )
+
+    args = parser.parse_args()
+    run_async(
+        run(
+            args.system,
+            args.parameters or [""],
+            args.days,
+            args.mode,
+            args.top,
+            args.processes,
+        )
+    )